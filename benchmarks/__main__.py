@@ -0,0 +1,122 @@
+from typing import List
+
+import typer
+from rich.console import Console
+from rich.table import Table
+from typing_extensions import Annotated
+
+from benchmarks.scenarios import SCENARIOS
+from benchmarks.suite import STARTUP, compare as compare_runs, get_mismatches, load_history, run_benchmarks, save_run
+
+app = typer.Typer()
+console = Console()
+
+__DEFAULT_HISTORY = "benchmarks/history.json"
+
+__H_SCENARIO = f"Scenario to measure, all of them by default: {', '.join(list(SCENARIOS) + [STARTUP])}"
+__H_SCALE = "Multiply the number of the frames, blocks and loop items of the scenarios"
+__H_REPEAT = "Number of times each scenario is measured, the best timing is kept"
+__H_HISTORY = "JSON file the results are appended to"
+__H_BASELINE = "Index of the run in the history to compare against, negative from the end"
+__H_CURRENT = "Index of the run in the history to compare, negative from the end"
+__H_THRESHOLD = "Relative increase (e.g. 0.1 for 10%) of a metric reported as a regression"
+__H_FORCE = "Compare the runs even if they were measured with another scale, Python, moviepy or on another machine"
+
+
+def format_value(metric, value):
+    if value is None:
+        return "[yellow]missing[/yellow]"
+    if metric == "peak_rss":
+        return f"{value / (1024 * 1024):.0f} MB"
+    if metric == "per_frame":
+        return f"{value * 1000:.2f} ms"
+
+    return f"{value:.3f} s"
+
+
+@app.command()
+def run(scenario: Annotated[List[str], typer.Option(help=__H_SCENARIO)] = None,
+        scale: Annotated[float, typer.Option(help=__H_SCALE)] = 1,
+        repeat: Annotated[int, typer.Option(help=__H_REPEAT)] = 1,
+        history: Annotated[str, typer.Option(help=__H_HISTORY)] = __DEFAULT_HISTORY):
+    """ Measure the benchmark scenarios and append the results to the history. """
+    results = run_benchmarks(scenario, scale, repeat)
+    run = save_run(history, results, scale)
+
+    table = Table("Scenario", "Templating", "Construction", "Frames", "Per frame", "Peak RSS",
+                  title=f"Run {run['timestamp']} ({run['commit']})")
+
+    for name, result in results.items():
+        if "error" in result:
+            table.add_row(name, f"[red]{result['error']}[/red]", "", "", "", "")
+            continue
+
+        if name == STARTUP:
+            continue
+
+        table.add_row(name, format_value("templating", result["templating"]),
+                      format_value("construction", result["construction"]), str(result["frames"]),
+                      format_value("per_frame", result["per_frame"]), format_value("peak_rss", result["peak_rss"]))
+
+    console.print(table)
+
+    if "startup" in results.get(STARTUP, {}):
+        console.print(f"Startup of the CLI: {format_value(STARTUP, results[STARTUP]['startup'])}")
+
+    if any("error" in result for result in results.values()):
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def compare(baseline: Annotated[int, typer.Option(help=__H_BASELINE)] = -2,
+            current: Annotated[int, typer.Option(help=__H_CURRENT)] = -1,
+            threshold: Annotated[float, typer.Option(help=__H_THRESHOLD)] = 0.1,
+            history: Annotated[str, typer.Option(help=__H_HISTORY)] = __DEFAULT_HISTORY,
+            force: Annotated[bool, typer.Option(help=__H_FORCE)] = False):
+    """ Compare two runs of the history, fails if any metric regressed over the threshold or if the runs were measured
+    in a different environment (unless forced).
+    """
+    runs = load_history(history)
+
+    if len(runs) < 2:
+        console.print(f"At least two runs are needed in [bold cyan]{history}[/bold cyan], found {len(runs)}")
+        raise typer.Exit(code=1)
+
+    baseline_run, current_run = runs[baseline], runs[current]
+    mismatches = get_mismatches(baseline_run, current_run)
+
+    color = "yellow" if force else "red"
+
+    for key, (before, after) in mismatches.items():
+        console.print(f"[{color}]Runs differ in [bold]{key}[/bold]: {before} -> {after}[/{color}]")
+
+    if mismatches and not force:
+        console.print("Timings measured in a different environment are not comparable, use --force to compare anyway")
+        raise typer.Exit(code=1)
+
+    rows = compare_runs(baseline_run, current_run, threshold, force)
+
+    table = Table("Scenario", "Metric", "Baseline", "Current", "Change",
+                  title=f"{baseline_run['commit']} ({baseline_run['timestamp']}) -> "
+                        f"{current_run['commit']} ({current_run['timestamp']})" +
+                        (" [yellow](different environment)[/yellow]" if mismatches else ""))
+
+    for row in rows:
+        if row["change"] is None:
+            table.add_row(row["scenario"], row["metric"], format_value(row["metric"], row["baseline"]),
+                          format_value(row["metric"], row["current"]), "")
+            continue
+
+        color = "red" if row["regression"] else "green" if row["change"] < -threshold else "white"
+
+        table.add_row(row["scenario"], row["metric"], format_value(row["metric"], row["baseline"]),
+                      format_value(row["metric"], row["current"]), f"[{color}]{row['change']:+.1%}[/{color}]")
+
+    console.print(table)
+
+    if any(row["regression"] for row in rows):
+        raise typer.Exit(code=1)
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,171 @@
+import os
+import subprocess
+
+WIDTH = 640
+HEIGHT = 360
+FPS = 24
+
+IMAGE_COUNT = 8
+VIDEO_DURATION = 10
+AUDIO_DURATION = 10
+
+
+def create_assets(directory):
+    """ Generate the images, the video and the audio used by the synthetic scenarios.
+
+    :return: Dictionary with the paths of the assets, `images` is a list of paths.
+    """
+    import numpy as np
+    from moviepy.config import get_setting
+    from PIL import Image
+
+    images = []
+    random = np.random.default_rng(0)
+
+    for index in range(IMAGE_COUNT):
+        path = os.path.join(directory, f"image_{index}.jpg")
+        # Noise does not compress, the decoder does the same work as with a photo
+        Image.fromarray(random.integers(0, 255, (720, 1280, 3), dtype=np.uint8)).save(path, quality=90)
+        images.append(path)
+
+    video = os.path.join(directory, "video.mp4")
+    audio = os.path.join(directory, "audio.wav")
+
+    subprocess.run([get_setting("FFMPEG_BINARY"), "-y", "-loglevel", "error", "-f", "lavfi",
+                    "-i", f"testsrc=size=1280x720:rate={FPS}:duration={VIDEO_DURATION}", "-f", "lavfi",
+                    "-i", f"sine=duration={VIDEO_DURATION}", "-pix_fmt", "yuv420p", "-shortest", video], check=True)
+    subprocess.run([get_setting("FFMPEG_BINARY"), "-y", "-loglevel", "error", "-f", "lavfi",
+                    "-i", f"sine=frequency=440:duration={AUDIO_DURATION}", audio], check=True)
+
+    return {"images": images, "video": video, "audio": audio}
+
+
+def get_count(count, scale):
+    return max(1, int(count * scale))
+
+
+def create_scenario(frames, **kwargs):
+    return {"output_path": "videopy.mp4", "width": WIDTH, "height": HEIGHT, "fps": FPS, "frames": frames, **kwargs}
+
+
+def create_image_frame(path, duration, blocks=None, effects=None):
+    return {
+        "type": "plugins.core.frames.image",
+        "time": {"duration": duration},
+        "configuration": {"file_path": path},
+        "effects": [{"type": "plugins.core.effects.frames.resize", "configuration": {"mode": "center_crop"}}] +
+                   (effects or []),
+        "blocks": blocks or [],
+    }
+
+
+def create_text_block(content, start, duration, position, effects):
+    return {
+        "type": "plugins.core.blocks.text",
+        "position": position,
+        "time": {"start": start, "duration": duration},
+        "configuration": {"content": content, "size": 20},
+        "effects": effects,
+    }
+
+
+def many_image_frames(assets, scale=1):
+    """ Slideshow of short image frames, measures the decoding, the resizing and the concatenation. """
+    images = assets["images"]
+    frames = [create_image_frame(images[index % len(images)], 0.5,
+                                 effects=[{"type": "plugins.core.effects.frames.fadein", "time": {"duration": 0.2}}])
+              for index in range(get_count(40, scale))]
+
+    return create_scenario(frames)
+
+
+def many_text_blocks(assets, scale=1):
+    """ Frames covered with a grid of text blocks, measures the rasterization and the compositing of the layers. """
+    count = get_count(30, scale)
+    columns = 5
+    frames = []
+
+    for frame_index in range(2):
+        blocks = [create_text_block(f"Block {frame_index}.{index}", 0, 3,
+                                    [(index % columns) * WIDTH // columns, (index // columns) * 30 % HEIGHT], [
+                                        {"type": "plugins.core.effects.blocks.text.write", "time": {"duration": 3}},
+                                        {"type": "plugins.core.effects.blocks.text.fadein", "time": {"duration": 0.5}},
+                                    ]) for index in range(count)]
+
+        frames.append(create_image_frame(assets["images"][frame_index], 3, blocks))
+
+    return create_scenario(frames)
+
+
+def long_typewrite(assets, scale=1):
+    """ Long text typed character by character, every output frame shows a different part of it. """
+    words = " ".join(f"word{index}" for index in range(get_count(100, scale)))
+    content = "\n".join(words[index:index + 60] for index in range(0, len(words), 60))
+    block = create_text_block(content, 0, 6, ["center", "center"], [
+        {"type": "plugins.core.effects.blocks.text.typewrite", "time": {"duration": 6}},
+    ])
+
+    return create_scenario([create_image_frame(assets["images"][0], 6, [block])])
+
+
+def large_loops(assets, scale=1):
+    """ Frames and blocks multiplied by the loops, measures the templating (loop, math and the placeholders). """
+    block = {
+        "type": "plugins.core.blocks.text",
+        "position": ["{horizontal}", "{vertical}"],
+        "time": {"start": "{math_start}", "duration": 0.1},
+        "configuration": {"content": "{title} {content}", "size": 20},
+        "loop": [{"content": f"item {index}", "horizontal": ["left", "center", "right"][index % 3],
+                  "vertical": ["top", "center", "bottom"][index // 3 % 3]} for index in range(10)],
+        "math": {"calculate": "loop_index * 0.1", "name": "start"},
+        "effects": [{"type": "plugins.core.effects.blocks.text.write", "time": {"duration": 0.1}}],
+    }
+    frame = create_image_frame("{image}", 1, [block])
+    frame["loop"] = [{"image": assets["images"][index % len(assets["images"])], "title": f"Frame {index}"}
+                     for index in range(get_count(20, scale))]
+
+    return create_scenario([frame])
+
+
+def video_with_resize(assets, scale=1):
+    """ Video frames scaled down to the scenario, measures the decoding of the video and the audio. """
+    frames = [{
+        "type": "plugins.core.frames.video",
+        "time": {"duration": 2},
+        "configuration": {"file_path": assets["video"], "subclip_start": index * 2 % (VIDEO_DURATION - 2)},
+        "effects": [{"type": "plugins.core.effects.frames.resize", "configuration": {"mode": "center_crop"}}],
+        "blocks": [],
+    } for index in range(get_count(3, scale))]
+
+    return create_scenario(frames)
+
+
+def audio_heavy(assets, scale=1):
+    """ Every frame plays the audio twice, measures the audio readers and the mixing of the audio clips. """
+    frames = []
+
+    for index in range(get_count(10, scale)):
+        frame = create_image_frame(assets["images"][index % len(assets["images"])], 1, [{
+            "type": "plugins.core.blocks.audio",
+            "time": {"duration": 1},
+            "configuration": {"file_path": assets["audio"]},
+            "effects": [{"type": "plugins.core.effects.blocks.audio.play", "time": {"duration": 1},
+                         "configuration": {"subclip_start": index % (AUDIO_DURATION - 1)}}],
+        }], [{
+            "type": "plugins.core.effects.frames.audio",
+            "time": {"duration": 1},
+            "configuration": {"file_path": assets["audio"]},
+        }])
+        frames.append(frame)
+
+    return create_scenario(frames)
+
+
+SCENARIOS = {
+    "many_image_frames": many_image_frames,
+    "many_text_blocks": many_text_blocks,
+    "long_typewrite": long_typewrite,
+    "large_loops": large_loops,
+    "video_with_resize": video_with_resize,
+    "audio_heavy": audio_heavy,
+}
@@ -0,0 +1,267 @@
+import datetime
+import importlib.metadata
+import json
+import multiprocessing
+import os
+import platform
+import queue as queues
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.scenarios import SCENARIOS
+
+# Metrics compared between the runs, the lower the better
+METRICS = ["templating", "construction", "per_frame", "peak_rss", "startup"]
+
+# Name of the result with the startup time of the CLI, measured besides the scenarios
+STARTUP = "startup"
+
+# Lists the modules, the command every user runs first, it must not wait for the media packages to be imported
+STARTUP_CODE = """
+from typer.testing import CliRunner
+import video
+
+runner = CliRunner()
+for command in [["frames"], ["blocks"], ["effects"], ["scenarios"]]:
+    result = runner.invoke(video.app, command)
+    assert result.exit_code == 0, result.output
+"""
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Parameters of the run the metrics depend on, runs are comparable only when all of them are the same
+ENVIRONMENT = ["scale", "machine", "python", "moviepy"]
+
+# How often a running measurement is checked for its process exiting without a result (e.g. killed by the OOM killer)
+POLL_INTERVAL = 1
+
+# Differences smaller than these are noise, e.g. a millisecond of a templating taking a few milliseconds
+NOISE_FLOORS = {
+    "templating": 0.005,
+    "construction": 0.005,
+    "per_frame": 0.0005,
+    "peak_rss": 10 * 1024 * 1024,
+    "startup": 0.05,
+}
+
+
+def measure(name, assets, directory, scale=1):
+    """ Render the scenario and measure its phases, called in a fresh process so the peak RSS is its own. """
+    import resource
+
+    from videopy.hooks import Hooks
+    from videopy.main import create_registry, load_scenario_yml, prepare_scenario_yml
+    from videopy.renderer import Renderer
+    from videopy.utils.logger import Logger
+
+    Logger.enabled = False
+
+    hooks = Hooks()
+    registry = create_registry(hooks)
+    scenario_yml = SCENARIOS[name](assets, scale)
+    scenario_yml["output_path"] = os.path.join(directory, f"{name}.mp4")
+
+    start = time.perf_counter()
+    scenario_yml = load_scenario_yml(registry, None, None, scenario_yml)
+    prepare_scenario_yml(registry, scenario_yml, hooks)
+    templated = time.perf_counter()
+    scenario = Renderer(scenario_yml, registry, hooks).build()
+    built = time.perf_counter()
+    scenario.render()
+    rendered = time.perf_counter()
+
+    frames = round(sum(frame.time.duration for frame in scenario.frames) * scenario.fps)
+
+    return {
+        "templating": templated - start,
+        "construction": built - templated,
+        "render": rendered - built,
+        "frames": frames,
+        "per_frame": (rendered - built) / max(frames, 1),
+        # Linux reports the maximum resident set size in kilobytes
+        "peak_rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,
+    }
+
+
+def measure_in_process(name, assets, directory, scale, queue):
+    try:
+        queue.put(measure(name, assets, directory, scale))
+    except Exception as e:
+        queue.put({"error": f"{type(e).__name__}: {e}"})
+
+
+def measure_startup(repeat=1):
+    """ Measure the time the listing commands of the CLI take in a new interpreter, the best of the repeated timings is
+    kept.
+    """
+    timings = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        process = subprocess.run([sys.executable, "-c", STARTUP_CODE], cwd=ROOT_DIR, capture_output=True, text=True)
+        timings.append(time.perf_counter() - start)
+
+        if process.returncode != 0:
+            return {"error": process.stderr.strip().splitlines()[-1] if process.stderr.strip() else "Startup failed"}
+
+    return {"startup": min(timings)}
+
+
+def run_benchmarks(names=None, scale=1, repeat=1):
+    """ Measure the scenarios, each one in a new process, the best of the repeated timings is kept. The startup of
+    the CLI is measured too, unless only some of the scenarios are measured.
+
+    :return: Dictionary of the results by the name of the scenario.
+    """
+    names = names or list(SCENARIOS) + [STARTUP]
+    context = multiprocessing.get_context("spawn")
+    results = {}
+
+    if STARTUP in names:
+        results[STARTUP] = measure_startup(repeat)
+        names = [name for name in names if name != STARTUP]
+
+    with tempfile.TemporaryDirectory() as directory:
+        from benchmarks.scenarios import create_assets
+
+        assets = create_assets(directory)
+
+        for name in names:
+            runs = []
+
+            for _ in range(repeat):
+                queue = context.Queue()
+                process = context.Process(target=measure_in_process, args=(name, assets, directory, scale, queue))
+                process.start()
+                result = wait_for_result(process, queue)
+                process.join()
+
+                runs.append(result)
+
+                if "error" in result:
+                    break
+
+            results[name] = runs[-1] if "error" in runs[-1] else {
+                key: min(run[key] for run in runs) if key != "peak_rss" else max(run[key] for run in runs)
+                for key in runs[0]
+            }
+
+    return results
+
+
+def wait_for_result(process, queue):
+    """ Wait for the result of the measurement, an error is returned if the process exits without sending any. """
+    while True:
+        try:
+            return queue.get(timeout=POLL_INTERVAL)
+        except queues.Empty:
+            if not process.is_alive():
+                # The result may have been sent right before the process exited
+                try:
+                    return queue.get(timeout=POLL_INTERVAL)
+                except queues.Empty:
+                    return {"error": f"Process exited with code {process.exitcode} without a result"}
+
+
+def get_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def get_moviepy_version():
+    try:
+        return importlib.metadata.version("moviepy")
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+
+def load_history(path):
+    if not os.path.isfile(path):
+        return []
+
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_run(path, results, scale=1):
+    """ Append the results to the history, the run is stored with the commit and the environment it was measured in
+    (see ENVIRONMENT).
+    """
+    history = load_history(path)
+    run = {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "commit": get_commit(),
+        "machine": platform.node(),
+        "python": platform.python_version(),
+        "moviepy": get_moviepy_version(),
+        "scale": scale,
+        "results": results,
+    }
+
+    history.append(run)
+
+    with open(path, "w") as f:
+        json.dump(history, f, indent=2)
+
+    return run
+
+
+def get_mismatches(baseline, current):
+    """ Find the parameters of the environment (see ENVIRONMENT) which differ between the runs.
+
+    :return: Dictionary of the differing parameters with a tuple of the baseline and the current value.
+    """
+    return {key: (baseline.get(key), current.get(key)) for key in ENVIRONMENT if baseline.get(key) != current.get(key)}
+
+
+def compare(baseline, current, threshold=0.1, force=False):
+    """ Compare the metrics of two runs of the history.
+
+    :param threshold: Relative increase of the metric reported as a regression, e.g. 0.1 for 10%.
+    :param force: Compare the runs even if they were measured in a different environment (e.g. with another scale).
+    :return: List of dictionaries with the scenario, the metric, both values (None if the run has not measured the
+             metric), the change and the regression flag.
+    """
+    mismatches = get_mismatches(baseline, current)
+
+    if mismatches and not force:
+        raise ValueError("Runs were measured in a different environment: " +
+                         ", ".join(f"{key} {before} != {after}" for key, (before, after) in mismatches.items()))
+
+    rows = []
+
+    for name, result in current["results"].items():
+        baseline_result = baseline["results"].get(name)
+
+        if baseline_result is None or "error" in baseline_result or "error" in result:
+            continue
+
+        for metric in METRICS:
+            before, after = baseline_result.get(metric), result.get(metric)
+
+            if before is None and after is None:
+                # Metric is not measured for this result (e.g. the startup of the scenarios)
+                continue
+
+            if before is None or after is None:
+                rows.append({"scenario": name, "metric": metric, "baseline": before, "current": after, "change": None,
+                             "regression": False})
+                continue
+
+            change = (after - before) / before if before else 0
+
+            rows.append({
+                "scenario": name,
+                "metric": metric,
+                "baseline": before,
+                "current": after,
+                "change": change,
+                "regression": change > threshold and after - before > NOISE_FLOORS[metric],
+            })
+
+    return rows
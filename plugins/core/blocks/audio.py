@@ -5,6 +5,8 @@ from videopy.utils.time import Time
 
 
 class Block(AbstractBlock):
+    animated = False
+    audible = True
 
     def __init__(self, time, configuration, frame):
         super().__init__(time, [0, 0], frame)
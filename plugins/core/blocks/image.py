@@ -5,6 +5,7 @@ from videopy.utils.time import Time
 
 
 class Block(AbstractBlock):
+    animated = False
 
     def get_type(self):
         return "image"
@@ -28,7 +29,7 @@ class BlockFactory(AbstractBlockFactory):
 
         return Block(
             Time(time.get('start', 0), time['duration']),
-            block_yml['position'],
+            frame.scenario.scaled(block_yml['position']),
             block_yml['configuration'],
             frame
         )
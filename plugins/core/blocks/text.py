@@ -1,13 +1,13 @@
-from moviepy.editor import TextClip
-
 from videopy.block import AbstractBlock, AbstractBlockFactory
 from videopy.compilation import Compilation
 from videopy.module import AbstractModuleDefinition
+from videopy.utils.text import render_text
 from videopy.utils.time import Time
 from videopy.utils.utils import transform_position
 
 
 class Block(AbstractBlock):
+    animated = False
 
     def get_type(self):
         return "text"
@@ -20,14 +20,17 @@ class Block(AbstractBlock):
     def __str__(self):
         return f"Block(time={self.time}, position={self.position}, configuration={self.configuration})"
 
-    def get_text_size(self):
-        clip = TextClip(
-            txt=self.configuration['content'],
+    def get_text(self):
+        """This method will return the rasterized text, the same text is rendered only once for all effects."""
+        return render_text(
+            content=self.configuration['content'],
             font=self.configuration['font'],
-            fontsize=self.configuration['size']
+            size=self.configuration['size'],
+            color=self.configuration['color']
         )
 
-        return clip.size
+    def get_text_size(self):
+        return self.get_text().size
 
     def get_text_position(self):
         """This method will calculate the text position based on the block position and padding."""
@@ -49,8 +52,15 @@ class BlockFactory(AbstractBlockFactory):
     def from_yml(self, block_yml, module_yml, frame):
         time = block_yml.get('time', {})
 
+        configuration = dict(block_yml['configuration'])
+
+        # Sizes are given in pixels of the scenario, the preview renders it smaller
+        for key in ['size', 'margin', 'padding']:
+            if key in configuration:
+                configuration[key] = frame.scenario.scaled(configuration[key])
+
         return Block(Time(time.get('start', 0), time['duration']),
-                     block_yml['position'], block_yml['configuration'], frame)
+                     frame.scenario.scaled(block_yml['position']), configuration, frame)
 
 
 class TextBlockModuleDefinition(AbstractModuleDefinition):
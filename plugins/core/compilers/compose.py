@@ -1,7 +1,6 @@
 from types import NoneType
 
 from videopy.compilation import Compilation, AbstractCompiler
-from moviepy.editor import CompositeVideoClip
 
 
 class ComposeCompiler(AbstractCompiler):
@@ -14,6 +13,8 @@ class ComposeCompiler(AbstractCompiler):
         :param compilation: Compilation object
         :return: CompositeVideoClip
         """
+        from moviepy.editor import CompositeVideoClip
+
         size = compilation.configuration.get('size', None)
 
         if not isinstance(compilation.source, list) and not isinstance(compilation.target, NoneType):
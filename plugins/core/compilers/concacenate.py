@@ -1,5 +1,4 @@
 from videopy.compilation import AbstractCompiler
-from moviepy.editor import concatenate_videoclips
 
 
 class ConcatenateCompiler(AbstractCompiler):
@@ -10,4 +9,6 @@ class ConcatenateCompiler(AbstractCompiler):
         :param compilation: Compilation object
         :return: CompositeVideoClip
         """
+        from moviepy.editor import concatenate_videoclips
+
         return concatenate_videoclips([compilation.source, compilation.target])
@@ -1,5 +1,3 @@
-from moviepy.editor import AudioFileClip
-
 from videopy.compilation import Compilation
 from videopy.effect import AbstractEffectFactory, AbstractBlockEffect
 from videopy.module import AbstractModuleDefinition
@@ -7,6 +5,8 @@ from videopy.utils.time import Time
 
 
 class Effect(AbstractBlockEffect):
+    animated = False
+    audible = True
 
     def __init__(self, time, configuration):
         super().__init__("play", time)
@@ -16,12 +16,13 @@ class Effect(AbstractBlockEffect):
     def render_on_block(self, clip):
         if self.block.get_type() != "audio":
             raise Exception(f"Effect [play] can only be applied to audio blocks, not [{self.block.get_type()}]")
-        if self.block.get_audio() is None:
-            self.block.set_audio(AudioFileClip(self.block.configuration["file_path"]))
-
         audio = None
         subclip_start = self.configuration.get('subclip_start', None)
 
+        if self.block.get_audio() is None:
+            self.block.set_audio(self.block.frame.scenario.open_audio(self.block.configuration["file_path"],
+                                                                      offset=subclip_start or 0))
+
         if subclip_start is None or subclip_start == 0:
             audio = self.block.get_audio().set_start(self.time.start).set_duration(self.time.duration)
         elif subclip_start is not None and subclip_start > 0:
@@ -1,14 +1,12 @@
-from moviepy.editor import ImageClip
-
 from videopy.compilation import Compilation
 from videopy.effect import AbstractEffectFactory, AbstractBlockEffect
 from videopy.module import AbstractModuleDefinition
+from videopy.utils.image import load_image
 from videopy.utils.time import Time
 
-from PIL import Image
-
 
 class Effect(AbstractBlockEffect):
+    animated = False
 
     def __init__(self, time):
         super().__init__("display", time)
@@ -21,16 +19,14 @@ class Effect(AbstractBlockEffect):
         height = self.block.configuration['height']
 
         if width == -1 or height == -1:
-            with Image.open(self.block.configuration['file_path']) as img:
-                width = img.width if width == -1 else width
-                height = img.height if height == -1 else height
+            original = load_image(self.block.configuration['file_path'])
+            width = original.size[0] if width == -1 else width
+            height = original.size[1] if height == -1 else height
 
-        image = ImageClip(
-            self.block.configuration['file_path'],
-            duration=self.time.duration,
-        )
+        scenario = self.block.frame.scenario
+        width, height = scenario.scaled(width), scenario.scaled(height)
 
-        image = image.resize(width=width, height=height)
+        image = load_image(self.block.configuration['file_path'], (width, height)).to_clip(self.time.duration)
         image = image.set_position(self.block.position)
         image = image.set_duration(self.time.duration if self.time.duration > 0 else self.block.time.duration)
 
@@ -6,6 +6,7 @@ from videopy.utils.time import Time
 
 
 class Effect(AbstractBlockEffect):
+    animated = False
 
     def __init__(self, time, configuration):
         super().__init__("background", time)
@@ -1,8 +1,9 @@
-from moviepy.editor import TextClip, CompositeVideoClip
+from moviepy.editor import VideoClip
 
 from videopy.compilation import Compilation
 from videopy.effect import AbstractEffectFactory, AbstractBlockEffect
 from videopy.module import AbstractModuleDefinition
+from videopy.utils.text import render_text
 from videopy.utils.time import Time
 
 
@@ -30,22 +31,37 @@ class Effect(AbstractBlockEffect):
             raise ValueError("Duration is too short to display all text")
 
         position = self.block.get_text_position()
+        start = self.block.time.start + self.time.start
 
-        clips = []
-        for i in range(1, len(content) + 1):
-            txt_clip = TextClip(content[:i], font=font, fontsize=size, color=color, bg_color='transparent')
-            start = self.block.time.start + self.time.start + (i - 1) * duration_per_char
+        clip = typewrite_clip(render_text(content, font, size, color), duration_per_char) \
+            .set_duration(self.time.duration - start) \
+            .set_start(start) \
+            .set_position((position[0], position[1]))
 
-            txt_clip = txt_clip \
-                .set_duration(self.time.duration - start) \
-                .set_start(start) \
-                .set_position((position[0], position[1]))
+        return Compilation(source=clip, mode="use_source")
 
-            clips.append(txt_clip)
 
-        composite_clip = CompositeVideoClip(clips, size=self.block.frame.scenario.size)
+def typewrite_clip(text, duration_per_char):
+    """ Create a clip revealing the rasterized text character by character.
 
-        return Compilation(source=composite_clip, mode="use_source")
+    The text is rasterized only once, every frame shows the same image with a mask hiding the characters that were
+    not typed yet. The mask changes only when the next character appears, so the last one is reused.
+
+    :param text: RenderedText to reveal.
+    :param duration_per_char: Time in seconds after which the next character appears.
+    """
+    last_mask = {"count": None, "mask": None}
+
+    def make_mask_frame(t):
+        # The epsilon protects from the float errors at the exact moment the next character appears
+        count = int(t / duration_per_char + 1e-9) + 1
+
+        if count != last_mask["count"]:
+            last_mask["count"], last_mask["mask"] = count, text.get_reveal_mask(count)
+
+        return last_mask["mask"]
+
+    return VideoClip(lambda t: text.rgb).set_mask(VideoClip(make_mask_frame, ismask=True))
 
 
 class EffectFactory(AbstractEffectFactory):
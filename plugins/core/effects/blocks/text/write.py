@@ -1,5 +1,3 @@
-from moviepy.editor import TextClip
-
 from videopy.compilation import Compilation
 from videopy.effect import AbstractEffectFactory, AbstractBlockEffect
 from videopy.module import AbstractModuleDefinition
@@ -7,6 +5,7 @@ from videopy.utils.time import Time
 
 
 class Effect(AbstractBlockEffect):
+    animated = False
 
     def __init__(self, time):
         super().__init__("write", time)
@@ -15,12 +14,7 @@ class Effect(AbstractBlockEffect):
         if self.block.get_type() != "text":
             raise ValueError(f"Effect [{self.type}] can only be used with a block of type [text]")
 
-        clip = TextClip(
-            txt=self.block.configuration['content'],
-            font=self.block.configuration['font'],
-            fontsize=self.block.configuration['size'],
-            color=self.block.configuration['color']
-        )
+        clip = self.block.get_text().to_clip()
 
         position = self.block.get_text_position()
 
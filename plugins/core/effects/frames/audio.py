@@ -1,5 +1,3 @@
-from moviepy.editor import AudioFileClip
-
 from videopy.compilation import Compilation
 from videopy.effect import AbstractEffectFactory, AbstractFrameEffect
 from videopy.module import AbstractModuleDefinition
@@ -7,6 +5,8 @@ from videopy.utils.time import Time
 
 
 class Effect(AbstractFrameEffect):
+    animated = False
+    audible = True
 
     def __init__(self, time, configuration):
         super().__init__("audio", time)
@@ -14,8 +14,8 @@ class Effect(AbstractFrameEffect):
         self.configuration = configuration
 
     def render_on_frame(self, clip):
-        audio_clip = (AudioFileClip(self.configuration["file_path"]))
         subclip_start = self.configuration.get('subclip_start', None)
+        audio_clip = self.frame.scenario.open_audio(self.configuration["file_path"], offset=subclip_start or 0)
 
         if subclip_start is not None:
             audio_clip = audio_clip.subclip(subclip_start, self.time.duration)
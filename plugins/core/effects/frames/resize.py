@@ -1,10 +1,20 @@
 from videopy.compilation import Compilation
 from videopy.effect import AbstractFrameEffect, AbstractEffectFactory
 from videopy.module import AbstractModuleDefinition
+from videopy.utils.image import RESIZE_CENTER_CROP, RESIZE_STRETCH, resize_array
 from videopy.utils.time import Time
 
 
+# Core resizers the frames can apply while decoding the source, before the resize effect is rendered
+DECODE_MODES = {
+    'fit': RESIZE_STRETCH,
+    'default': RESIZE_STRETCH,
+    'center_crop': RESIZE_CENTER_CROP,
+}
+
+
 class Effect(AbstractFrameEffect):
+    animated = False
 
     def __init__(self, time, configuration):
         super().__init__("resize", time)
@@ -52,31 +62,42 @@ class EffectFactory(AbstractEffectFactory):
         return Effect(Time(0, 0), configuration)
 
 
-def fit(effect, clip):
-    width, height = effect.frame.scenario.size
+def find_decode_size(frame):
+    """ Find the size the frame clip is resized to by the resize effect of the frame.
 
-    return clip.resize(newsize=[width, height])  # Shrink to fit
+    :return: Tuple of the size and the resize mode or None if the frame is not resized by any of the core resizers.
+    """
+    for effect in frame.effects:
+        if isinstance(effect, Effect) and effect.configuration.get('mode') in DECODE_MODES:
+            return tuple(frame.scenario.size), DECODE_MODES[effect.configuration['mode']]
 
+    return None
 
-def center_crop(effect, clip):
-    width, height = effect.frame.scenario.size
 
-    # Resize while maintaining aspect ratio, then crop to fill the size
-    aspect_ratio_clip = clip.w / clip.h
-    aspect_ratio_video = width / height
+def fit(effect, clip):
+    return resize_clip(clip, effect.frame.scenario.size)  # Shrink to fit
 
-    if aspect_ratio_clip > aspect_ratio_video:
-        # Clip is wider than the target aspect ratio, resize by height
-        clip = clip.resize(height=height)
-    else:
-        # Clip is taller than the target aspect ratio, resize by width
-        clip = clip.resize(width=width)
 
-    return clip.crop(x_center=clip.w / 2, y_center=clip.h / 2, width=width, height=height)
+def center_crop(effect, clip):
+    # Resize while maintaining aspect ratio, then crop to fill the size
+    return resize_clip(clip, effect.frame.scenario.size, RESIZE_CENTER_CROP)
 
 
 def default(effect, clip):
-    return clip.resize(effect.frame.scenario.size)
+    return resize_clip(clip, effect.frame.scenario.size)
+
+
+def resize_clip(clip, size, mode=RESIZE_STRETCH):
+    """ Resize (and crop) the clip and its mask in a single Pillow pass.
+
+    Static clips (ImageClip) are resized only once, moviepy applies the image filter of an ImageClip to its image up
+    front, other clips are resized frame by frame. Clips already in the size (e.g. the image and the video frames
+    decoded in the size of the scenario) are returned as they are.
+    """
+    if tuple(clip.size) == tuple(size):
+        return clip
+
+    return clip.fl_image(lambda frame: resize_array(frame, size, mode), apply_to=["mask"])
 
 
 class FrameResizeEffectModuleDefinition(AbstractModuleDefinition):
@@ -1,11 +1,12 @@
-from moviepy.editor import ImageClip
-
+from plugins.core.effects.frames.resize import find_decode_size
 from videopy.frame import AbstractFrame, AbstractFrameFactory
 from videopy.module import AbstractModuleDefinition
+from videopy.utils.image import load_image
 from videopy.utils.time import Time
 
 
 class Frame(AbstractFrame):
+    animated = False
 
     def __init__(self, time, configuration, scenario):
         super().__init__(time, scenario)
@@ -16,7 +17,14 @@ class Frame(AbstractFrame):
         return 'image'
 
     def render(self, relative_start_time):
-        return ImageClip(self.configuration['file_path'], duration=self.time.duration)
+        decode_size = find_decode_size(self)
+
+        if decode_size is not None:
+            # The resized image is cached, frames showing the same file in the same size share it
+            return load_image(self.configuration['file_path'], decode_size[0], decode_size[1]).to_clip(
+                self.time.duration)
+
+        return load_image(self.configuration['file_path']).to_clip(self.time.duration)
 
 
 class FrameFactory(AbstractFrameFactory):
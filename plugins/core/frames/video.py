@@ -1,7 +1,7 @@
+from plugins.core.effects.frames.resize import find_decode_size
 from videopy.frame import AbstractFrame, AbstractFrameFactory
 from videopy.module import AbstractModuleDefinition
 from videopy.utils.time import Time
-from moviepy.editor import VideoFileClip
 
 
 class Frame(AbstractFrame):
@@ -13,15 +13,20 @@ class Frame(AbstractFrame):
         self.mute = configuration.get("mute", False)
         self.subclip_start = configuration.get("subclip_start", 0)
         self.cut_to_frame_duration = configuration.get("cut_to_frame_duration", True)
+        self.audible = not self.mute
 
     def get_type(self):
         return "video"
 
     def render(self, relative_start_time):
-        clip = VideoFileClip(
-            filename=self.file_path,
-            audio=(not self.mute),
-        )
+        decode_size = find_decode_size(self)
+
+        if decode_size is not None:
+            # Frames are scaled by ffmpeg while decoding, the resize effect gets them already in the scenario size
+            clip = self.scenario.open_video(self.file_path, audio=(not self.mute), size=decode_size[0],
+                                            mode=decode_size[1], offset=self.subclip_start)
+        else:
+            clip = self.scenario.open_video(self.file_path, audio=(not self.mute), offset=self.subclip_start)
 
         if self.subclip_start:
             clip = clip.subclip(self.subclip_start, self.subclip_start + self.time.duration)
@@ -0,0 +1,33 @@
+import functools
+import threading
+
+import simpleeval
+
+# Evaluators are reused (creating one copies all operators and functions), but not shared between threads
+_evaluators = threading.local()
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_expression(expression):
+    """ Parse the expression once, the node tree is reused for every evaluation of the same expression. """
+    return simpleeval.SimpleEval.parse(expression)
+
+
+def evaluate_expression(expression, names):
+    """ Evaluate the expression the same way simpleeval.simple_eval does, using the cached node tree.
+
+    :param expression: The expression to evaluate.
+    :param names: Names available in the expression.
+    :return: The result of the expression.
+    """
+    evaluator = getattr(_evaluators, "evaluator", None)
+
+    if evaluator is None:
+        evaluator = _evaluators.evaluator = simpleeval.SimpleEval()
+
+    evaluator.names = names
+
+    try:
+        return evaluator.eval(expression, previously_parsed=parse_expression(expression))
+    finally:
+        evaluator.names = None
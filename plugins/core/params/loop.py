@@ -1,29 +1,36 @@
 import copy
 
-from videopy.param import AbstractParamHandler
+from videopy.param import AbstractParamHandler, find_index
 
 
 class LoopParamHandler(AbstractParamHandler):
+    # Objects with these keys are written to by the templating (vars inheritance, param handlers, the renderer)
+    __DYNAMIC_KEYS = frozenset(["type", "vars", "loop"])
+    __DEEP_COPY = object()
 
     def __init__(self):
         super().__init__("loop", ["frame", "block", "effect"])
 
-    def handle(self, parent_obj, current_obj, param_data):
+    def handle(self, parent_obj, current_obj, param_data, index=None):
         loop_items = param_data
 
         if isinstance(parent_obj, list):
-            index = parent_obj.index(current_obj)
-            del parent_obj[index]
+            index = find_index(parent_obj, current_obj, index)
+            plan = self.get_copy_plan(current_obj)
 
-            for i, loop in enumerate(loop_items):
-                new_obj = self.create_new_obj(current_obj, loop, i, total_elements=len(loop_items))
-                parent_obj.insert(index + i, new_obj)
+            parent_obj[index:index + 1] = [
+                self.create_new_obj(current_obj, loop, i, total_elements=len(loop_items), plan=plan)
+                for i, loop in enumerate(loop_items)
+            ]
 
-    def create_new_obj(self, current_obj, loop, index, total_elements):
+    def create_new_obj(self, current_obj, loop, index, total_elements, plan=None):
         """
         Create a new object based on the current object and loop variables.
         """
-        new_obj = copy.deepcopy(current_obj)
+        if plan is None:
+            plan = self.get_copy_plan(current_obj)
+
+        new_obj = self.copy_with_plan(current_obj, plan)
         new_obj["vars"] = self.update_vars(new_obj)
 
         del new_obj[self.name]
@@ -47,3 +54,51 @@ class LoopParamHandler(AbstractParamHandler):
         """
         for key, value in loop.items():
             obj["vars"][key] = value
+
+    def get_copy_plan(self, obj, force=False):
+        """
+        Find the parts of the object that templating will write to, so only these are copied for each loop item.
+
+        Copied are: objects with dynamic keys (frames, blocks, effects), vars, containers of strings with placeholders
+        and every container of a copied object. Static subtrees (like configuration without placeholders) are shared
+        between the copies.
+
+        :return: None if the object can be shared, otherwise a dict with plans of the children (keys or indexes)
+                 that have to be copied as well.
+        """
+        if isinstance(obj, dict):
+            children = [(key, value, self.get_copy_plan(value, key == "vars")) for key, value in obj.items()]
+            plan = {key: child_plan for key, _, child_plan in children if child_plan is not None}
+
+            if plan or force or not self.__DYNAMIC_KEYS.isdisjoint(obj) or self.__has_placeholder(obj.values()):
+                return plan
+        elif isinstance(obj, list):
+            plan = {index: child_plan for index, child_plan in enumerate(map(self.get_copy_plan, obj))
+                    if child_plan is not None}
+
+            if plan or force or self.__has_placeholder(obj):
+                return plan
+        elif not (obj is None or isinstance(obj, (str, int, float, bool))):
+            return self.__DEEP_COPY
+
+        return None
+
+    def copy_with_plan(self, obj, plan):
+        """
+        Copy the object following the plan created by get_copy_plan.
+        """
+        if plan is None:
+            return obj
+        if plan is self.__DEEP_COPY:
+            return copy.deepcopy(obj)
+
+        copied_obj = obj.copy()
+        for key, child_plan in plan.items():
+            copied_obj[key] = self.copy_with_plan(obj[key], child_plan)
+
+        return copied_obj
+
+    @staticmethod
+    def __has_placeholder(values):
+        # Strings are immutable, but the placeholders are resolved in place in their container
+        return any(isinstance(value, str) and "{" in value for value in values)
@@ -1,5 +1,4 @@
-import simpleeval
-
+from plugins.core.params.expression import evaluate_expression
 from videopy.param import AbstractParamHandler
 
 
@@ -11,7 +10,7 @@ class MathParamHandler(AbstractParamHandler):
     def __init__(self):
         super().__init__("math", ["frame", "block", "effect", "scenario"])
 
-    def handle(self, parent_context, container_context, param_context):
+    def handle(self, parent_context, container_context, param_context, index=None):
         if isinstance(param_context, list):
             for obj in param_context:
                 self.handle(container_context, container_context, obj)
@@ -19,5 +18,5 @@ class MathParamHandler(AbstractParamHandler):
             container_context["vars"] = container_context.get("vars", {})
             result_name = f"math_{param_context['name']}"
 
-            container_context["vars"][result_name] = simpleeval.simple_eval(param_context["calculate"],
-                                                                            names=container_context.get("vars", {}))
+            container_context["vars"][result_name] = evaluate_expression(param_context["calculate"],
+                                                                         names=container_context.get("vars", {}))
@@ -1,6 +1,5 @@
-import simpleeval
-
-from videopy.param import AbstractParamHandler
+from plugins.core.params.expression import evaluate_expression
+from videopy.param import AbstractParamHandler, find_index
 
 
 class WhenParamHandler(AbstractParamHandler):
@@ -8,12 +7,11 @@ class WhenParamHandler(AbstractParamHandler):
     def __init__(self):
         super().__init__("when", ["frame", "block", "effect"])
 
-    def handle(self, parent_context, container_context, param_context):
+    def handle(self, parent_context, container_context, param_context, index=None):
         condition = param_context
 
         if condition is not None:
-            result = simpleeval.simple_eval(param_context, names=container_context.get("vars", {}))
+            result = evaluate_expression(param_context, names=container_context.get("vars", {}))
 
             if result is False:
-                index = parent_context.index(container_context)
-                del parent_context[index]
+                del parent_context[find_index(parent_context, container_context, index)]
@@ -1,35 +1,16 @@
-from plugins.core.blocks.audio import AudioBlockModuleDefinition
-from plugins.core.blocks.image import ImageBlockModuleDefinition
-from plugins.core.blocks.text import TextBlockModuleDefinition
-from plugins.core.compilers.compose import ComposeCompiler
-from plugins.core.compilers.concacenate import ConcatenateCompiler
-from plugins.core.compilers.ignore import IgnoreCompiler
-from plugins.core.compilers.use_source import UseSourceCompiler
-from plugins.core.compilers.use_target import UseTargetCompiler
-from plugins.core.effects.blocks.audio.play import AudioPlayEffectModuleDefinition
-from plugins.core.effects.blocks.image.display import ImageDisplayEffectModuleDefinition
-from plugins.core.effects.blocks.text.background import TextBackgroundEffectModuleDefinition
-from plugins.core.effects.blocks.text.fadein import TextFadeInEffectModuleDefinition
-from plugins.core.effects.blocks.text.fadeout import TextFadeOutEffectModuleDefinition
-from plugins.core.effects.blocks.text.slidein import TextSlideInEffectModuleDefinition
-from plugins.core.effects.blocks.text.slideout import TextSlideOutEffectModuleDefinition
-from plugins.core.effects.blocks.text.typewrite import TextTypewriteEffectModuleDefinition
-from plugins.core.effects.blocks.text.write import TextWriteEffectModuleDefinition
-from plugins.core.effects.frames.audio import FrameAudioEffectModuleDefinition
-from plugins.core.effects.frames.fadein import FrameFadeInEffectModuleDefinition
-from plugins.core.effects.frames.fadeout import FrameFadeOutEffectModuleDefinition
-from plugins.core.effects.frames.resize import FrameResizeEffectModuleDefinition
-from plugins.core.frames.image import ImageFrameModuleDefinition
-from plugins.core.frames.video import VideoFrameModuleDefinition
+import os
+
 from plugins.core.loaders.yaml import yaml_file_loader
 from plugins.core.params.loop import LoopParamHandler
 from plugins.core.params.math import MathParamHandler
 from plugins.core.params.when import WhenParamHandler
 from plugins.core.templates.load_effects_template import load_effects_template
+from videopy.manifest import HOOK_MANIFEST_BUILD, MANIFEST_FILE_NAME, load_definitions, write_manifest
 from videopy.template import HOOK_TEMPLATE_PARAM_PRE_HANDLER_REGISTER, HOOK_TEMPLATE_PARAM_POST_HANDLER_REGISTER
 
 __PLUGIN_PREFIX = "plugins.core"
 __PLUGIN_PREFIX_INDEX = __PLUGIN_PREFIX.replace(".", "")
+__MANIFEST_PATH = os.path.join(os.path.dirname(__file__), MANIFEST_FILE_NAME)
 
 
 def register_scenarios(scenarios):
@@ -38,18 +19,36 @@ def register_scenarios(scenarios):
     }
 
 
-def register_frames(frames):
+def get_modules():
+    """ Import all module definitions of the plugin, used to build the manifest. """
+    from plugins.core.blocks.audio import AudioBlockModuleDefinition
+    from plugins.core.blocks.image import ImageBlockModuleDefinition
+    from plugins.core.blocks.text import TextBlockModuleDefinition
+    from plugins.core.effects.blocks.audio.play import AudioPlayEffectModuleDefinition
+    from plugins.core.effects.blocks.image.display import ImageDisplayEffectModuleDefinition
+    from plugins.core.effects.blocks.text.background import TextBackgroundEffectModuleDefinition
+    from plugins.core.effects.blocks.text.fadein import TextFadeInEffectModuleDefinition
+    from plugins.core.effects.blocks.text.fadeout import TextFadeOutEffectModuleDefinition
+    from plugins.core.effects.blocks.text.slidein import TextSlideInEffectModuleDefinition
+    from plugins.core.effects.blocks.text.slideout import TextSlideOutEffectModuleDefinition
+    from plugins.core.effects.blocks.text.typewrite import TextTypewriteEffectModuleDefinition
+    from plugins.core.effects.blocks.text.write import TextWriteEffectModuleDefinition
+    from plugins.core.effects.frames.audio import FrameAudioEffectModuleDefinition
+    from plugins.core.effects.frames.fadein import FrameFadeInEffectModuleDefinition
+    from plugins.core.effects.frames.fadeout import FrameFadeOutEffectModuleDefinition
+    from plugins.core.effects.frames.resize import FrameResizeEffectModuleDefinition
+    from plugins.core.frames.image import ImageFrameModuleDefinition
+    from plugins.core.frames.video import VideoFrameModuleDefinition
+
+    frames, blocks, effects = {}, {}, {}
+
     frames[f"{__PLUGIN_PREFIX}.frames.image"] = ImageFrameModuleDefinition()
     frames[f"{__PLUGIN_PREFIX}.frames.video"] = VideoFrameModuleDefinition()
 
-
-def register_blocks(blocks):
     blocks[f"{__PLUGIN_PREFIX}.blocks.text"] = TextBlockModuleDefinition()
     blocks[f"{__PLUGIN_PREFIX}.blocks.image"] = ImageBlockModuleDefinition()
     blocks[f"{__PLUGIN_PREFIX}.blocks.audio"] = AudioBlockModuleDefinition()
 
-
-def register_effects(effects):
     # BLOCK EFFECTS
     effects[f"{__PLUGIN_PREFIX}.effects.blocks.text.write"] = TextWriteEffectModuleDefinition()
     effects[f"{__PLUGIN_PREFIX}.effects.blocks.text.typewrite"] = TextTypewriteEffectModuleDefinition()
@@ -67,12 +66,36 @@ def register_effects(effects):
     effects[f"{__PLUGIN_PREFIX}.effects.frames.audio"] = FrameAudioEffectModuleDefinition()
     effects[f"{__PLUGIN_PREFIX}.effects.frames.resize"] = FrameResizeEffectModuleDefinition()
 
+    return {"frames": frames, "blocks": blocks, "effects": effects}
+
+
+def build_manifest():
+    write_manifest(__MANIFEST_PATH, get_modules())
+
+
+def register_frames(frames):
+    frames.update(load_definitions(__MANIFEST_PATH, "frames", get_modules))
+
+
+def register_blocks(blocks):
+    blocks.update(load_definitions(__MANIFEST_PATH, "blocks", get_modules))
+
+
+def register_effects(effects):
+    effects.update(load_definitions(__MANIFEST_PATH, "effects", get_modules))
+
 
 def register_file_loaders(file_loaders):
     file_loaders["yml"] = yaml_file_loader
 
 
 def register_compilers(compilers):
+    from plugins.core.compilers.compose import ComposeCompiler
+    from plugins.core.compilers.concacenate import ConcatenateCompiler
+    from plugins.core.compilers.ignore import IgnoreCompiler
+    from plugins.core.compilers.use_source import UseSourceCompiler
+    from plugins.core.compilers.use_target import UseTargetCompiler
+
     compilers["use_source"] = UseSourceCompiler()
     compilers["use_target"] = UseTargetCompiler()
     compilers["compose"] = ComposeCompiler()
@@ -98,5 +121,6 @@ def register(hooks):
     hooks.register_hook("videopy.modules.compilers.register", register_compilers)
     hooks.register_hook(HOOK_TEMPLATE_PARAM_PRE_HANDLER_REGISTER, register_param_pre_handlers)
     hooks.register_hook(HOOK_TEMPLATE_PARAM_POST_HANDLER_REGISTER, register_param_post_handlers)
+    hooks.register_hook(HOOK_MANIFEST_BUILD, build_manifest)
 
     hooks.register_hook("videopy.scenario.frame.block.effects.before_load", load_effects_template)
@@ -0,0 +1,82 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from PIL import Image
+
+from videopy.batch import BatchRenderer, read_rows
+from videopy.hooks import Hooks
+from videopy.main import create_registry
+
+
+class TestBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+        self.image_path = os.path.join(self.directory.name, "image.png")
+        Image.new("RGB", (32, 32), "red").save(self.image_path)
+
+        self.hooks = Hooks()
+        self.registry = create_registry(self.hooks)
+        self.scenario = {
+            "width": 32,
+            "height": 32,
+            "fps": 5,
+            "output_path": os.path.join(self.directory.name, "output_{name}.mp4"),
+            "frames": [{"type": "plugins.core.frames.image", "configuration": {"file_path": "{image}"}}],
+        }
+
+    def write(self, name, content):
+        path = os.path.join(self.directory.name, name)
+
+        with open(path, "w") as f:
+            f.write(content)
+
+        return path
+
+    def test_rows_are_read_from_jsonl_and_csv(self):
+        jsonl_path = self.write("rows.jsonl", '{"name": "a", "size": 1}\n\n{"name": "b", "size": 2}\n')
+        csv_path = self.write("rows.csv", "name,size\na,1\nb,2\n")
+
+        self.assertEqual([{"name": "a", "size": 1}, {"name": "b", "size": 2}], read_rows(jsonl_path))
+        self.assertEqual([{"name": "a", "size": "1"}, {"name": "b", "size": "2"}], read_rows(csv_path))
+
+        with self.assertRaises(ValueError):
+            read_rows(self.write("rows.txt", "a"))
+
+    def render(self, rows, workers):
+        manifest_path = os.path.join(self.directory.name, "manifest.jsonl")
+
+        with patch("videopy.batch.Logger"):
+            results = BatchRenderer(self.scenario, rows, self.hooks, self.registry, workers).render(manifest_path)
+
+        with open(manifest_path, "r") as f:
+            self.assertEqual(results, [json.loads(line) for line in f])
+
+        return results
+
+    def test_every_row_is_rendered_with_its_values(self):
+        results = self.render([{"name": "a", "image": self.image_path}, {"name": "b", "image": self.image_path}], 1)
+
+        self.assertEqual(["rendered", "rendered"], [result["status"] for result in results])
+
+        for name, result in zip(["a", "b"], results):
+            self.assertEqual(os.path.join(self.directory.name, f"output_{name}.mp4"), result["output_path"])
+            self.assertTrue(os.path.isfile(result["output_path"]))
+
+        self.assertEqual("output_{name}.mp4", os.path.basename(self.scenario["output_path"]))
+
+    @unittest.skipUnless(BatchRenderer.is_supported(), "fork start method is not available")
+    def test_failed_row_does_not_stop_the_pool(self):
+        missing_path = os.path.join(self.directory.name, "missing.png")
+        results = self.render([{"name": "a", "image": missing_path}, {"name": "b", "image": self.image_path}], 2)
+
+        self.assertEqual([0, 1], [result["index"] for result in results])
+        self.assertEqual("failed", results[0]["status"])
+        self.assertIsNotNone(results[0]["error"])
+        self.assertEqual("rendered", results[1]["status"])
+        self.assertTrue(os.path.isfile(results[1]["output_path"]))
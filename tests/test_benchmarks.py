@@ -0,0 +1,91 @@
+import multiprocessing
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from benchmarks.scenarios import SCENARIOS, create_assets
+from benchmarks.suite import compare, get_mismatches, load_history, measure_startup, save_run, wait_for_result
+from videopy.hooks import Hooks
+from videopy.main import create_registry, load_scenario_yml, prepare_scenario_yml
+from videopy.renderer import Renderer
+
+
+class TestBenchmarks(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def create_run(self, templating, per_frame, peak_rss, scale=1):
+        result = {"templating": templating, "construction": 0.1, "per_frame": per_frame, "peak_rss": peak_rss}
+
+        return {"commit": None, "scale": scale, "machine": "machine", "python": "3.11.0", "moviepy": "1.0.3",
+                "results": {"scenario": result}}
+
+    def test_scenarios_are_built(self):
+        assets = create_assets(self.directory)
+        hooks = Hooks()
+        registry = create_registry(hooks)
+
+        for name, create_scenario in SCENARIOS.items():
+            with self.subTest(name), patch("videopy.main.Logger"), patch("videopy.scenario.Logger"):
+                scenario_yml = load_scenario_yml(registry, None, None, create_scenario(assets, 0.2))
+                prepare_scenario_yml(registry, scenario_yml, hooks)
+
+                scenario = Renderer(scenario_yml, registry, hooks).build()
+
+                self.assertGreater(len(scenario.frames), 0)
+
+    def test_regressions_are_found(self):
+        rows = compare(self.create_run(1, 0.010, 100 * 1024 * 1024), self.create_run(1.5, 0.0101, 50 * 1024 * 1024))
+
+        self.assertEqual({"templating": True, "construction": False, "per_frame": False, "peak_rss": False},
+                         {row["metric"]: row["regression"] for row in rows})
+
+    def test_missing_metrics_are_reported(self):
+        baseline = self.create_run(1, 0.010, 0)
+        del baseline["results"]["scenario"]["peak_rss"]
+
+        rows = {row["metric"]: row for row in compare(baseline, self.create_run(1, 0.010, 0))}
+
+        self.assertEqual((None, 0, None, False), tuple(rows["peak_rss"][key]
+                                                       for key in ["baseline", "current", "change", "regression"]))
+
+    def test_crashed_measurement_is_recorded_as_error(self):
+        context = multiprocessing.get_context("spawn")
+        process = context.Process(target=os._exit, args=(3,))
+        process.start()
+
+        with patch("benchmarks.suite.POLL_INTERVAL", 0.1):
+            result = wait_for_result(process, context.Queue())
+
+        process.join()
+
+        self.assertEqual({"error": "Process exited with code 3 without a result"}, result)
+
+    def test_runs_of_other_environment_are_not_compared(self):
+        baseline, current = self.create_run(1, 0.010, 0), self.create_run(1, 0.010, 0, scale=2)
+
+        self.assertEqual({"scale": (1, 2)}, get_mismatches(baseline, current))
+
+        with self.assertRaisesRegex(ValueError, "scale 1 != 2"):
+            compare(baseline, current)
+
+        self.assertEqual(4, len(compare(baseline, current, force=True)))
+
+    def test_startup_is_measured(self):
+        self.assertGreater(measure_startup()["startup"], 0)
+
+    def test_runs_are_appended_to_history(self):
+        path = os.path.join(self.directory, "history.json")
+
+        save_run(path, {"scenario": {"templating": 1}})
+        save_run(path, {"scenario": {"templating": 2}}, scale=2)
+
+        history = load_history(path)
+
+        self.assertEqual([1, 2], [run["results"]["scenario"]["templating"] for run in history])
+        self.assertEqual(2, history[-1]["scale"])
+        self.assertEqual({"scale": (1, 2)}, get_mismatches(history[0], history[-1]))
@@ -0,0 +1,153 @@
+import os
+import sys
+import tempfile
+import unittest
+
+from moviepy.editor import ColorClip
+
+from tests.utils.dummies import DummyFrame
+from videopy.cache import RenderCache, find_types, find_assets, get_directory_digest, get_plugin_directory
+from videopy.hooks import Hooks
+from videopy.scenario import ScenarioFactory
+from videopy.segment import SegmentRenderer
+from videopy.utils.time import Time
+
+
+class ColorFrame(DummyFrame):
+
+    def render(self, relative_start_time):
+        return ColorClip((32, 32), color=(0, 255, 0), duration=self.time.duration)
+
+
+class FailingFrame(DummyFrame):
+
+    def render(self, relative_start_time):
+        raise RuntimeError("Frame should be reused from cache")
+
+
+def create_scenario(output_path, cache_dir):
+    scenario = {
+        "output_path": output_path,
+        "width": 32,
+        "height": 32,
+        "fps": 10,
+        "cache_dir": cache_dir,
+    }
+
+    return ScenarioFactory.from_yml([], scenario, Hooks())
+
+
+class TestCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+        self.cache = RenderCache(os.path.join(self.directory.name, "cache"))
+        self.scenario = create_scenario("output.mp4", self.cache.directory)
+
+    def test_key_should_be_stable_for_same_frame(self):
+        frame_yml = {"type": "plugins.core.frames.image", "time": {"duration": 1}, "blocks": []}
+
+        self.assertEqual(self.cache.get_key(frame_yml, self.scenario),
+                         self.cache.get_key(dict(frame_yml), self.scenario))
+
+    def test_key_should_change_when_frame_changes(self):
+        frame_yml = {"type": "plugins.core.frames.image", "configuration": {"content": "first"}}
+        changed_yml = {"type": "plugins.core.frames.image", "configuration": {"content": "second"}}
+
+        self.assertNotEqual(self.cache.get_key(frame_yml, self.scenario),
+                            self.cache.get_key(changed_yml, self.scenario))
+
+    def test_key_should_change_when_asset_changes(self):
+        asset_path = os.path.join(self.directory.name, "asset.txt")
+
+        with open(asset_path, "w") as f:
+            f.write("first")
+
+        frame_yml = {"type": "plugins.core.frames.image", "configuration": {"file_path": asset_path}}
+        key = self.cache.get_key(frame_yml, self.scenario)
+
+        with open(asset_path, "w") as f:
+            f.write("second version")
+
+        self.assertNotEqual(key, self.cache.get_key(frame_yml, self.scenario))
+
+    def test_key_should_change_when_encoding_changes(self):
+        frame_yml = {"type": "plugins.core.frames.image", "time": {"duration": 1}, "blocks": []}
+        key = self.cache.get_key(frame_yml, self.scenario)
+
+        self.scenario.preset = "veryslow"
+        preset_key = self.cache.get_key(frame_yml, self.scenario)
+
+        self.scenario.stream = True
+
+        self.assertNotEqual(key, preset_key)
+        self.assertNotEqual(preset_key, self.cache.get_key(frame_yml, self.scenario))
+
+    def test_key_should_change_when_plugin_helper_changes(self):
+        plugin_dir = os.path.join(self.directory.name, "cache_test_plugin")
+        os.makedirs(os.path.join(plugin_dir, "frames"))
+
+        for name, content in [("__init__.py", ""), ("plugin.py", ""), ("helper.py", "VALUE = 1"),
+                              ("frames/__init__.py", ""), ("frames/frame.py", "from ..helper import VALUE")]:
+            with open(os.path.join(plugin_dir, name), "w") as f:
+                f.write(content)
+
+        sys.path.insert(0, self.directory.name)
+        self.addCleanup(sys.path.remove, self.directory.name)
+        self.addCleanup(lambda: [sys.modules.pop(name) for name in list(sys.modules) if name.startswith("cache_test")])
+
+        frame_yml = {"type": "cache_test_plugin.frames.frame"}
+        key = self.cache.get_key(frame_yml, self.scenario)
+
+        self.assertEqual(plugin_dir, get_plugin_directory("cache_test_plugin.frames.frame"))
+
+        with open(os.path.join(plugin_dir, "helper.py"), "w") as f:
+            f.write("VALUE = 2")
+
+        # Sources are hashed once per process
+        get_directory_digest.cache_clear()
+
+        self.assertNotEqual(key, self.cache.get_key(frame_yml, self.scenario))
+
+    def test_find_types_and_assets(self):
+        frame_yml = {
+            "type": "frame",
+            "configuration": {"file_path": __file__},
+            "blocks": [{"type": "block", "effects": [{"type": "effect"}]}],
+        }
+
+        self.assertEqual({"frame", "block", "effect"}, find_types(frame_yml))
+        self.assertEqual({__file__}, find_assets(frame_yml))
+
+    def test_put_and_get_segment(self):
+        segment_path = os.path.join(self.directory.name, "segment.mp4")
+
+        with open(segment_path, "wb") as f:
+            f.write(b"segment")
+
+        self.assertIsNone(self.cache.get("abc", "mp4"))
+
+        path = self.cache.put("abc", segment_path, True)
+
+        self.assertEqual((path, True), self.cache.get("abc", "mp4"))
+
+    @unittest.skipUnless(SegmentRenderer.is_supported(), "fork start method is not available")
+    def test_unchanged_frames_should_be_reused(self):
+        output_path = os.path.join(self.directory.name, "output.mp4")
+        frames_yml = [{"type": "first", "time": {"duration": 1}}, {"type": "second", "time": {"duration": 1}}]
+
+        scenario = create_scenario(output_path, self.cache.directory)
+        for frame_yml in frames_yml:
+            scenario.add_frame(ColorFrame(Time(0, 1), scenario), frame_yml)
+        scenario.render()
+
+        os.remove(output_path)
+
+        scenario = create_scenario(output_path, self.cache.directory)
+        for frame_yml in frames_yml:
+            scenario.add_frame(FailingFrame(Time(0, 1), scenario), frame_yml)
+        scenario.render()
+
+        self.assertTrue(os.path.isfile(output_path))
@@ -0,0 +1,70 @@
+import unittest
+
+import numpy as np
+from moviepy.audio.AudioClip import AudioClip
+from moviepy.video.VideoClip import ColorClip
+from moviepy.video.compositing.CompositeVideoClip import CompositeVideoClip
+
+from videopy.clip.composite import compose_layers
+
+
+class TestComposite(unittest.TestCase):
+
+    def test_single_layer_is_returned_as_is(self):
+        frame_clip = ColorClip((10, 10), color=(255, 0, 0), duration=2)
+
+        self.assertIs(compose_layers([frame_clip]), frame_clip)
+
+    def test_layers_are_composed_in_single_pass(self):
+        frame_clip = ColorClip((10, 10), color=(255, 0, 0), duration=2)
+        layers = [frame_clip] + [
+            ColorClip((2, 2), color=(0, 0, index * 10), duration=1).set_position((index, index))
+            for index in range(5)
+        ]
+
+        result = compose_layers(layers)
+
+        self.assertIsInstance(result, CompositeVideoClip)
+        self.assertIs(result.bg, frame_clip)
+        self.assertEqual(layers[1:], result.clips)
+        self.assertFalse(any(isinstance(clip, CompositeVideoClip) for clip in result.clips))
+        self.assertEqual(2, result.duration)
+        self.assertIsNone(result.mask)
+
+        frame = result.get_frame(0.5)
+        self.assertTrue(np.array_equal([0, 0, 40], frame[5, 5]))
+        self.assertTrue(np.array_equal([255, 0, 0], frame[9, 9]))
+
+    def test_masked_frame_clip_keeps_its_mask(self):
+        frame_clip = ColorClip((10, 10), color=(255, 0, 0), duration=2).crossfadein(1)
+        block_clip = ColorClip((2, 2), color=(0, 255, 0), duration=1)
+
+        result = compose_layers([frame_clip, block_clip])
+
+        self.assertEqual([frame_clip, block_clip], result.clips)
+        self.assertIsNotNone(result.mask)
+        self.assertEqual(2, result.duration)
+
+    def test_frame_clip_keeps_its_audio(self):
+        audio = AudioClip(lambda t: [np.sin(440 * t)], duration=2, fps=44100)
+        frame_clip = ColorClip((10, 10), color=(255, 0, 0), duration=2).set_audio(audio)
+        block_clip = ColorClip((2, 2), color=(0, 255, 0), duration=1)
+
+        result = compose_layers([frame_clip, block_clip])
+
+        self.assertIsNotNone(result.audio)
+        self.assertEqual(2, result.audio.duration)
+        self.assertAlmostEqual(np.sin(440 * 0.5), result.audio.get_frame(0.5)[0])
+
+    def test_audio_of_later_block_starts_with_the_block(self):
+        frame_clip = ColorClip((10, 10), color=(255, 0, 0), duration=2).set_audio(
+            AudioClip(lambda t: [0 * t], duration=2, fps=44100))
+        block_audio = AudioClip(lambda t: [0.25 + 0 * t], duration=0.5, fps=44100)
+        # Audio set after the start of the clip is not shifted by moviepy
+        block_clip = ColorClip((2, 2), color=(0, 255, 0), duration=0.5).set_start(1).set_audio(block_audio)
+
+        result = compose_layers([frame_clip, block_clip])
+
+        self.assertAlmostEqual(0, result.audio.get_frame(0.25)[0])
+        self.assertAlmostEqual(0.25, result.audio.get_frame(1.25)[0])
+        self.assertAlmostEqual(0, result.audio.get_frame(1.75)[0])
@@ -0,0 +1,80 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from PIL import Image
+
+from videopy.estimate import COMPOSE_SECONDS_PER_MEGAPIXEL, HOOK_COST_MODEL, ModuleCost
+from videopy.hooks import Hooks
+from videopy.main import estimate_scenario
+
+
+class TestEstimate(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+
+        self.image_path = os.path.join(directory.name, "image.png")
+        Image.new("RGB", (1000, 500)).save(self.image_path)
+
+    def create_scenario(self, frames=2, texts=("first", "second", "first")):
+        return {
+            "width": 640,
+            "height": 360,
+            "fps": 24,
+            "output_path": "videopy.mp4",
+            "frames": [{
+                "type": "plugins.core.frames.image",
+                "time": {"duration": 2},
+                "configuration": {"file_path": self.image_path},
+                "blocks": [{
+                    "type": "plugins.core.blocks.text",
+                    "time": {"duration": 1},
+                    "position": ["center", "center"],
+                    "configuration": {"content": text},
+                    "effects": [],
+                } for text in texts],
+            } for _ in range(frames)],
+        }
+
+    def estimate(self, scenario, **kwargs):
+        with patch("videopy.main.Logger"), patch("videopy.scenario.Logger"):
+            return estimate_scenario(input_content=scenario, **kwargs)
+
+    def test_scenario_is_counted(self):
+        estimate = self.estimate(self.create_scenario())
+
+        self.assertEqual(96, estimate.frames)
+        self.assertEqual(4, estimate.duration)
+        self.assertEqual({0: 4, 1: 4}, estimate.layers)
+        self.assertEqual(2, estimate.text_rasterizations)
+        self.assertEqual(1, estimate.decoded_assets)
+        self.assertAlmostEqual(estimate.cpu_seconds, sum(estimate.modules.values()))
+        self.assertGreater(estimate.modules["encoder"], 0)
+        self.assertGreater(estimate.peak_memory, 1000 * 500 * 3)
+
+    def test_merged_frames_are_only_encoded(self):
+        single = self.estimate(self.create_scenario(frames=1))
+        double = self.estimate(self.create_scenario(frames=2))
+
+        self.assertAlmostEqual(single.modules["plugins.core.blocks.text"], double.modules["plugins.core.blocks.text"])
+        self.assertAlmostEqual(single.modules["encoder"] * 2, double.modules["encoder"])
+
+    def test_preview_is_cheaper(self):
+        full = self.estimate(self.create_scenario())
+        preview = self.estimate(self.create_scenario(), preview=True)
+
+        self.assertLess(preview.frames, full.frames)
+        self.assertLess(preview.cpu_seconds, full.cpu_seconds)
+        self.assertEqual((320, 180), preview.size)
+
+    def test_cost_model_is_extended_by_hook(self):
+        hooks = Hooks()
+        hooks.register_hook(HOOK_COST_MODEL, lambda cost_model: cost_model.update(
+            {"plugins.core.blocks.text": ModuleCost(setup=10, per_frame=COMPOSE_SECONDS_PER_MEGAPIXEL)}))
+
+        estimate = self.estimate(self.create_scenario(frames=1), hooks=hooks)
+
+        self.assertGreater(estimate.modules["plugins.core.blocks.text"], 30)
@@ -77,6 +77,22 @@ class TestAbstractFrame(unittest.TestCase):
             frame.do_render(0)
             mock_render.assert_called_once()
 
+    def test_blocks_are_composed_in_single_pass(self):
+        scenario = create_dummy_scenario()
+        frame = DummyFrame(Time(0, 5), scenario)
+        frame_clip, block_clips = Mock(), [Mock(duration=5), Mock(duration=5), Mock(duration=5)]
+
+        for block_clip in block_clips:
+            block = DummyBlock(Time(0, 5), [0, 0], frame)
+            block.do_render = Mock(return_value=Compilation(None, block_clip, "dummy"))
+            frame.add_block(block)
+
+        with patch.object(DummyFrame, "render", return_value=frame_clip), \
+                patch("videopy.frame.compose_layers") as mock_compose_layers:
+            frame.do_render(0)
+
+            mock_compose_layers.assert_called_once_with([frame_clip] + block_clips)
+
     def test_do_render_raises_error_when_frame_render_returns_none(self):
         scenario = create_dummy_scenario()
         frame = DummyFrame(Time(0, 5), scenario)
@@ -37,3 +37,17 @@ class TestHooks(TestCase):
         self.hooks.run_hook(event)
 
         mock_logger_debug.assert_called_once_with(f"No hooks registered for event: <<{event}>>")
+
+    def test_copy_does_not_share_registered_hooks(self):
+        event = 'test_event'
+        function1 = MagicMock()
+        function2 = MagicMock()
+
+        self.hooks.register_hook(event, function1)
+        copy = self.hooks.copy()
+        copy.register_hook(event, function2)
+
+        self.hooks.run_hook(event)
+
+        function1.assert_called_once_with()
+        function2.assert_not_called()
@@ -0,0 +1,148 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+from moviepy.editor import ImageClip, VideoClip
+from PIL import Image
+
+from plugins.core.effects.frames.resize import Effect, resize_clip
+from plugins.core.frames.image import Frame
+from tests.utils.dummies import create_dummy_scenario
+from videopy.utils import image as image_module
+from videopy.utils.image import ImageCache, DecodedImage, image_cache, load_image, resize_array, RESIZE_CENTER_CROP
+from videopy.utils.time import Time
+
+
+class TestImage(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.addCleanup(image_cache.clear)
+
+    def create_image(self, name, size=(40, 20), color=(255, 0, 0), mode="RGB"):
+        path = os.path.join(self.directory.name, name)
+        Image.new(mode, size, color).save(path)
+
+        return path
+
+    def test_image_is_decoded_only_once(self):
+        path = self.create_image("image.png")
+
+        first = load_image(path)
+        misses = image_cache.misses
+        second = load_image(path)
+
+        self.assertIs(first, second)
+        self.assertEqual(misses, image_cache.misses)
+        self.assertEqual((40, 20), first.size)
+        self.assertIsNone(first.mask)
+        self.assertFalse(first.rgb.flags.writeable)
+
+    def test_changed_file_is_decoded_again(self):
+        path = self.create_image("image.png")
+        first = load_image(path)
+
+        Image.new("RGB", (10, 10), (0, 0, 255)).save(path)
+        os.utime(path, ns=(os.stat(path).st_atime_ns, os.stat(path).st_mtime_ns + 1_000_000))
+
+        self.assertEqual((10, 10), load_image(path).size)
+        self.assertIsNot(first, load_image(path))
+
+    def test_image_is_resized(self):
+        path = self.create_image("image.png")
+
+        self.assertEqual((20, 20), load_image(path, (20, 20)).size)
+        self.assertEqual((10, 10), load_image(path, (10, 10), RESIZE_CENTER_CROP).size)
+        self.assertIs(load_image(path), load_image(path, (40, 20)))
+        self.assertTrue((load_image(path, (20, 20)).rgb == [255, 0, 0]).all())
+
+    def test_transparent_image_has_mask(self):
+        path = self.create_image("image.png", color=(0, 255, 0, 128), mode="RGBA")
+
+        image = load_image(path, (20, 10))
+        clip = image.to_clip(1)
+
+        self.assertAlmostEqual(128 / 255, image.mask[5, 5], places=2)
+        self.assertEqual((20, 10), tuple(clip.size))
+        self.assertIsNotNone(clip.mask)
+
+    def test_least_recently_used_image_is_evicted(self):
+        cache = ImageCache(250)
+
+        def image():
+            return DecodedImage(np.zeros((10, 10), dtype=np.uint8))
+
+        cache.put("first", image())
+        cache.put("second", image())
+        cache.get("first")
+        cache.put("third", image())
+
+        self.assertIsNotNone(cache.get("first"))
+        self.assertIsNone(cache.get("second"))
+        self.assertEqual(200, cache.bytes)
+
+    def test_image_larger_than_budget_is_not_cached(self):
+        cache = ImageCache(50)
+        cache.put("image", DecodedImage(np.zeros((10, 10), dtype=np.uint8)))
+
+        self.assertIsNone(cache.get("image"))
+        self.assertEqual(0, cache.bytes)
+
+    def test_center_crop_keeps_the_middle_of_the_image(self):
+        array = np.zeros((20, 40, 3), dtype=np.uint8)
+        array[:, 10:30] = 255
+
+        resized = resize_array(array, (10, 10), RESIZE_CENTER_CROP)
+
+        self.assertEqual((10, 10, 3), resized.shape)
+        self.assertTrue((resized[:, 2:8] > 200).all())
+
+    def test_mask_is_resized_within_range(self):
+        mask = np.zeros((20, 20))
+        mask[:, 10:] = 1
+
+        resized = resize_array(mask, (7, 7))
+
+        self.assertEqual((7, 7), resized.shape)
+        self.assertGreaterEqual(resized.min(), 0)
+        self.assertLessEqual(resized.max(), 1)
+
+    def test_static_clip_is_resized_once(self):
+        image = DecodedImage(np.full((20, 40, 3), 255, dtype=np.uint8), np.ones((20, 40)))
+
+        with patch("plugins.core.effects.frames.resize.resize_array", wraps=resize_array) as mock_resize:
+            clip = resize_clip(image.to_clip(1), (10, 10), RESIZE_CENTER_CROP)
+
+            for t in [0, 0.25, 0.5, 0.75]:
+                self.assertEqual((10, 10, 3), clip.get_frame(t).shape)
+                self.assertEqual((10, 10), clip.mask.get_frame(t).shape)
+
+        # Once for the image and once for the mask
+        self.assertEqual(2, mock_resize.call_count)
+        self.assertIsInstance(clip, ImageClip)
+
+    def test_dynamic_clip_is_resized_per_frame(self):
+        clip = VideoClip(lambda t: np.full((20, 40, 3), int(t * 100), dtype=np.uint8), duration=1)
+        resized = resize_clip(clip, (20, 10))
+
+        self.assertEqual((10, 20, 3), resized.get_frame(0.5).shape)
+        self.assertEqual(50, resized.get_frame(0.5)[5, 5, 0])
+
+    def test_image_frames_share_the_resized_image(self):
+        path = self.create_image("image.png")
+        scenario = create_dummy_scenario()
+        frames = [Frame(Time(0, 1), {"file_path": path}, scenario) for _ in range(3)]
+
+        for frame in frames:
+            frame.add_effect(Effect(Time(0, 0), {"mode": "center_crop"}))
+
+        with patch("videopy.utils.image.resize_image", wraps=image_module.resize_image) as mock_resize, \
+                patch("plugins.core.effects.frames.resize.resize_array") as mock_resize_array:
+            clips = [resize_clip(frame.render(0), scenario.size, RESIZE_CENTER_CROP) for frame in frames]
+
+        self.assertEqual(1, mock_resize.call_count)
+        mock_resize_array.assert_not_called()
+        self.assertEqual([(1920, 1080)] * 3, [tuple(clip.size) for clip in clips])
@@ -0,0 +1,116 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from plugins.core import plugin
+from videopy.manifest import build_manifest, load_definitions, read_manifest, write_manifest
+from videopy.module import LazyModuleDefinition, Registry, Validator
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CORE_MANIFEST_PATH = os.path.join(ROOT_DIR, "plugins", "core", "manifest.json")
+
+DEFINITION_SOURCE = """
+from videopy.module import AbstractModuleDefinition
+
+
+class LazyDefinition(AbstractModuleDefinition):
+
+    @staticmethod
+    def get_description():
+        return "Lazy definition"
+
+    @staticmethod
+    def get_configuration():
+        return {}
+
+    @staticmethod
+    def get_examples():
+        return {examples}
+
+    @staticmethod
+    def get_renders_on():
+        return ["frame"]
+"""
+
+
+class TestManifest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+        sys.path.insert(0, self.directory.name)
+        self.addCleanup(sys.path.remove, self.directory.name)
+
+    def create_module(self, name, examples):
+        with open(os.path.join(self.directory.name, f"{name}.py"), "w") as f:
+            f.write(DEFINITION_SOURCE.replace("{examples}", examples))
+
+        self.addCleanup(sys.modules.pop, name, None)
+
+    def test_core_manifest_is_up_to_date(self):
+        with open(CORE_MANIFEST_PATH, "r") as f:
+            manifest = json.load(f)
+
+        self.assertEqual(build_manifest(plugin.get_modules()), manifest,
+                         "Regenerate the manifest with: python video.py manifest")
+
+    def test_definition_is_imported_only_when_needed(self):
+        self.create_module("lazy_definition", "[{'name': 'example'}]")
+        definition = LazyModuleDefinition("lazy_definition", "LazyDefinition", "Lazy definition", ["frame"])
+
+        registry = Registry()
+        registry.add_effect("lazy", definition)
+
+        self.assertEqual("Lazy definition", definition.get_description())
+        self.assertEqual(["frame"], definition.get_renders_on())
+        self.assertNotIn("lazy_definition", sys.modules)
+
+        self.assertEqual([{'name': 'example'}], definition.get_examples())
+        self.assertIn("lazy_definition", sys.modules)
+        self.assertTrue(definition.is_loaded())
+
+    def test_definition_is_validated_when_imported(self):
+        self.create_module("invalid_definition", "[]")
+        definition = LazyModuleDefinition("invalid_definition", "LazyDefinition", "Lazy definition", ["frame"],
+                                          Validator.validate_effect)
+
+        with self.assertRaises(ValueError):
+            definition.get_configuration()
+
+    @patch("videopy.manifest.Logger")
+    def test_definitions_are_read_from_manifest(self, _):
+        path = os.path.join(self.directory.name, "manifest.json")
+        self.create_module("lazy_definition", "[{'name': 'example'}]")
+
+        from lazy_definition import LazyDefinition
+        write_manifest(path, {"effects": {"lazy": LazyDefinition()}})
+        sys.modules.pop("lazy_definition")
+
+        definitions = load_definitions(path, "effects", lambda: self.fail("Manifest should be used"))
+
+        self.assertEqual(["lazy"], list(definitions.keys()))
+        self.assertEqual("Lazy definition", definitions["lazy"].get_description())
+        self.assertFalse(definitions["lazy"].is_loaded())
+
+    @patch("videopy.manifest.Logger")
+    def test_modules_are_imported_without_manifest(self, _):
+        path = os.path.join(self.directory.name, "missing.json")
+        modules = {"frames": {"frame": "definition"}}
+
+        self.assertIsNone(read_manifest(path))
+        self.assertEqual({"frame": "definition"}, load_definitions(path, "frames", lambda: modules))
+
+    def test_core_plugin_registers_modules_without_importing_them(self):
+        code = ("import sys; from plugins.core import plugin; modules = {}; plugin.register_frames(modules); "
+                "plugin.register_blocks(modules); plugin.register_effects(modules); "
+                "print(len(modules), any(name in sys.modules for name in modules))")
+
+        result = subprocess.run([sys.executable, "-c", code], cwd=ROOT_DIR, capture_output=True, text=True,
+                                check=True)
+
+        self.assertEqual("18 False", result.stdout.strip())
@@ -0,0 +1,145 @@
+import multiprocessing
+import os
+import subprocess
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+from moviepy.config import get_setting
+from moviepy.editor import VideoFileClip
+
+from plugins.core.frames.video import Frame
+from tests.utils.dummies import create_dummy_scenario
+from videopy.media import MediaPool, media_pool
+from videopy.utils.time import Time
+
+
+def read_frame_in_child(clip, queue):
+    queue.put(clip.get_frame(0.5).sum())
+
+
+class TestMedia(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.video_path = os.path.join(cls.directory.name, "source.mp4")
+
+        subprocess.run([get_setting("FFMPEG_BINARY"), "-y", "-loglevel", "error", "-f", "lavfi",
+                        "-i", "testsrc=size=64x32:rate=10:duration=1", "-f", "lavfi", "-i", "sine=duration=1",
+                        "-pix_fmt", "yuv420p", "-shortest", cls.video_path], check=True)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def setUp(self):
+        self.pool = MediaPool()
+        self.addCleanup(self.pool.close)
+
+    def test_clips_of_the_same_file_share_the_reader(self):
+        first = self.pool.open_video(self.video_path)
+        second = self.pool.open_video(self.video_path)
+        scaled = self.pool.open_video(self.video_path, size=(32, 16))
+
+        self.assertEqual(2, self.pool.get_live_count())
+        self.assertIsNot(first, second)
+        self.assertIs(first.reader, second.reader)
+        self.assertIs(first.audio.reader, second.audio.reader)
+        self.assertIsNot(first.reader, scaled.reader)
+        self.assertTrue((first.get_frame(0.5) == second.subclip(0.2).get_frame(0.3)).all())
+
+    def test_clips_reading_from_other_offset_have_own_reader(self):
+        first = self.pool.open_audio(self.video_path)
+        second = self.pool.open_audio(self.video_path, offset=0.5)
+        third = self.pool.open_audio(self.video_path, offset=0.5)
+
+        self.assertEqual(2, self.pool.get_live_count())
+        self.assertIsNot(first.reader, second.reader)
+        self.assertIs(second.reader, third.reader)
+
+        first.get_frame(0.1)
+        reader = second.reader.reader
+        second.subclip(0.5).get_frame(0.1)
+        position = reader.pos
+
+        # Reading the first clip does not move the reader of the second one
+        first.get_frame(0.2)
+
+        self.assertEqual(position, reader.pos)
+
+    def test_reader_is_closed_when_last_clip_is_released(self):
+        first = self.pool.open_audio(self.video_path)
+        second = self.pool.open_audio(self.video_path)
+        reader = first.reader.reader
+        first.get_frame(0.5)
+
+        self.pool.release(first)
+
+        self.assertEqual(1, self.pool.get_live_count())
+        self.assertIsNotNone(reader.proc)
+
+        self.pool.release(second)
+
+        self.assertEqual(0, self.pool.get_live_count())
+        self.assertIsNone(reader.proc)
+
+    def test_idle_readers_are_kept_warm(self):
+        self.pool.set_idle_limit(1)
+
+        first = self.pool.open_audio(self.video_path)
+        reader = first.reader.reader
+        first.get_frame(0.5)
+        self.pool.release(first)
+
+        self.assertEqual((0, 1), (self.pool.get_live_count(), self.pool.get_idle_count()))
+        self.assertIsNotNone(reader.proc)
+
+        second = self.pool.open_audio(self.video_path)
+
+        self.assertIs(reader, second.reader.reader)
+        self.assertEqual((1, 0), (self.pool.get_live_count(), self.pool.get_idle_count()))
+
+        video = self.pool.open_video(self.video_path, audio=False)
+        self.pool.release(second)
+        self.pool.release(video)
+
+        # Least recently used reader is closed over the limit
+        self.assertEqual(1, self.pool.get_idle_count())
+        self.assertIsNone(reader.proc)
+
+    @unittest.skipUnless("fork" in multiprocessing.get_all_start_methods(), "fork start method is not available")
+    def test_forked_process_reopens_the_reader(self):
+        clip = self.pool.open_video(self.video_path, audio=False)
+        expected = clip.get_frame(0.5).sum()
+        process = clip.reader.reader.proc
+
+        context = multiprocessing.get_context("fork")
+        queue = context.Queue()
+        child = context.Process(target=read_frame_in_child, args=(clip, queue))
+        child.start()
+        child.join()
+
+        self.assertEqual(expected, queue.get(timeout=5))
+        self.assertIs(process, clip.reader.reader.proc)
+
+        # Parent keeps reading from its own process
+        with VideoFileClip(self.video_path, audio=False) as source:
+            self.assertTrue(np.array_equal(source.get_frame(0.6), clip.get_frame(0.6)))
+
+    def test_scenario_releases_media_after_render(self):
+        scenario = create_dummy_scenario()
+        scenario.output_path = os.path.join(self.directory.name, "output.mp4")
+        scenario.fps = 10
+        scenario.add_frame(Frame(Time(0, 1), {"file_path": self.video_path}, scenario))
+        scenario.add_frame(Frame(Time(0, 1), {"file_path": self.video_path}, scenario))
+
+        live_count = media_pool.get_live_count()
+
+        with patch("videopy.scenario.Logger"):
+            scenario.render()
+
+        self.assertEqual(live_count, media_pool.get_live_count())
+        self.assertEqual([], scenario.media)
+        self.assertTrue(os.path.isfile(scenario.output_path))
@@ -67,6 +67,25 @@ class TestRegistry(unittest.TestCase):
         for scenario in scenarios.values():
             mock_validate_scenario.assert_any_call(scenario)
 
+    def test_factories_are_resolved_once(self):
+        registry = Registry()
+
+        for get_factory in ['get_frame_factory', 'get_block_factory', 'get_effect_factory']:
+            with patch(f'videopy.utils.loader.Loader.{get_factory}', return_value=MagicMock()) as mock_get_factory:
+                first = getattr(registry, get_factory)('plugins.core.dummy')
+                second = getattr(registry, get_factory)('plugins.core.dummy')
+
+                self.assertIs(first, second)
+                mock_get_factory.assert_called_once_with('plugins.core.dummy')
+
+    def test_factories_are_loaded_by_type(self):
+        registry = Registry()
+
+        factory = registry.get_frame_factory('plugins.core.frames.image')
+
+        self.assertIs(factory, registry.frame_factories['plugins.core.frames.image'])
+        self.assertEqual('FrameFactory', factory.__name__)
+
 
 class TestValidator(unittest.TestCase):
 
@@ -0,0 +1,84 @@
+import threading
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+from moviepy.editor import ColorClip, VideoClip
+
+from tests.utils.dummies import DummyBlock, DummyBlockEffect, DummyFrame, create_dummy_scenario
+from videopy.compilation import Compilation
+from videopy.profiler import Profiler
+from videopy.utils.time import Time
+
+
+class TestProfiler(unittest.TestCase):
+
+    def setUp(self):
+        self.profiler = Profiler()
+
+    def test_nested_modules_are_recorded(self):
+        self.profiler.enter("frame")
+        self.profiler.enter("block")
+        self.profiler.exit("block")
+        self.profiler.exit("frame")
+
+        frame, block = self.profiler.records["frame"], self.profiler.records["block"]
+
+        self.assertEqual(1, frame.calls)
+        self.assertAlmostEqual(frame.wall - block.wall, frame.self_wall)
+        self.assertEqual(["O", "O", "C", "C"], [event[0] for event in list(self.profiler.events.values())[0]])
+
+    def test_entries_left_open_are_closed_with_their_parent(self):
+        self.profiler.enter("frame")
+        self.profiler.enter("effect")
+        self.profiler.exit("frame")
+        self.profiler.exit("unknown")
+
+        self.assertEqual({"frame", "effect"}, set(self.profiler.records))
+        self.assertEqual([], self.profiler.get_stack())
+
+    def test_lazy_frames_are_measured(self):
+        clip = VideoClip(lambda t: np.zeros((4, 8, 3)), duration=1)
+        self.profiler.wrap_clip(clip, "block")
+        self.profiler.wrap_clip(clip, "other")
+
+        thread = threading.Thread(target=clip.get_frame, args=(0.5,))
+        thread.start()
+        thread.join()
+        clip.get_frame(0.2)
+
+        self.assertEqual(2, self.profiler.records["block"].calls)
+        self.assertEqual(64, self.profiler.records["block"].pixels)
+        self.assertNotIn("other", self.profiler.records)
+        self.assertEqual(2, len(self.profiler.to_speedscope()["profiles"]))
+
+    def test_scenario_render_is_profiled(self):
+        scenario = create_dummy_scenario()
+        self.profiler.register(scenario.hooks)
+
+        frame = DummyFrame(Time(0, 1), scenario)
+        block = DummyBlock(Time(0, 1), ["center", "center"], frame)
+        block.add_effect(DummyBlockEffect("dummy", Time(0, 1)))
+        frame.add_block(block)
+        scenario.add_frame(frame)
+
+        block_clip = ColorClip((4, 4), (0, 0, 0), duration=1)
+
+        with patch.object(DummyFrame, "render", return_value=ColorClip((16, 16), (0, 0, 0), duration=1)), \
+                patch.object(DummyBlock, "render", return_value=Compilation(block_clip, block_clip, "dummy")), \
+                patch.object(VideoClip, "write_videofile", autospec=True), \
+                patch("videopy.scenario.Logger"):
+            scenario.render()
+
+        self.assertEqual({"frame 0 (dummy)", "frame 0 (dummy) > block 0 (dummy) [render]",
+                          "frame 0 (dummy) > block 0 (dummy) > effect 0 (dummy) [compile]",
+                          "frame 0 (dummy) > block 0 (dummy) [compile]", "write"}, set(self.profiler.records))
+
+        profile = self.profiler.to_speedscope()
+
+        self.assertEqual(len(profile["shared"]["frames"]), len(profile["records"]))
+        self.assertEqual(10, len(profile["profiles"][0]["events"]))
+
+        block_clip.get_frame(0)
+
+        self.assertEqual(16, self.profiler.records["frame 0 (dummy) > block 0 (dummy)"].pixels)
@@ -9,7 +9,7 @@ from videopy.renderer import Renderer, HOOK_FRAME_EFFECT_BL
 class TestRenderer(unittest.TestCase):
 
     def setUp(self):
-        self.registry = MagicMock(spec=Registry)
+        self.registry = Registry()
         self.hooks = MagicMock(spec=Hooks)
 
         self.registry.blocks = {'block_type': {}}
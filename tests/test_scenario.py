@@ -1,6 +1,10 @@
+import os
+import tempfile
 import unittest
 from unittest.mock import patch
 
+from moviepy.editor import ColorClip, VideoFileClip
+
 from tests.utils.dummies import DummyFrame
 from videopy.hooks import Hooks
 from videopy.scenario import ScenarioFactory
@@ -52,3 +56,88 @@ class TestScenario(unittest.TestCase):
             mock_render.assert_called_once_with(0)
 
         mock_write_videofile.assert_called_once_with("videopy.output.mp4", fps=24)
+
+    def create_scenario(self, **options):
+        scenario = {"output_path": "videopy.output.mp4", "width": 1920, "height": 1080, "fps": 24, **options}
+
+        return ScenarioFactory.from_yml([], scenario, Hooks())
+
+    def test_preview_profile_scales_the_scenario(self):
+        scenario = self.create_scenario(preview=True)
+
+        self.assertEqual((960, 540), scenario.size)
+        self.assertEqual(12, scenario.fps)
+        self.assertEqual({"preset": "ultrafast"}, scenario.get_encoder_options())
+        self.assertEqual(15, scenario.scaled(30))
+        self.assertEqual(["center", 50], scenario.scaled(["center", 100]))
+
+        scenario = self.create_scenario(preview={"scale": 0.25, "fps": 30})
+
+        self.assertEqual((480, 270), scenario.size)
+        self.assertEqual(24, scenario.fps)
+        self.assertEqual(30, self.create_scenario().scaled(30))
+
+    def test_frames_are_selected_by_time_range_or_indices(self):
+        scenario = self.create_scenario()
+
+        for _ in range(3):
+            scenario.add_frame(DummyFrame(Time(0, 2), scenario))
+
+        self.assertEqual([(0, 0), (1, 2), (2, 4)], scenario.get_selected_frames())
+
+        scenario.time_range = (3, 5)
+        self.assertEqual([(1, 2), (2, 4)], scenario.get_selected_frames())
+
+        scenario.time_range = (10, None)
+        with self.assertRaises(ValueError):
+            scenario.get_selected_frames()
+
+        scenario.time_range = None
+        scenario.frame_indices = [2, 0]
+        self.assertEqual([(0, 0), (2, 4)], scenario.get_selected_frames())
+
+        scenario.frame_indices = [3]
+        with self.assertRaises(ValueError):
+            scenario.get_selected_frames()
+
+        scenario.frame_indices = []
+        with self.assertRaisesRegex(ValueError, "empty"):
+            scenario.get_selected_frames()
+
+    def test_time_range_needs_contiguous_frame_indices(self):
+        scenario = self.create_scenario()
+
+        for _ in range(3):
+            scenario.add_frame(DummyFrame(Time(0, 2), scenario))
+
+        scenario.time_range = (1, 5)
+        scenario.frame_indices = [1, 0]
+        self.assertEqual([(0, 0), (1, 2)], scenario.get_selected_frames())
+
+        scenario.frame_indices = [0, 2]
+        with self.assertRaisesRegex(ValueError, "contiguous"):
+            scenario.get_selected_frames()
+
+    def test_only_time_range_is_rendered(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+
+        scenario = self.create_scenario(output_path=os.path.join(directory.name, "output.mp4"), width=32, height=32,
+                                        fps=10, time_range=[3, 4.5])
+        rendered = []
+
+        def render(frame, relative_start_time):
+            rendered.append(relative_start_time)
+
+            return ColorClip((32, 32), (255, 0, 0), duration=frame.time.duration)
+
+        for _ in range(3):
+            scenario.add_frame(DummyFrame(Time(0, 2), scenario))
+
+        with patch.object(DummyFrame, "render", autospec=True, side_effect=render):
+            scenario.render()
+
+        self.assertEqual([2, 4], rendered)
+
+        with VideoFileClip(scenario.output_path, audio=False) as clip:
+            self.assertAlmostEqual(1.5, clip.duration, delta=0.1)
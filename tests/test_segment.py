@@ -0,0 +1,168 @@
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+from moviepy.editor import AudioClip, ColorClip, VideoFileClip
+
+from plugins.core.effects.frames.fadein import Effect as FadeinEffect
+from tests.utils.dummies import DummyFrame
+from videopy.hooks import Hooks
+from videopy.main import create_registry
+from videopy.scenario import ScenarioFactory
+from videopy.segment import SegmentRenderer, concatenate_segments
+from videopy.utils.time import Time
+
+
+class ColorFrame(DummyFrame):
+
+    def render(self, relative_start_time):
+        return ColorClip((32, 32), color=(255, 0, 0), duration=self.time.duration)
+
+
+class GreenFrame(DummyFrame):
+
+    def render(self, relative_start_time):
+        return ColorClip((32, 32), color=(0, 255, 0), duration=self.time.duration)
+
+
+class SoundFrame(DummyFrame):
+
+    def render(self, relative_start_time):
+        audio = AudioClip(lambda t: np.array([np.sin(880 * t), np.sin(880 * t)]).T, duration=self.time.duration,
+                          fps=44100)
+
+        return ColorClip((32, 32), color=(255, 0, 0), duration=self.time.duration).set_audio(audio)
+
+
+def create_scenario(output_path, workers, registry=None):
+    scenario = {
+        "output_path": output_path,
+        "width": 32,
+        "height": 32,
+        "fps": 10,
+        "workers": workers,
+    }
+
+    return ScenarioFactory.from_yml(registry if registry is not None else [], scenario, Hooks())
+
+
+@unittest.skipUnless(SegmentRenderer.is_supported(), "fork start method is not available")
+class TestSegment(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def test_scenario_factory_should_read_workers(self):
+        scenario = create_scenario("output.mp4", 4)
+
+        assert scenario.workers == 4
+
+    def test_scenario_should_render_frames_as_segments(self):
+        output_path = os.path.join(self.directory.name, "output.mp4")
+        scenario = create_scenario(output_path, 2)
+        scenario.add_frame(ColorFrame(Time(0, 1), scenario))
+        scenario.add_frame(ColorFrame(Time(1, 2), scenario))
+
+        with patch.object(SegmentRenderer, "render", autospec=True, side_effect=SegmentRenderer.render) as render:
+            scenario.render()
+
+            render.assert_called_once()
+
+        clip = VideoFileClip(output_path)
+        self.addCleanup(clip.close)
+
+        self.assertAlmostEqual(3, clip.duration, delta=0.2)
+        self.assertIsNone(clip.audio)
+
+    def test_segments_keep_streams_of_single_process_render(self):
+        layouts = []
+
+        for workers in [1, 2]:
+            output_path = os.path.join(self.directory.name, f"output_{workers}.mp4")
+            scenario = create_scenario(output_path, workers)
+            scenario.add_frame(SoundFrame(Time(0, 1), scenario))
+            scenario.add_frame(SoundFrame(Time(0, 1), scenario))
+            scenario.add_frame(ColorFrame(Time(0, 1), scenario))
+
+            with patch("videopy.scenario.Logger"), patch("videopy.segment.Logger"):
+                scenario.render()
+
+            clip = VideoFileClip(output_path)
+            self.addCleanup(clip.close)
+
+            layouts.append((clip.audio is not None, clip.fps, clip.reader.nframes))
+
+        self.assertEqual(layouts[0], layouts[1])
+        self.assertEqual((True, 10), layouts[1][:2])
+
+    def test_segments_match_single_process_render(self):
+        frames = []
+
+        for workers in [1, 2]:
+            output_path = os.path.join(self.directory.name, f"output_{workers}.mp4")
+            scenario = create_scenario(output_path, workers, create_registry(Hooks()))
+
+            for _ in range(2):
+                frame = ColorFrame(Time(0, 1), scenario)
+                frame.add_effect(FadeinEffect(Time(0, 1), None))
+                scenario.add_frame(frame)
+
+            with patch("videopy.scenario.Logger"), patch("videopy.segment.Logger"):
+                scenario.render()
+
+            clip = VideoFileClip(output_path, audio=False)
+            self.addCleanup(clip.close)
+
+            frames.append([clip.get_frame(t).astype(int) for t in [0.25, 0.5, 0.75, 1.5]])
+
+        for single, segmented in zip(*frames):
+            self.assertLess(np.abs(single - segmented).mean(), 3)
+
+        # The frames fade in from black
+        self.assertLess(frames[1][0].mean(), frames[1][2].mean())
+
+    def test_concurrent_renders_use_their_own_scenario(self):
+        scenarios = []
+
+        for frame_class in [ColorFrame, GreenFrame]:
+            scenario = create_scenario(os.path.join(self.directory.name, f"{frame_class.__name__}.mp4"), 2)
+
+            for _ in range(4):
+                scenario.add_frame(frame_class(Time(0, 0.4), scenario))
+
+            scenarios.append(scenario)
+
+        with patch("videopy.scenario.Logger"), patch("videopy.segment.Logger"):
+            threads = [threading.Thread(target=scenario.render) for scenario in scenarios]
+
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        for scenario, channel in zip(scenarios, [0, 1]):
+            clip = VideoFileClip(scenario.output_path)
+            self.addCleanup(clip.close)
+
+            for t in [0.1, 0.5, 0.9, 1.3]:
+                self.assertEqual(channel, clip.get_frame(t)[16, 16].argmax())
+
+    @patch('moviepy.video.VideoClip.VideoClip.write_gif')
+    def test_gif_output_should_be_rendered_in_single_process(self, mock_write_gif):
+        scenario = create_scenario("output.gif", 2)
+        scenario.add_frame(ColorFrame(Time(0, 1), scenario))
+
+        with patch.object(SegmentRenderer, "render") as render:
+            scenario.render()
+
+            render.assert_not_called()
+
+        mock_write_gif.assert_called_once_with("output.gif", fps=10)
+
+    def test_concatenate_segments_should_fail_without_segments(self):
+        with self.assertRaises(ValueError):
+            concatenate_segments([], "output.mp4")
@@ -0,0 +1,131 @@
+import http.client
+import json
+import os
+import socket
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+from PIL import Image
+
+from videopy.media import media_pool
+from videopy.server import RenderService, create_server, get_job_arguments
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+
+    def __init__(self, socket_path):
+        super().__init__("localhost")
+        self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self.socket_path)
+
+
+class TestServer(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.service = RenderService(log_level="error")
+
+    @classmethod
+    def tearDownClass(cls):
+        media_pool.set_idle_limit(0)
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def start(self, **kwargs):
+        server = create_server(self.service, port=0, **kwargs)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        return server
+
+    def request(self, connection, method, path, body=None):
+        connection.request(method, path, body=body)
+        response = connection.getresponse()
+
+        return response.status, json.loads(response.read())
+
+    def create_scenario(self):
+        image_path = os.path.join(self.directory.name, "image.png")
+        Image.fromarray(np.full((32, 32, 3), 255, dtype=np.uint8)).save(image_path)
+
+        return {
+            "output_path": os.path.join(self.directory.name, "output.mp4"),
+            "width": 32,
+            "height": 32,
+            "fps": 5,
+            "frames": [{"type": "plugins.core.frames.image", "configuration": {"file_path": image_path}}],
+        }
+
+    def test_job_arguments(self):
+        scenario = {"frames": []}
+
+        self.assertEqual(scenario, get_job_arguments(scenario)["input_content"])
+        self.assertEqual(scenario, get_job_arguments({"scenario": "frames: []"})["input_content"])
+        self.assertEqual({"a": 1}, get_job_arguments({"input_file": "scenario.yml", "data": {"a": 1}})["scenario_data"])
+
+        with self.assertRaises(ValueError):
+            get_job_arguments(["frames"])
+
+    def test_scenario_is_rendered_over_http(self):
+        server = self.start()
+        connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1])
+        self.addCleanup(connection.close)
+
+        scenario = self.create_scenario()
+
+        for _ in range(2):
+            status, result = self.request(connection, "POST", "/render", json.dumps({"scenario": scenario}))
+
+            self.assertEqual(200, status)
+            self.assertEqual(scenario["output_path"], result["output_path"])
+            self.assertTrue(os.path.isfile(result["output_path"]))
+
+        status, result = self.request(connection, "GET", "/health")
+
+        self.assertEqual(200, status)
+        self.assertEqual(0, result["active"])
+        self.assertGreaterEqual(result["rendered"], 2)
+
+    def test_jobs_are_rendered_without_forking(self):
+        scenario = {**self.create_scenario(), "workers": 4, "stream": True, "producers": 4}
+
+        with patch("videopy.server.run_scenario", return_value=scenario) as mock_run_scenario:
+            self.service.render({"scenario": scenario})
+
+        self.assertEqual((1, 1, None), tuple(mock_run_scenario.call_args.kwargs[key]
+                                             for key in ["workers", "producers", "log_level"]))
+
+    @patch("videopy.server.Logger")
+    def test_invalid_job_is_rejected(self, _):
+        server = self.start()
+        connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1])
+        self.addCleanup(connection.close)
+
+        status, result = self.request(connection, "POST", "/render", "- not a scenario")
+
+        self.assertEqual(400, status)
+        self.assertIn("error", result)
+
+    @unittest.skipUnless(hasattr(socket, "AF_UNIX"), "Unix sockets are not available")
+    def test_server_listens_on_unix_socket(self):
+        socket_path = os.path.join(self.directory.name, "videopy.sock")
+        self.start(socket_path=socket_path)
+
+        connection = UnixHTTPConnection(socket_path)
+        self.addCleanup(connection.close)
+
+        status, result = self.request(connection, "GET", "/health")
+
+        self.assertEqual(200, status)
+        self.assertEqual("ok", result["status"])
@@ -0,0 +1,58 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Packages needed only to render, they must not be imported by the commands that do not render anything
+MEDIA_PACKAGES = ["moviepy", "imageio", "numpy", "PIL", "IPython", "pygame"]
+
+LISTING_CODE = """
+from typer.testing import CliRunner
+import video
+
+runner = CliRunner()
+for command in [["frames"], ["blocks"], ["effects"], ["scenarios"]]:
+    result = runner.invoke(video.app, command)
+    assert result.exit_code == 0, result.output
+"""
+
+VALIDATION_CODE = """
+from videopy.hooks import Hooks
+from videopy.main import create_registry
+from videopy.template import Template
+
+hooks = Hooks()
+registry = create_registry(hooks)
+scenario_yml = registry.file_loaders["yml"]("example/scenario.yml")
+Template(scenario_yml, hooks).process()
+"""
+
+# Timing of the startup is measured by the benchmarks (see benchmarks.suite.measure_startup)
+IMPORTS_CODE = """
+import json, sys
+{code}
+media = sorted({{name.split(".")[0] for name in sys.modules}} & set({packages}))
+print(json.dumps(media))
+"""
+
+
+def find_media_imports(code):
+    result = subprocess.run([sys.executable, "-c", IMPORTS_CODE.format(code=code, packages=MEDIA_PACKAGES)],
+                            cwd=ROOT_DIR, capture_output=True, text=True)
+
+    if result.returncode != 0:
+        raise AssertionError(result.stderr)
+
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+class TestStartup(unittest.TestCase):
+
+    def test_listing_commands_do_not_import_media_packages(self):
+        self.assertEqual([], find_media_imports(LISTING_CODE))
+
+    def test_scenario_validation_does_not_import_media_packages(self):
+        self.assertEqual([], find_media_imports(VALIDATION_CODE))
@@ -0,0 +1,47 @@
+import unittest
+
+import numpy as np
+from moviepy.editor import ColorClip, CompositeVideoClip, VideoClip
+
+from videopy.clip.static import reuse_static_frames
+
+
+class TestStatic(unittest.TestCase):
+
+    def test_static_span_is_computed_once(self):
+        times = []
+
+        def make_frame(t):
+            times.append(t)
+
+            return np.full((4, 4, 3), int(t * 10), dtype=np.uint8)
+
+        source = VideoClip(make_frame, duration=3)
+        # The clip reads the first frame to find its size
+        times.clear()
+
+        clip = reuse_static_frames(source, [(0, 1), (2, 3)])
+
+        first = clip.get_frame(0)
+
+        for t in [0.25, 0.5, 0.75]:
+            self.assertIs(first, clip.get_frame(t))
+
+        self.assertEqual(15, clip.get_frame(1.5)[0, 0, 0])
+        self.assertEqual(25, clip.get_frame(2.1)[0, 0, 0])
+        self.assertEqual([0.5, 1.5, 2.5], times)
+
+    def test_frames_match_the_composited_ones(self):
+        background = ColorClip((8, 8), (255, 0, 0), duration=2)
+        block = ColorClip((4, 4), (0, 0, 255), duration=1).set_start(1)
+        composite = CompositeVideoClip([background, block])
+
+        clip = reuse_static_frames(composite, [(0, 1), (1, 2)])
+
+        for t in np.arange(0, 2, 0.1):
+            self.assertTrue(np.array_equal(composite.get_frame(t), clip.get_frame(t)))
+
+    def test_clip_without_static_spans_is_not_wrapped(self):
+        clip = ColorClip((8, 8), (255, 0, 0), duration=2)
+
+        self.assertIs(clip, reuse_static_frames(clip, [(1, 1)]))
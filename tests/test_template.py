@@ -1,11 +1,14 @@
 import unittest
 
+import simpleeval
+
+from plugins.core.params.expression import evaluate_expression, parse_expression
 from plugins.core.params.loop import LoopParamHandler
 from plugins.core.params.math import MathParamHandler
 from plugins.core.params.when import WhenParamHandler
 from videopy.hooks import Hooks
 from videopy.template import Template, HOOK_TEMPLATE_PARAM_PRE_HANDLER_REGISTER, \
-    HOOK_TEMPLATE_PARAM_POST_HANDLER_REGISTER
+    HOOK_TEMPLATE_PARAM_POST_HANDLER_REGISTER, compile_template
 
 
 class TestTemplate(unittest.TestCase):
@@ -37,6 +40,21 @@ class TestTemplate(unittest.TestCase):
             template.traverse_values(key["source"], vars=key["vars"])
             self.assertEqual(key["target"], key["source"])
 
+    def test_template_is_compiled_into_segments(self):
+        self.assertIsNone(compile_template("value"))
+        self.assertEqual(("value_", ("var1", ("var1",)), "_", ("frame.var2", ("frame", "var2"))),
+                         compile_template("value_{var1}_{ frame.var2 }"))
+        self.assertIs(compile_template("value_{var1}"), compile_template("value_" + "{var1}"))
+
+    def test_placeholders_resolving(self):
+        template = Template({}, Hooks())
+        vars = {"var1": 1, "frame": {"var2": "var2"}}
+
+        self.assertEqual("value", template.resolve_placeholders("value", vars))
+        self.assertEqual("1_var2", template.resolve_placeholders("{var1}_{ frame.var2 }", vars))
+        self.assertEqual("value_{{ missing }}", template.resolve_placeholders("value_{missing}", vars))
+        self.assertEqual("value_var1.key", template.resolve_placeholders("value_{var1.key}", vars))
+
     def test_loop_template_handler_and_variable_inheritance(self):
         scenario = self.__scenario()
         hooks = Hooks()
@@ -112,6 +130,61 @@ class TestTemplate(unittest.TestCase):
         }
         self.assertEqual(frame_0_effect_0_vars, scenario["frames"][0]["effects"][0]["vars"])
 
+    def test_loop_template_handler_expands_every_copy(self):
+        scenario = self.__scenario()
+        hooks = Hooks()
+
+        def register_loop_param_handler(params):
+            params["loop"] = LoopParamHandler()
+
+        hooks.register_hook(HOOK_TEMPLATE_PARAM_PRE_HANDLER_REGISTER, register_loop_param_handler)
+
+        Template(scenario, hooks).process()
+
+        for frame in scenario["frames"]:
+            self.assertEqual(2, len(frame["effects"]))
+            self.assertEqual(2, len(frame["blocks"]))
+
+            for block in frame["blocks"]:
+                self.assertEqual([0, 1], [effect["vars"]["loop_index"] for effect in block["effects"]])
+                self.assertTrue(all("loop" not in effect for effect in block["effects"]))
+
+    def test_loop_template_handler_shares_static_subtrees(self):
+        static = {"points": [[0, 1], [2, 3]]}
+        frame = {
+            "type": "dummy",
+            "configuration": {"file_path": "{image}", "static": static},
+            "blocks": [{"type": "dummy", "configuration": static, "vars": {"key": "value"}}],
+            "loop": [{"image": "1.jpg"}, {"image": "2.jpg"}],
+        }
+        scenario = {"frames": [frame]}
+
+        LoopParamHandler().handle(scenario["frames"], frame, frame["loop"])
+
+        first, second = scenario["frames"]
+
+        self.assertIsNot(first["configuration"], second["configuration"])
+        self.assertIsNot(first["blocks"][0], second["blocks"][0])
+        self.assertIsNot(first["blocks"][0]["vars"], second["blocks"][0]["vars"])
+        self.assertIs(static, first["configuration"]["static"])
+        self.assertIs(static, second["blocks"][0]["configuration"])
+        self.assertEqual({"image": "2.jpg", "loop_index": 1, "loop_total_elements": 2}, second["vars"])
+        self.assertNotIn("loop", second)
+
+    def test_keys_traversing_does_not_recurse(self):
+        scenario = {"frames": []}
+        nested = scenario["frames"]
+
+        for _ in range(5000):
+            nested.append({"blocks": []})
+            nested = nested[0]["blocks"]
+
+        nested.append({"when": "False"})
+
+        Template(scenario, Hooks()).traverse_keys(scenario, {"when": WhenParamHandler()})
+
+        self.assertEqual([], nested)
+
     def test_math_template_handler(self):
         scenario = self.__scenario()
         hooks = Hooks()
@@ -134,6 +207,16 @@ class TestTemplate(unittest.TestCase):
         self.assertEqual(scenario["frames"][0]["vars"]["math_mathvar1"], 4)
         self.assertEqual(scenario["frames"][0]["vars"]["math_mathvar2"], 8)
 
+    def test_expression_is_parsed_once(self):
+        node = parse_expression("loop_index * 2")
+
+        self.assertIs(node, parse_expression("loop_index * 2"))
+        self.assertEqual([0, 2, 4], [evaluate_expression("loop_index * 2", {"loop_index": index}) for index in range(3)])
+        self.assertEqual(True, evaluate_expression("value > 1 and True", {"value": 2}))
+
+        with self.assertRaises(simpleeval.NameNotDefined):
+            evaluate_expression("loop_index * 2", {})
+
     def test_when_template_handler(self):
         scenario = self.__scenario()
         hooks = Hooks()
@@ -152,6 +235,22 @@ class TestTemplate(unittest.TestCase):
 
         self.assertEqual(len(scenario["frames"]), 0)
 
+    def test_handlers_find_the_item_by_identity(self):
+        first, second = {"type": "dummy"}, {"type": "dummy"}
+        items = [first, second]
+
+        WhenParamHandler().handle(items, second, "1 > 2")
+
+        self.assertIs(first, items[0])
+        self.assertEqual(1, len(items))
+
+        second["loop"] = [{"key": 1}, {"key": 2}]
+        items = [first, second]
+        LoopParamHandler().handle(items, second, second["loop"], index=1)
+
+        self.assertIs(first, items[0])
+        self.assertEqual([None, 1, 2], [item.get("vars", {}).get("key") for item in items])
+
     @staticmethod
     def __scenario():
         return {
@@ -0,0 +1,78 @@
+import unittest
+
+from plugins.core.effects.blocks.text.typewrite import typewrite_clip
+from videopy.utils.text import render_text, find_font, normalize_font_name, _render_text
+
+
+class TestText(unittest.TestCase):
+
+    def test_same_text_is_rendered_only_once(self):
+        first = render_text("Cached text", "DejaVuSans", 20, [255, 255, 255])
+        hits = _render_text.cache_info().hits
+        second = render_text("Cached text", "DejaVuSans", 20.0, [255, 255, 255])
+
+        self.assertIs(first, second)
+        self.assertEqual(hits + 1, _render_text.cache_info().hits)
+
+    def test_rendered_text_is_read_only(self):
+        text = render_text("Read only", "DejaVuSans", 20, [255, 0, 0])
+
+        self.assertFalse(text.rgba.flags.writeable)
+        self.assertFalse(text.mask.flags.writeable)
+
+    def test_text_is_rendered_with_color(self):
+        text = render_text("I", "DejaVuSans", 40, [255, 0, 0])
+
+        visible = text.rgba[text.rgba[:, :, 3] == 255]
+
+        self.assertEqual((text.rgba.shape[1], text.rgba.shape[0]), text.size)
+        self.assertTrue(len(visible) > 0)
+        self.assertTrue((visible[:, :3] == [255, 0, 0]).all())
+
+    def test_multiline_text_is_taller(self):
+        single = render_text("Line", "DejaVuSans", 20, "black")
+        multiple = render_text("Line\nLine", "DejaVuSans", 20, "black")
+
+        self.assertEqual(single.size[0], multiple.size[0])
+        self.assertGreater(multiple.size[1], single.size[1] * 2)
+
+    def test_text_clip_has_mask(self):
+        text = render_text("Clip", "DejaVuSans", 20, "white")
+        clip = text.to_clip()
+
+        self.assertEqual(text.size, tuple(clip.size))
+        self.assertEqual(1.0, clip.mask.get_frame(0).max())
+
+    def test_unknown_font_falls_back_to_default_font(self):
+        self.assertIsNone(find_font("Unknown-Font-Name"))
+
+        text = render_text("Fallback", "Unknown-Font-Name", 20, "white")
+
+        self.assertGreater(text.size[0], 0)
+
+    def test_font_name_is_normalized(self):
+        self.assertEqual("robotobold", normalize_font_name("Roboto-Bold"))
+        self.assertEqual(normalize_font_name("Roboto Bold"), normalize_font_name("roboto_bold"))
+
+    def test_characters_are_revealed_in_order(self):
+        text = render_text("ab\ncd", "DejaVuSans", 20, "white")
+        offsets = text.get_character_offsets()
+
+        self.assertEqual(len(text.content) + 1, len(offsets))
+        self.assertEqual([0, 0, 0, 1, 1, 1], [line for line, _ in offsets])
+        self.assertLess(offsets[1][1], offsets[2][1])
+
+        self.assertEqual(0, text.get_reveal_mask(0).max())
+        self.assertLess(text.get_reveal_mask(1).sum(), text.get_reveal_mask(2).sum())
+        self.assertEqual(text.get_reveal_mask(2).sum(), text.get_reveal_mask(3).sum())
+        self.assertIs(text.mask, text.get_reveal_mask(len(text.content)))
+
+    def test_typewrite_clip_reveals_single_rasterized_text(self):
+        text = render_text("Typewrite", "DejaVuSans", 20, "white")
+        clip = typewrite_clip(text, 0.1).set_duration(1)
+
+        self.assertEqual(text.size, tuple(clip.size))
+        self.assertIs(text.rgb, clip.get_frame(0.5))
+        self.assertEqual(text.get_reveal_mask(1).sum(), clip.mask.get_frame(0).sum())
+        self.assertEqual(text.get_reveal_mask(3).sum(), clip.mask.get_frame(0.2).sum())
+        self.assertEqual(text.mask.sum(), clip.mask.get_frame(0.95).sum())
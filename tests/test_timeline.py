@@ -0,0 +1,124 @@
+import unittest
+from unittest.mock import patch
+
+from moviepy.editor import ColorClip, VideoClip
+
+from tests.utils.dummies import DummyBlock, DummyBlockEffect, DummyFrame, DummyFrameEffect, create_dummy_scenario
+from videopy.timeline import HOOK_PLANNER_PASSES, LAYER_BLOCK, LAYER_FRAME, Planner, Timeline
+from videopy.utils.time import Time
+
+
+class TestTimeline(unittest.TestCase):
+
+    def setUp(self):
+        self.scenario = create_dummy_scenario()
+
+    def add_frame(self, duration, frame_yml=None, animated=False, blocks=()):
+        frame = DummyFrame(Time(0, duration), self.scenario)
+        frame.animated = animated
+
+        for block in blocks:
+            frame.add_block(block(frame))
+
+        self.scenario.add_frame(frame, frame_yml)
+
+        return frame
+
+    def create_block(self, start, duration, position=("center", "center"), effects=(), audible=False):
+        def create(frame):
+            block = DummyBlock(Time(start, duration), list(position), frame)
+            block.animated = False
+            block.audible = audible
+
+            for effect_start, effect_duration, animated in effects:
+                effect = DummyBlockEffect("dummy", Time(effect_start, effect_duration))
+                effect.animated = animated
+                block.add_effect(effect)
+
+            return block
+
+        return create
+
+    def test_layers_are_placed_on_the_timeline(self):
+        self.add_frame(2)
+        frame = self.add_frame(3, blocks=[self.create_block(1, 1, effects=[(0.5, 0, False)])])
+        frame.add_effect(DummyFrameEffect("fadein", Time(0, 1)))
+
+        timeline = Timeline.from_scenario(self.scenario)
+
+        self.assertEqual(5, timeline.duration)
+        self.assertEqual([(LAYER_FRAME, 0, 2), (LAYER_FRAME, 2, 5), (LAYER_BLOCK, 3, 4)],
+                         [(layer.kind, layer.start, layer.end) for layer in timeline.layers])
+        self.assertEqual([(2, 3)], [(effect.start, effect.end) for effect in timeline.layers[1].effects])
+        self.assertEqual([(3.5, 4)], [(effect.start, effect.end) for effect in timeline.layers[2].effects])
+
+    def test_invisible_layers_are_dropped(self):
+        self.add_frame(0)
+        self.add_frame(2, blocks=[self.create_block(0, 1, position=(5000, 10)),
+                                  self.create_block(0, 1, position=(5000, 10), audible=True),
+                                  self.create_block(0, 1, position=("right", 10))])
+
+        plan = Planner().plan(Timeline.from_scenario(self.scenario))
+
+        self.assertTrue(plan.is_frame_dropped(0))
+        self.assertEqual(2, len(plan.dropped))
+        self.assertEqual(2, len(plan.get_block_layers(1)))
+
+        plan.apply(self.scenario)
+
+        self.assertEqual([True, False], [block.audible for block in self.scenario.frames[1].blocks])
+
+    def test_off_screen_blocks_moved_by_effects_are_kept(self):
+        self.add_frame(2, blocks=[self.create_block(0, 1, position=(5000, 10), effects=[(0, 1, True)]),
+                                  self.create_block(0, 1, position=(5000, 10), effects=[(0, 1, False)])])
+
+        plan = Planner().plan(Timeline.from_scenario(self.scenario))
+
+        self.assertEqual(1, len(plan.dropped))
+        self.assertEqual([True], [effect.animated for effect in plan.get_block_layers(0)[0].effects])
+
+    def test_identical_frames_are_merged(self):
+        frame_yml = {"type": "image", "configuration": {"file_path": "1.jpg"}}
+
+        self.add_frame(1, frame_yml)
+        self.add_frame(1, dict(frame_yml))
+        self.add_frame(1, dict(frame_yml))
+        self.add_frame(1, {"type": "image", "configuration": {"file_path": "2.jpg"}})
+        self.add_frame(1, dict(frame_yml), blocks=[self.create_block(0, 1, audible=True)])
+        self.add_frame(1)
+
+        plan = Planner().plan(Timeline.from_scenario(self.scenario))
+
+        self.assertEqual({1: 0, 2: 0}, plan.merged)
+
+    def test_static_spans_are_split_at_change_points(self):
+        self.add_frame(4, blocks=[self.create_block(1, 3, effects=[(0, 1, True), (0, 0, False)])])
+        self.add_frame(1, animated=True)
+
+        plan = Planner().plan(Timeline.from_scenario(self.scenario))
+
+        self.assertEqual([(0, 1, True), (1, 2, False), (2, 4, True), (4, 5, False)],
+                         [(span.start, span.end, span.static) for span in plan.spans])
+        self.assertEqual(3, plan.get_static_duration())
+
+    def test_passes_are_added_by_hook(self):
+        self.add_frame(1)
+        self.scenario.hooks.register_hook(HOOK_PLANNER_PASSES, lambda passes: passes.append(
+            lambda plan: plan.drop(plan.layers[0])))
+
+        with patch("videopy.scenario.Logger"):
+            plan = self.scenario.get_plan()
+
+        self.assertTrue(plan.is_frame_dropped(0))
+
+    def test_merged_frames_are_rendered_once(self):
+        for _ in range(3):
+            self.add_frame(1, {"type": "dummy"})
+
+        with patch.object(DummyFrame, "render", return_value=ColorClip((16, 16), (0, 0, 0), duration=1)) as render, \
+                patch.object(VideoClip, "write_videofile", autospec=True) as write_videofile, \
+                patch("videopy.scenario.Logger"):
+            self.scenario.render()
+
+        render.assert_called_once_with(0)
+        self.assertEqual(3, write_videofile.call_args[0][0].duration)
@@ -1,6 +1,7 @@
 import unittest
 from typer.testing import CliRunner
 from video import app
+from videopy.utils.logger import Logger
 
 runner = CliRunner()
 
@@ -53,3 +54,13 @@ class TestVideopy(unittest.TestCase):
 
         assert result.exit_code == 0
         assert "plugins.core.effects.blocks.text.background: Write text on a block." in result.stdout
+
+    def test_commands_restore_the_logger(self):
+        runner.invoke(app, ["frames", "plugins.core.frames.image"])
+
+        self.assertTrue(Logger.enabled)
+
+        result = runner.invoke(app, ["estimate", "--input-file", "missing.yml", "--json"])
+
+        self.assertNotEqual(0, result.exit_code)
+        self.assertTrue(Logger.enabled)
@@ -0,0 +1,60 @@
+import os
+import subprocess
+import tempfile
+import unittest
+
+import numpy as np
+from moviepy.config import get_setting
+from moviepy.editor import VideoFileClip
+
+from plugins.core.effects.frames.resize import Effect, find_decode_size
+from tests.utils.dummies import DummyFrame, create_dummy_scenario
+from videopy.clip.video import open_video
+from videopy.utils.image import RESIZE_CENTER_CROP, RESIZE_STRETCH, resize_array
+from videopy.utils.time import Time
+
+
+class TestVideoClip(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.video_path = os.path.join(cls.directory.name, "source.mp4")
+
+        subprocess.run([get_setting("FFMPEG_BINARY"), "-y", "-loglevel", "error", "-f", "lavfi",
+                        "-i", "testsrc=size=320x160:rate=10:duration=1", "-pix_fmt", "yuv420p", cls.video_path],
+                       check=True)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def assert_similar(self, expected, actual):
+        self.assertEqual(expected.shape, actual.shape)
+        self.assertLess(np.abs(expected.astype(int) - actual.astype(int)).mean(), 20)
+
+    def test_frames_are_decoded_in_target_size(self):
+        source = VideoFileClip(self.video_path, audio=False)
+        self.addCleanup(source.close)
+
+        for mode in [RESIZE_STRETCH, RESIZE_CENTER_CROP]:
+            clip = open_video(self.video_path, audio=False, size=(80, 80), mode=mode)
+            self.addCleanup(clip.close)
+
+            self.assertEqual((80, 80), tuple(clip.size))
+            self.assert_similar(resize_array(source.get_frame(0.5), (80, 80), mode), clip.get_frame(0.5))
+
+    def test_video_is_opened_in_source_size_without_target(self):
+        clip = open_video(self.video_path, audio=False)
+        self.addCleanup(clip.close)
+
+        self.assertEqual((320, 160), tuple(clip.size))
+
+    def test_decode_size_is_taken_from_resize_effect(self):
+        frame = DummyFrame(Time(0, 1), create_dummy_scenario())
+
+        self.assertIsNone(find_decode_size(frame))
+
+        frame.add_effect(Effect(Time(0, 0), {"mode": "center_crop"}))
+
+        self.assertEqual(((1920, 1080), RESIZE_CENTER_CROP), find_decode_size(frame))
@@ -0,0 +1,126 @@
+import os
+import tempfile
+import threading
+import unittest
+
+import numpy as np
+from moviepy.editor import ColorClip, VideoClip, VideoFileClip
+
+from videopy.writer import FrameBuffer, StreamingWriter
+
+
+class TestWriter(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def test_frame_buffer_returns_frames_in_order(self):
+        frames = FrameBuffer(2)
+
+        frames.put(1, "second")
+        frames.put(0, "first")
+
+        self.assertEqual("first", frames.get(0))
+        self.assertEqual("second", frames.get(1))
+
+    def test_frame_buffer_blocks_producer_when_full(self):
+        frames = FrameBuffer(2)
+        frames.put(0, "first")
+        frames.put(1, "second")
+
+        producer = threading.Thread(target=frames.put, args=(2, "third"))
+        producer.start()
+        producer.join(0.1)
+
+        self.assertTrue(producer.is_alive())
+
+        frames.get(0)
+        producer.join(1)
+
+        self.assertFalse(producer.is_alive())
+        self.assertEqual("second", frames.get(1))
+        self.assertEqual("third", frames.get(2))
+
+    def test_frame_buffer_raises_producer_error(self):
+        frames = FrameBuffer(2)
+        frames.fail(ValueError("Producer failed"))
+
+        self.assertFalse(frames.put(0, "first"))
+
+        with self.assertRaises(ValueError):
+            frames.get(0)
+
+    def test_clip_is_streamed_into_video_file(self):
+        output_path = os.path.join(self.directory.name, "output.mp4")
+        clip = ColorClip((32, 32), color=(255, 0, 0), duration=2)
+
+        StreamingWriter(clip, output_path, 10, producers=2, buffer_size=4).write()
+
+        video = VideoFileClip(output_path)
+        self.addCleanup(video.close)
+
+        self.assertAlmostEqual(2, video.duration, delta=0.2)
+        self.assertEqual([32, 32], video.size)
+        self.assertTrue(np.allclose([255, 0, 0], video.get_frame(1)[16, 16], atol=10))
+
+    def test_producer_error_is_raised(self):
+        def make_frame(t):
+            if t > 0.5:
+                raise RuntimeError("Frame failed")
+
+            return np.zeros((32, 32, 3))
+
+        clip = VideoClip(make_frame, duration=1)
+
+        with self.assertRaises(RuntimeError):
+            StreamingWriter(clip, os.path.join(self.directory.name, "output.mp4"), 10).write()
+
+    def test_frames_of_forked_producers_are_written_in_order(self):
+        last = {"index": None, "frame": None}
+
+        def make_frame(t):
+            # Stateful as the typewrite mask, every producer reads its own copy of the state
+            index = int(round(t * 10))
+
+            if index != last["index"]:
+                last["index"], last["frame"] = index, np.full((32, 32, 3), index * 10, dtype=np.uint8)
+
+            return last["frame"]
+
+        output_path = os.path.join(self.directory.name, "output.mp4")
+        StreamingWriter(VideoClip(make_frame, duration=2), output_path, 10, producers=3, buffer_size=4).write()
+
+        video = VideoFileClip(output_path)
+        self.addCleanup(video.close)
+
+        self.assertAlmostEqual(2, video.duration, delta=0.2)
+
+        for index in [0, 4, 5, 13, 19]:
+            self.assertAlmostEqual(index * 10, video.get_frame(index / 10)[16, 16, 0], delta=6)
+
+    def test_forked_producer_error_is_raised(self):
+        def make_frame(t):
+            if t > 0.5:
+                raise RuntimeError("Frame failed")
+
+            return np.zeros((32, 32, 3))
+
+        with self.assertRaisesRegex(RuntimeError, "Frame failed"):
+            StreamingWriter(VideoClip(make_frame, duration=1), os.path.join(self.directory.name, "output.mp4"), 10,
+                            producers=2).write()
+
+    def test_exited_producer_fails_the_write(self):
+        def make_frame(t):
+            if t > 0.5:
+                os._exit(1)
+
+            return np.zeros((32, 32, 3))
+
+        with self.assertRaisesRegex(IOError, "exited"):
+            StreamingWriter(VideoClip(make_frame, duration=1), os.path.join(self.directory.name, "output.mp4"), 10,
+                            producers=2).write()
+
+    def test_unknown_extension_is_rejected(self):
+        with self.assertRaises(ValueError):
+            StreamingWriter(ColorClip((32, 32), color=(0, 0, 0), duration=1), "output.unknown", 10)
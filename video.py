@@ -8,11 +8,13 @@ import typer
 from rich.table import Table
 from rich.console import Console
 from rich import print
+from rich.markup import escape
 
-from moviepy.editor import TextClip
-
+from videopy.batch import BatchRenderer, read_rows
 from videopy.hooks import Hooks
-from videopy.main import run_scenario
+from videopy.main import create_registry, estimate_scenario, load_scenario_yml, run_scenario
+from videopy.manifest import HOOK_MANIFEST_BUILD
+from videopy.server import serve as serve_jobs
 from videopy.utils.file import get_file_extension
 from videopy.utils.loader import Loader
 from videopy.utils.logger import Logger, LoggerProvider
@@ -33,6 +35,27 @@ __H_SCENARIO_NAME = "Provide scenario name from registry (added through plugins)
 __H_SCENARIO_FILE = "Provide file path containing scenario in yaml format"
 __H_SCENARIO_CONTENT = "Provide the scenario as json"
 __H_SCENARIO_DATA = "Data to pass to scenario"
+__H_WORKERS = "Number of processes rendering the frames in parallel"
+__H_CACHE_DIR = "Directory of the render cache, unchanged frames are reused from it"
+__H_STREAM = "Stream the frames directly into ffmpeg, producing the frames overlaps with encoding them"
+__H_PRODUCERS = "Number of processes producing the frames when streaming"
+__H_START = "Render only from this time (in seconds) of the scenario"
+__H_END = "Render only up to this time (in seconds) of the scenario"
+__H_FRAMES = "Comma separated indices of the frames to render, e.g. 0,3,4"
+__H_PREVIEW = "Render a preview, in half of the resolution, lower fps and with a fast encoder preset"
+__H_JSON = "Print the estimate as json"
+__H_MAX_CPU_SECONDS = "Fail if the estimated CPU time (in seconds) is over the limit"
+__H_MAX_MEMORY_MB = "Fail if the estimated peak memory (in megabytes) is over the limit"
+__H_PROFILE = "Profile the render and save it (in the speedscope format) to this path"
+__H_PROFILE_TOP = "Number of the slowest modules shown after the profiled render"
+__H_ROWS = "JSONL or CSV file with the data rows, the scenario is rendered once per row"
+__H_BATCH_WORKERS = "Number of processes rendering the rows in parallel"
+__H_MANIFEST = "Path of the JSONL file with the result of each row, defaults to <rows>.manifest.jsonl"
+__H_HOST = "Host the render server listens on"
+__H_PORT = "Port the render server listens on"
+__H_SOCKET = "Path of the Unix socket to listen on instead of the host and port"
+__H_CONCURRENCY = "Number of jobs rendered at once by the render server"
+__H_IDLE_MEDIA = "Number of video and audio readers kept open between the jobs by the render server"
 __H_FRAME_NAME = "Frame to show info about."
 __H_BLOCK_NAME = "Block to show info about."
 __H_EFFECT_NAME = "Effect to show info about."
@@ -45,20 +68,153 @@ def run(input_name: Annotated[str, typer.Option(help=__H_SCENARIO_NAME)] = None,
         input_file: Annotated[str, typer.Option(help=__H_SCENARIO_FILE)] = None,
         input_content: Annotated[str, typer.Option(help=__H_SCENARIO_CONTENT)] = None,
         data: Annotated[str, typer.Option(help=__H_SCENARIO_DATA)] = None,
+        workers: Annotated[int, typer.Option(help=__H_WORKERS)] = None,
+        cache_dir: Annotated[str, typer.Option(help=__H_CACHE_DIR)] = None,
+        stream: Annotated[bool, typer.Option(help=__H_STREAM)] = None,
+        producers: Annotated[int, typer.Option(help=__H_PRODUCERS)] = None,
+        start: Annotated[float, typer.Option(help=__H_START)] = None,
+        end: Annotated[float, typer.Option(help=__H_END)] = None,
+        frames: Annotated[str, typer.Option(help=__H_FRAMES)] = None,
+        preview: Annotated[bool, typer.Option(help=__H_PREVIEW)] = None,
+        profile: Annotated[str, typer.Option(help=__H_PROFILE)] = None,
+        profile_top: Annotated[int, typer.Option(help=__H_PROFILE_TOP)] = 20,
         ctx: typer.Context = typer.Context
         ):
     if input_name is None and input_file is None and data is None:
         typer.echo(ctx.get_help())
         raise typer.Exit()
 
+    profiler = None
+
+    if profile is not None:
+        from videopy.profiler import Profiler
+
+        profiler = Profiler()
+
     run_scenario(
         input_name=input_name,
         input_file=input_file,
         input_content=input_content,
         scenario_data=json.loads(data) if data else None,
         log_level="info",
+        workers=workers,
+        cache_dir=cache_dir,
+        stream=stream,
+        producers=producers,
+        time_range=(start or 0, end) if start is not None or end is not None else None,
+        frame_indices=[int(index) for index in frames.split(",")] if frames else None,
+        preview=preview,
+        profiler=profiler,
     )
 
+    if profiler is not None:
+        profiler.save(profile)
+
+        table = Table("Module", "Calls", "Self time", "Total time", "CPU time", "Megapixels",
+                      title=f"Slowest modules, the whole profile is saved to {profile}")
+
+        for record in profiler.get_top(profile_top):
+            table.add_row(escape(record.name), str(record.calls), f"{record.self_wall:.3f} s", f"{record.wall:.3f} s",
+                          f"{record.cpu:.3f} s", f"{record.pixels / 1000000:.1f}")
+
+        console.print(table)
+
+
+@app.command()
+def estimate(input_name: Annotated[str, typer.Option(help=__H_SCENARIO_NAME)] = None,
+             input_file: Annotated[str, typer.Option(help=__H_SCENARIO_FILE)] = None,
+             data: Annotated[str, typer.Option(help=__H_SCENARIO_DATA)] = None,
+             preview: Annotated[bool, typer.Option(help=__H_PREVIEW)] = None,
+             as_json: Annotated[bool, typer.Option("--json", help=__H_JSON)] = False,
+             max_cpu_seconds: Annotated[float, typer.Option(help=__H_MAX_CPU_SECONDS)] = None,
+             max_memory_mb: Annotated[float, typer.Option(help=__H_MAX_MEMORY_MB)] = None,
+             ctx: typer.Context = typer.Context
+             ):
+    """ Estimate the cost of rendering the scenario without rendering it. """
+    if input_name is None and input_file is None:
+        typer.echo(ctx.get_help())
+        raise typer.Exit()
+
+    # Logs would mix with the json on the output
+    enabled, Logger.enabled = Logger.enabled, Logger.enabled and not as_json
+
+    try:
+        result = estimate_scenario(
+            input_name=input_name,
+            input_file=input_file,
+            scenario_data=json.loads(data) if data else None,
+            log_level="info",
+            preview=preview,
+        )
+    finally:
+        Logger.enabled = enabled
+
+    peak_memory_mb = result.peak_memory / (1024 * 1024)
+
+    if as_json:
+        typer.echo(json.dumps(result.to_dict(), indent=2))
+    else:
+        table = Table("Estimate", "Value", show_lines=True)
+
+        table.add_row("Frames", str(result.frames))
+        table.add_row("Duration", f"{result.duration:.2f} s")
+        table.add_row("Size", f"{result.size[0]}x{result.size[1]}")
+        table.add_row("Layers per frame", ", ".join(f"{index}: {count}" for index, count in result.layers.items()))
+        table.add_row("Text rasterizations", str(result.text_rasterizations))
+        table.add_row("Decoded assets", str(result.decoded_assets))
+        table.add_row("CPU time", f"{result.cpu_seconds:.2f} s")
+        table.add_row("Peak memory", f"{peak_memory_mb:.0f} MB")
+
+        for module, seconds in sorted(result.modules.items(), key=lambda item: -item[1]):
+            table.add_row(module, f"{seconds:.2f} s")
+
+        console.print(table)
+
+    if max_cpu_seconds is not None and result.cpu_seconds > max_cpu_seconds:
+        Logger.error(f"Estimated CPU time <<{result.cpu_seconds:.2f}>> seconds is over the limit of "
+                     f"<<{max_cpu_seconds}>> seconds")
+        raise typer.Exit(code=1)
+
+    if max_memory_mb is not None and peak_memory_mb > max_memory_mb:
+        Logger.error(f"Estimated peak memory <<{peak_memory_mb:.0f}>> MB is over the limit of <<{max_memory_mb}>> MB")
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def batch(rows: Annotated[str, typer.Option(help=__H_ROWS)],
+          input_name: Annotated[str, typer.Option(help=__H_SCENARIO_NAME)] = None,
+          input_file: Annotated[str, typer.Option(help=__H_SCENARIO_FILE)] = None,
+          workers: Annotated[int, typer.Option(help=__H_BATCH_WORKERS)] = os.cpu_count() or 1,
+          manifest: Annotated[str, typer.Option(help=__H_MANIFEST)] = None,
+          ctx: typer.Context = typer.Context
+          ):
+    if input_name is None and input_file is None:
+        typer.echo(ctx.get_help())
+        raise typer.Exit()
+
+    hooks = Hooks()
+    registry = create_registry(hooks)
+    scenario_yml = load_scenario_yml(registry, input_name, input_file)
+
+    results = BatchRenderer(scenario_yml, read_rows(rows), hooks, registry, workers).render(
+        manifest or f"{rows}.manifest.jsonl")
+    failed = [result for result in results if result["status"] == "failed"]
+
+    Logger.info(f"Rendered <<{len(results) - len(failed)}>> of <<{len(results)}>> rows "
+                f"in <<{sum(result['elapsed'] for result in results):.2f}>> seconds of rendering")
+
+    if failed:
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def serve(host: Annotated[str, typer.Option(help=__H_HOST)] = "127.0.0.1",
+          port: Annotated[int, typer.Option(help=__H_PORT)] = 8000,
+          socket: Annotated[str, typer.Option(help=__H_SOCKET)] = None,
+          concurrency: Annotated[int, typer.Option(help=__H_CONCURRENCY)] = 1,
+          idle_media: Annotated[int, typer.Option(help=__H_IDLE_MEDIA)] = 8):
+    serve_jobs(host=host, port=port, socket_path=socket, concurrency=concurrency, idle_media=idle_media)
+
 
 @app.command()
 def scenarios(scenario_name: Annotated[str, typer.Argument(help=__H_SCENARIO_NAME)] = None):
@@ -144,9 +300,20 @@ def effects(effect_name: Annotated[str, typer.Argument(help=__H_EFFECT_NAME)] =
         __display_configuration_table("effects", effect_name)
 
 
+@app.command()
+def manifest():
+    """ Regenerate the manifests of the plugins, so the modules are imported only when used by the scenario. """
+    hooks = Hooks()
+
+    Loader.load_plugins(f"{absolute_path}/plugins", hooks)
+    hooks.run_hook(HOOK_MANIFEST_BUILD)
+
+
 @app.command()
 def helpers(helper_name: Annotated[str, typer.Argument(help="Helper to show info about.")]):
     if helper_name == "fonts":
+        from moviepy.editor import TextClip
+
         print(TextClip("fonts").list('font'))
 
     if helper_name == "examples":
@@ -214,38 +381,42 @@ def helpers(helper_name: Annotated[str, typer.Argument(help="Helper to show info
 
 
 def __display_configuration_table(module: str, concrete_module_name: str):
-    Logger.enabled = False
-    hooks = Hooks()
-    modules = {}
+    enabled, Logger.enabled = Logger.enabled, False
 
-    Loader.load_plugins(f"{absolute_path}/plugins", hooks)
-    hooks.run_hook(f"videopy.modules.{module}.register", modules)
-
-    if modules[concrete_module_name].get_configuration():
-        table = Table(
-            "Configuration",
-            "Description",
-            "Type",
-            "Required",
-            "Default Value",
-            show_lines=True,
-            title=f"{concrete_module_name}: {modules[concrete_module_name].get_description()}",
-            title_style="bold cyan"
-        )
+    try:
+        hooks = Hooks()
+        modules = {}
 
-        for key, value in modules[concrete_module_name].get_configuration().items():
-            default_value = str(value.get('default', 'None'))
-            table.add_row(
-                key,
-                value['description'],
-                value['type'],
-                "Yes" if value['required'] else "No",
-                default_value
+        Loader.load_plugins(f"{absolute_path}/plugins", hooks)
+        hooks.run_hook(f"videopy.modules.{module}.register", modules)
+
+        if modules[concrete_module_name].get_configuration():
+            table = Table(
+                "Configuration",
+                "Description",
+                "Type",
+                "Required",
+                "Default Value",
+                show_lines=True,
+                title=f"{concrete_module_name}: {modules[concrete_module_name].get_description()}",
+                title_style="bold cyan"
             )
 
-        console.print(table)
-    else:
-        console.print(f"No configuration found for {concrete_module_name}")
+            for key, value in modules[concrete_module_name].get_configuration().items():
+                default_value = str(value.get('default', 'None'))
+                table.add_row(
+                    key,
+                    value['description'],
+                    value['type'],
+                    "Yes" if value['required'] else "No",
+                    default_value
+                )
+
+            console.print(table)
+        else:
+            console.print(f"No configuration found for {concrete_module_name}")
+    finally:
+        Logger.enabled = enabled
 
 
 def __print_example_container(md_file, key, module):
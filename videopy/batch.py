@@ -0,0 +1,128 @@
+import copy
+import csv
+import json
+import multiprocessing
+import time
+
+from videopy.main import run_scenario, warm_up
+from videopy.utils.file import get_file_extension
+from videopy.utils.logger import Logger
+
+# Batch shared with the forked workers, the registry and the scenario are never pickled
+_batch = None
+
+
+def read_rows(path):
+    """ Read the data rows from the JSONL (one JSON object per line) or CSV (with the header) file. """
+    extension = get_file_extension(path)
+
+    with open(path, "r", newline="") as f:
+        if extension in ["jsonl", "ndjson"]:
+            rows = [json.loads(line) for line in f if line.strip()]
+        elif extension == "csv":
+            rows = list(csv.DictReader(f))
+        else:
+            raise ValueError(f"Data file format [{extension}] is not supported, use jsonl or csv")
+
+    for index, row in enumerate(rows):
+        if not isinstance(row, dict):
+            raise ValueError(f"Row {index} of [{path}] is not an object")
+
+    return rows
+
+
+class BatchRenderer:
+    """ Render the same scenario once for every data row.
+
+    Rows are rendered by a pool of forked processes which live for the whole batch, so the plugins, the media libraries
+    and the caches (fonts, rendered texts, loaded modules) are loaded once and shared by all the rows rendered by the
+    worker. Each row is passed to the scenario as its data and added to the scenario vars, so templated scenarios can
+    use the row values as placeholders (e.g. `output_path: outputs/{name}.mp4`).
+    """
+
+    def __init__(self, scenario_yml, rows, hooks, registry, workers=1, log_level="warn"):
+        self.scenario_yml = scenario_yml
+        self.rows = rows
+        self.hooks = hooks
+        self.registry = registry
+        self.workers = workers
+        self.log_level = log_level
+
+    @staticmethod
+    def is_supported():
+        return "fork" in multiprocessing.get_all_start_methods()
+
+    def render(self, manifest_path):
+        """ Render all the rows and write the result of each row (as soon as it is known) to the manifest.
+
+        :param manifest_path: Path of the JSONL file with one result per row.
+        :return: List of the results, in the order of the rows.
+        """
+        global _batch
+
+        pooled = self.workers > 1 and self.is_supported()
+
+        if self.workers > 1 and not pooled:
+            Logger.warn("Batch rendering in parallel is not supported on this platform, rendering in a single process")
+
+        Logger.info(f"Rendering <<{len(self.rows)}>> rows using <<{self.workers if pooled else 1}>> workers")
+
+        results = []
+
+        with open(manifest_path, "w") as manifest:
+            try:
+                _batch = self
+
+                if pooled:
+                    # Forked workers inherit the libraries imported here instead of importing them one by one
+                    warm_up()
+
+                    with multiprocessing.get_context("fork").Pool(processes=self.workers) as pool:
+                        self.__collect(pool.imap(render_row, range(len(self.rows))), manifest, results)
+                else:
+                    self.__collect(map(self.render_row, range(len(self.rows))), manifest, results)
+            finally:
+                _batch = None
+
+        output_paths = [result["output_path"] for result in results if result["output_path"] is not None]
+
+        if len(set(output_paths)) < len(output_paths):
+            Logger.warn("Some rows were rendered to the same output path, use the row values in <<output_path>>")
+
+        return results
+
+    def render_row(self, index):
+        row = self.rows[index]
+        scenario_yml = copy.deepcopy(self.scenario_yml)
+        scenario_yml["vars"] = {**scenario_yml.get("vars", {}), **row}
+        result = {"index": index, "status": "rendered", "output_path": None, "elapsed": 0, "error": None}
+
+        start = time.perf_counter()
+
+        try:
+            # Pool workers are daemons and can not start the segment workers
+            scenario_yml = run_scenario(input_content=scenario_yml, scenario_data=row, log_level=self.log_level,
+                                        workers=1 if self.workers > 1 else None,
+                                        hooks=self.hooks.copy(), registry=self.registry)
+            result["output_path"] = scenario_yml.get("output_path")
+        except Exception as e:
+            result["status"] = "failed"
+            result["error"] = str(e)
+
+        result["elapsed"] = time.perf_counter() - start
+
+        return result
+
+    def __collect(self, results, manifest, collected):
+        for result in results:
+            manifest.write(json.dumps(result) + "\n")
+            manifest.flush()
+
+            if result["status"] == "failed":
+                Logger.error(f"Row <<{result['index']}>> failed: {result['error']}")
+
+            collected.append(result)
+
+
+def render_row(index):
+    return _batch.render_row(index)
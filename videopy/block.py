@@ -1,14 +1,21 @@
 from abc import abstractmethod
 
 from videopy.clip.empty import EmptyClip
-from videopy.compilation import Compilation
+from videopy.compilation import Compilation, run_compiler
 from videopy.effect import AbstractBlockEffect
 from videopy.exception import NoneValueError, DurationNotMatchedError, InvalidTypeError
 from videopy.utils.logger import Logger
 from videopy.utils.time import Time
 
+HOOK_BLOCK_RENDER_BEFORE = "videopy.scenario.frame.block.render.before"
+HOOK_BLOCK_RENDER_AFTER = "videopy.scenario.frame.block.render.after"
+
 
 class AbstractBlock:
+    # Hints used by the render planner, see AbstractEffect
+    animated = True
+    audible = False
+
     def __init__(self, time: Time, position, frame):
         if not time.duration:
             raise ValueError("Block duration is required")
@@ -41,6 +48,14 @@ class AbstractBlock:
         pass
 
     def do_render(self):
+        hooks = self.frame.scenario.hooks
+        hooks.run_hook(HOOK_BLOCK_RENDER_BEFORE, self)
+        compilation = self.__render()
+        hooks.run_hook(HOOK_BLOCK_RENDER_AFTER, self, compilation)
+
+        return compilation
+
+    def __render(self):
         clip = None
 
         if not self.effects:
@@ -53,7 +68,7 @@ class AbstractBlock:
                 if not issubclass(type(compilation), Compilation):
                     raise InvalidTypeError(f"Effect of type [{effect.type}] did not return a compilation")
 
-                result = self.frame.scenario.registry.compilers[compilation.mode].compile(compilation)
+                result = run_compiler(self.frame.scenario, compilation, self, effect)
 
                 Logger.debug(f"Rendering <<effect>> of type <<{effect.type}>> "
                              f"on <<block>> of type <<{self.get_type()}>>")
@@ -0,0 +1,201 @@
+import functools
+import hashlib
+import importlib.util
+import json
+import os
+import shutil
+
+from videopy.utils.file import get_file_extension
+from videopy.utils.logger import Logger
+
+# Bump when the layout of the cached segments or the way they are rendered changes
+CACHE_VERSION = 2
+
+VIDEOPY_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class RenderCache:
+
+    def __init__(self, directory):
+        self.directory = directory
+
+        os.makedirs(directory, exist_ok=True)
+
+    def get_key(self, frame_yml, scenario):
+        """ Compute the key of the rendered frame segment.
+
+        The key is a hash of the templated frame yml, the sources of videopy and of every plugin whose modules are
+        referenced by the frame (the whole plugin, so the helpers of the modules are included too), the size, mtime of
+        the assets used by the frame and the output settings of the scenario, including the encoder options (e.g. the
+        preset), the writer and the audio codec of the segment.
+
+        :param frame_yml: Frame definition after the template was processed.
+        :param scenario: Scenario the frame belongs to.
+        :return: Hex digest identifying the rendered segment.
+        """
+        from videopy.writer import get_audio_codec
+
+        extension = get_file_extension(scenario.output_path)
+        data = {
+            "version": CACHE_VERSION,
+            "videopy": get_directory_digest(VIDEOPY_DIR),
+            "frame": frame_yml,
+            "plugins": get_plugin_digests(find_types(frame_yml)),
+            "assets": {path: get_asset_stamp(path) for path in sorted(find_assets(frame_yml))},
+            "size": scenario.size,
+            "fps": scenario.fps,
+            "format": extension,
+            "encoder": scenario.get_encoder_options(),
+            "stream": scenario.stream,
+            "audio_codec": get_audio_codec(extension),
+        }
+
+        serialized = json.dumps(data, sort_keys=True, default=str)
+
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+    def get(self, key, extension):
+        """ Find the cached segment.
+
+        :return: Tuple of the segment path and information whether the segment plays any audio or None if the segment
+                 is not cached.
+        """
+        path, metadata_path = self.__get_paths(key, extension)
+
+        if not os.path.isfile(path) or not os.path.isfile(metadata_path):
+            return None
+
+        with open(metadata_path) as f:
+            metadata = json.load(f)
+
+        return path, metadata["audio"]
+
+    def put(self, key, segment_path, audio):
+        """ Store the rendered segment in the cache.
+
+        :return: Path of the cached segment.
+        """
+        path, metadata_path = self.__get_paths(key, get_file_extension(segment_path))
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # Files are moved into place only when complete, so interrupted runs never leave broken entries behind
+        shutil.copyfile(segment_path, f"{path}.tmp")
+        os.replace(f"{path}.tmp", path)
+
+        with open(f"{metadata_path}.tmp", "w") as f:
+            json.dump({"audio": audio}, f)
+        os.replace(f"{metadata_path}.tmp", metadata_path)
+
+        Logger.trace(f"Stored segment <<{key}>> in cache")
+
+        return path
+
+    def __get_paths(self, key, extension):
+        base_path = os.path.join(self.directory, key[:2], key)
+
+        return f"{base_path}.{extension}", f"{base_path}.json"
+
+
+def find_types(value):
+    types = set()
+
+    if isinstance(value, dict):
+        if isinstance(value.get("type"), str):
+            types.add(value["type"])
+
+        for item in value.values():
+            types |= find_types(item)
+    elif isinstance(value, list):
+        for item in value:
+            types |= find_types(item)
+
+    return types
+
+
+def find_assets(value):
+    assets = set()
+
+    if isinstance(value, dict):
+        for item in value.values():
+            assets |= find_assets(item)
+    elif isinstance(value, list):
+        for item in value:
+            assets |= find_assets(item)
+    elif isinstance(value, str) and os.path.isfile(value):
+        assets.add(value)
+
+    return assets
+
+
+def get_asset_stamp(path):
+    stat = os.stat(path)
+
+    return stat.st_size, stat.st_mtime_ns
+
+
+def get_plugin_digests(modules):
+    """ Hash the sources of the plugins the modules belong to.
+
+    :return: Dictionary of the digests by the plugin directory, modules which can not be found are hashed as None.
+    """
+    paths = {module: get_plugin_directory(module) for module in modules}
+    digests = {path: get_source_digest(path) for path in set(paths.values()) if path is not None}
+    digests.update({module: None for module, path in paths.items() if path is None})
+
+    return dict(sorted(digests.items()))
+
+
+@functools.lru_cache(maxsize=None)
+def get_plugin_directory(module):
+    """ Find the directory of the plugin (the one with the plugin.py, see Loader.load_plugins) the module belongs to.
+
+    Modules outside of any plugin are hashed with their top-level package, or on their own if they are not in a
+    package.
+    """
+    try:
+        spec = importlib.util.find_spec(module)
+    except (ImportError, ValueError):
+        spec = None
+
+    if spec is None or spec.origin is None or not os.path.isfile(spec.origin):
+        return None
+
+    path = os.path.abspath(spec.origin)
+
+    # Packages of the plugins may be namespace packages, the parents are found by the name of the module
+    for _ in module.split(".")[1:] if os.path.basename(path) != "__init__.py" else module.split("."):
+        path = os.path.dirname(path)
+
+        if os.path.isfile(os.path.join(path, "plugin.py")):
+            return path
+
+    return path
+
+
+def get_source_digest(path):
+    if os.path.isdir(path):
+        return get_directory_digest(path)
+
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def get_directory_digest(directory):
+    digest = hashlib.sha256()
+
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+
+        for file in sorted(files):
+            if not file.endswith(".py"):
+                continue
+
+            path = os.path.join(root, file)
+            digest.update(os.path.relpath(path, directory).encode("utf-8"))
+
+            with open(path, "rb") as f:
+                digest.update(f.read())
+
+    return digest.hexdigest()
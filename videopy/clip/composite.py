@@ -0,0 +1,36 @@
+def compose_layers(layers):
+    """ Blend all layers of a frame in a single composite clip.
+
+    The first layer is the frame clip, every next layer is stacked on top of the previous ones. Using one
+    composite (instead of wrapping each layer in a new one) means every output frame is blended in a single pass.
+
+    :param layers: List of clips, the first one is the frame clip.
+    :return: The composed clip (or the frame clip itself if there is nothing to compose).
+    """
+    if len(layers) == 1:
+        return layers[0]
+
+    from moviepy.audio.AudioClip import CompositeAudioClip
+    from moviepy.video.compositing.CompositeVideoClip import CompositeVideoClip
+
+    background = layers[0]
+
+    if background.mask is not None:
+        return CompositeVideoClip(layers)
+
+    # Opaque frame clip can be used directly as the background, so neither the background nor the mask composite
+    # needs to be blended on every output frame
+    composite = CompositeVideoClip(layers, use_bgclip=True)
+    ends = [layer.end for layer in layers]
+
+    if None not in ends:
+        composite = composite.set_duration(max(ends))
+
+    # Background is not one of the composed clips, moviepy takes the audio of the blocks only. The audio is shifted to
+    # the start of its layer, the same way as moviepy does it
+    audio = [layer.audio.set_start(layer.start) for layer in layers if layer.audio is not None]
+
+    if audio and background.audio is not None:
+        composite = composite.set_audio(CompositeAudioClip(audio).set_duration(composite.duration))
+
+    return composite
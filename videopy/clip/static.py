@@ -0,0 +1,38 @@
+import bisect
+import threading
+
+
+def reuse_static_frames(clip, spans):
+    """ Compute the picture of each static span only once and return the same buffer for every frame in it.
+
+    Static spans come from the render plan, nothing changes on the screen in them, so compositing every output frame
+    would only produce the same pixels again.
+
+    :param clip: Clip to wrap, usually the whole rendered video.
+    :param spans: List of (start, end) tuples in the time of the clip, sorted and not overlapping.
+    :return: The clip reading the static spans from the cache, or the clip itself if there are no static spans.
+    """
+    spans = [(start, end) for start, end in spans if end > start]
+
+    if not spans:
+        return clip
+
+    starts = [start for start, _ in spans]
+    cache = {"span": None, "frame": None}
+    lock = threading.Lock()
+
+    def get_frame(get_frame, t):
+        index = bisect.bisect_right(starts, t) - 1
+
+        if index < 0 or t >= spans[index][1]:
+            return get_frame(t)
+
+        with lock:
+            if cache["span"] != index:
+                start, end = spans[index]
+                # Middle of the span is safely away from the layers appearing or disappearing at its edges
+                cache["span"], cache["frame"] = index, get_frame((start + end) / 2)
+
+            return cache["frame"]
+
+    return clip.fl(get_frame)
@@ -0,0 +1,85 @@
+import os
+import subprocess as sp
+
+from moviepy.audio.io.AudioFileClip import AudioFileClip
+from moviepy.config import get_setting
+from moviepy.video.VideoClip import VideoClip
+from moviepy.video.io.VideoFileClip import VideoFileClip
+from moviepy.video.io.ffmpeg_reader import FFMPEG_VideoReader
+
+from videopy.utils.image import RESIZE_CENTER_CROP, RESIZE_STRETCH
+
+
+class ScaledVideoReader(FFMPEG_VideoReader):
+    """ Reader scaling (and cropping) the frames in ffmpeg, so they are decoded straight into the output size.
+
+    Same as the moviepy reader, except for the video filter passed to ffmpeg.
+    """
+
+    def __init__(self, filename, size, mode=RESIZE_STRETCH, **kwargs):
+        self.mode = mode
+
+        # The reader uses the target resolution as the size of the frames read from the pipe
+        super().__init__(filename, target_resolution=(size[1], size[0]), **kwargs)
+
+    def get_video_filter(self):
+        width, height = self.size
+
+        if self.mode == RESIZE_STRETCH:
+            return f"scale={width}:{height}"
+
+        if self.mode == RESIZE_CENTER_CROP:
+            return f"scale={width}:{height}:force_original_aspect_ratio=increase,crop={width}:{height}"
+
+        raise ValueError(f"Unknown resize mode [{self.mode}]")
+
+    def initialize(self, starttime=0):
+        self.close()
+
+        if starttime != 0:
+            offset = min(1, starttime)
+            i_arg = ["-ss", "%.06f" % (starttime - offset), "-i", self.filename, "-ss", "%.06f" % offset]
+        else:
+            i_arg = ["-i", self.filename]
+
+        cmd = ([get_setting("FFMPEG_BINARY")] + i_arg +
+               ["-loglevel", "error",
+                "-f", "image2pipe",
+                "-vf", self.get_video_filter(),
+                "-sws_flags", self.resize_algo,
+                "-pix_fmt", self.pix_fmt,
+                "-vcodec", "rawvideo", "-"])
+        popen_params = {"bufsize": self.bufsize, "stdout": sp.PIPE, "stderr": sp.PIPE, "stdin": sp.DEVNULL}
+
+        if os.name == "nt":
+            popen_params["creationflags"] = 0x08000000
+
+        self.proc = sp.Popen(cmd, **popen_params)
+
+
+class ScaledVideoFileClip(VideoFileClip):
+    """ VideoFileClip reading the frames already scaled to the given size, see ScaledVideoReader. """
+
+    def __init__(self, filename, size, mode=RESIZE_STRETCH, audio=True, resize_algorithm="bicubic"):
+        VideoClip.__init__(self)
+
+        self.reader = ScaledVideoReader(filename, size, mode, resize_algo=resize_algorithm)
+
+        self.duration = self.reader.duration
+        self.end = self.reader.duration
+        self.fps = self.reader.fps
+        self.size = self.reader.size
+        self.rotation = self.reader.rotation
+        self.filename = self.reader.filename
+        self.make_frame = lambda t: self.reader.get_frame(t)
+
+        if audio and self.reader.infos["audio_found"]:
+            self.audio = AudioFileClip(filename)
+
+
+def open_video(filename, audio=True, size=None, mode=RESIZE_STRETCH):
+    """ Open the video file, decoded in the given size if it is known up front (e.g. the size of the scenario). """
+    if size is None:
+        return VideoFileClip(filename=filename, audio=audio)
+
+    return ScaledVideoFileClip(filename, size, mode, audio=audio)
@@ -1,5 +1,8 @@
 from abc import abstractmethod
 
+HOOK_COMPILE_BEFORE = "videopy.scenario.compile.before"
+HOOK_COMPILE_AFTER = "videopy.scenario.compile.after"
+
 
 class Compilation:
 
@@ -18,3 +21,16 @@ class AbstractCompiler:
     @abstractmethod
     def compile(self, compilation):
         pass
+
+
+def run_compiler(scenario, compilation, owner, module):
+    """ Compile the compilation of the module (effect or block) with the compiler of its mode.
+
+    :param owner: Frame or block the module is rendered on.
+    :param module: Effect or block which returned the compilation.
+    """
+    scenario.hooks.run_hook(HOOK_COMPILE_BEFORE, owner, module, compilation)
+    result = scenario.registry.compilers[compilation.mode].compile(compilation)
+    scenario.hooks.run_hook(HOOK_COMPILE_AFTER, owner, module, compilation, result)
+
+    return result
@@ -4,6 +4,11 @@ from videopy.utils.time import Time
 
 
 class AbstractEffect:
+    # Hints used by the render planner: whether the effect changes the picture during its time (False if it only shows
+    # a still image) and whether it plays any audio
+    animated = True
+    audible = False
+
     def __init__(self, effect_type, time):
         if effect_type is None:
             raise ValueError("Effect name is required")
@@ -0,0 +1,227 @@
+import math
+
+from videopy.cache import find_assets
+from videopy.timeline import LAYER_BLOCK, LAYER_FRAME
+
+HOOK_COST_MODEL = "videopy.estimate.cost_model"
+
+# Calibrated on a 1280x720 slideshow with text blocks, see the "Render cost estimate" section of the README
+ENCODE_SECONDS_PER_MEGAPIXEL = 0.031
+COMPOSE_SECONDS_PER_MEGAPIXEL = 0.027
+DECODE_SECONDS_PER_MEGAPIXEL = 0.033
+TEXT_SECONDS = 0.002
+BASE_MEMORY = 80 * 1024 * 1024
+
+# Encoding time of the x264 presets relative to the default (medium) one
+PRESET_FACTORS = {
+    "ultrafast": 0.3,
+    "superfast": 0.4,
+    "veryfast": 0.5,
+    "faster": 0.7,
+    "fast": 0.85,
+    "medium": 1,
+    "slow": 1.5,
+    "slower": 2.5,
+    "veryslow": 5,
+}
+
+# Frames queued between the producers and ffmpeg when streaming, moviepy keeps only a few of them otherwise
+STREAM_FRAME_BUFFERS = 32
+FRAME_BUFFERS = 4
+
+BYTES_PER_PIXEL = 3
+MEGAPIXEL = 1000 * 1000
+
+
+class ModuleCost:
+    """ Cost of a single layer (or effect) created by the module.
+
+    - `setup` is paid once, in seconds.
+    - `per_frame` is paid for every frame the layer is composed on, in seconds per megapixel of the output.
+    - `memory` is held while the frame of the layer is rendered, in bytes per megapixel of the output.
+    """
+
+    def __init__(self, setup=0, per_frame=COMPOSE_SECONDS_PER_MEGAPIXEL, memory=BYTES_PER_PIXEL * MEGAPIXEL):
+        self.setup = setup
+        self.per_frame = per_frame
+        self.memory = memory
+
+    def __repr__(self):
+        return f"ModuleCost(setup={self.setup}, per_frame={self.per_frame}, memory={self.memory})"
+
+
+DEFAULT_FRAME_COST = ModuleCost()
+DEFAULT_BLOCK_COST = ModuleCost()
+DEFAULT_EFFECT_COST = ModuleCost(memory=0)
+
+COST_MODEL = {
+    # Video frames decode every frame, the reader scales them to the size of the scenario while decoding
+    "plugins.core.frames.video": ModuleCost(per_frame=COMPOSE_SECONDS_PER_MEGAPIXEL + DECODE_SECONDS_PER_MEGAPIXEL),
+    "plugins.core.blocks.audio": ModuleCost(per_frame=0, memory=0),
+    "plugins.core.effects.frames.audio": ModuleCost(per_frame=0),
+    "plugins.core.effects.blocks.audio.play": ModuleCost(per_frame=0),
+    # Resizing of the frame is done once, on the decoded image
+    "plugins.core.effects.frames.resize": ModuleCost(setup=DECODE_SECONDS_PER_MEGAPIXEL, per_frame=0),
+}
+
+
+class Estimate:
+    """ Estimated cost of rendering the scenario. """
+
+    def __init__(self):
+        self.frames = 0
+        self.duration = 0
+        self.size = (0, 0)
+        self.layers = {}
+        self.text_rasterizations = 0
+        self.decoded_assets = 0
+        self.cpu_seconds = 0
+        self.peak_memory = 0
+        self.modules = {}
+
+    def add_module_cost(self, module, seconds):
+        self.modules[module] = self.modules.get(module, 0) + seconds
+        self.cpu_seconds += seconds
+
+    def to_dict(self):
+        return {
+            "frames": self.frames,
+            "duration": self.duration,
+            "size": list(self.size),
+            "layers": {str(index): count for index, count in self.layers.items()},
+            "text_rasterizations": self.text_rasterizations,
+            "decoded_assets": self.decoded_assets,
+            "cpu_seconds": round(self.cpu_seconds, 3),
+            "peak_memory": self.peak_memory,
+            "modules": {module: round(seconds, 3) for module, seconds in self.modules.items()},
+        }
+
+
+class Estimator:
+    """ Estimate the CPU time and the peak memory of rendering the scenario, without rendering any pixels.
+
+    The scenario has to be built (see `Renderer.build`), the estimate follows its render plan: dropped layers cost
+    nothing, merged frames are only encoded and static spans are composed once.
+    """
+
+    def __init__(self, scenario, cost_model=None):
+        self.scenario = scenario
+
+        if cost_model is None:
+            cost_model = dict(COST_MODEL)
+            scenario.hooks.run_hook(HOOK_COST_MODEL, cost_model)
+
+        self.cost_model = cost_model
+
+    def get_cost(self, module, default):
+        return self.cost_model.get(module, default)
+
+    def estimate(self):
+        scenario = self.scenario
+        plan = scenario.get_plan()
+        selected = [index for index, _ in scenario.get_selected_frames() if not plan.is_frame_dropped(index)]
+        megapixels = scenario.size[0] * scenario.size[1] / MEGAPIXEL
+
+        estimate = Estimate()
+        estimate.size = scenario.size
+        frame_memory = 0
+
+        for frame_layer in plan.get_frame_layers():
+            if frame_layer.frame_index not in selected:
+                continue
+
+            block_layers = plan.get_block_layers(frame_layer.frame_index)
+            estimate.layers[frame_layer.frame_index] = 1 + len(block_layers)
+            estimate.duration += frame_layer.duration
+            estimate.frames += self.get_frame_count(frame_layer.duration)
+
+            if frame_layer.frame_index in plan.merged:
+                continue
+
+            composed_frames = self.get_composed_frame_count(plan, frame_layer)
+            memory = 0
+
+            for layer in [frame_layer] + block_layers:
+                default = DEFAULT_FRAME_COST if layer.kind == LAYER_FRAME else DEFAULT_BLOCK_COST
+                cost = self.get_cost(layer.module, default)
+                memory += cost.memory * megapixels
+
+                estimate.add_module_cost(layer.module, cost.setup + cost.per_frame * megapixels * composed_frames)
+
+                for effect in layer.effects:
+                    effect_cost = self.get_cost(effect.module, DEFAULT_EFFECT_COST)
+                    # Effects which do not animate change the picture once, it is static afterwards
+                    effect_frames = self.get_frame_count(effect.end - effect.start) if effect.animated else 0
+                    memory += effect_cost.memory * megapixels
+
+                    estimate.add_module_cost(effect.module,
+                                             effect_cost.setup + effect_cost.per_frame * megapixels * effect_frames)
+
+            frame_memory = max(frame_memory, memory)
+
+        rasterizations = self.get_text_rasterizations(plan, selected)
+        estimate.text_rasterizations = len(rasterizations)
+
+        for module in rasterizations.values():
+            estimate.add_module_cost(module, TEXT_SECONDS)
+
+        assets = find_assets([scenario.frames_yml[index] for index in selected])
+        estimate.decoded_assets = len(assets)
+        asset_memory = 0
+
+        for path in sorted(assets):
+            size = get_image_size(path)
+
+            if size is not None:
+                asset_megapixels = size[0] * size[1] / MEGAPIXEL
+                asset_memory += size[0] * size[1] * BYTES_PER_PIXEL
+
+                estimate.add_module_cost("assets", DECODE_SECONDS_PER_MEGAPIXEL * asset_megapixels)
+
+        estimate.add_module_cost("encoder", ENCODE_SECONDS_PER_MEGAPIXEL * megapixels * estimate.frames *
+                                 PRESET_FACTORS.get(scenario.preset, 1))
+
+        buffers = STREAM_FRAME_BUFFERS if scenario.stream else FRAME_BUFFERS
+        workers = max(scenario.workers, 1)
+        # Every worker process loads the libraries and the assets of its frames on its own
+        estimate.peak_memory = int((BASE_MEMORY + asset_memory + frame_memory) * workers +
+                                   buffers * megapixels * MEGAPIXEL * BYTES_PER_PIXEL)
+
+        return estimate
+
+    def get_frame_count(self, duration):
+        return int(math.ceil(duration * self.scenario.fps))
+
+    def get_composed_frame_count(self, plan, frame_layer):
+        """ Count the frames composed for the frame, each static span is composed only once. """
+        static_spans = plan.get_static_spans(frame_layer.frame_index)
+        static_duration = sum(end - start for start, end in static_spans)
+
+        return self.get_frame_count(frame_layer.duration - static_duration) + len(static_spans)
+
+    @staticmethod
+    def get_text_rasterizations(plan, selected):
+        """ Find the unique texts to rasterize, the same text is rendered only once (see `render_text`). """
+        rasterizations = {}
+
+        for layer in plan.layers:
+            if layer.kind != LAYER_BLOCK or layer.frame_index not in selected or layer.type != "text":
+                continue
+
+            configuration = getattr(layer.source, "configuration", {})
+            key = tuple(str(configuration.get(name)) for name in ["content", "font", "size", "color"])
+
+            rasterizations.setdefault(key, layer.module)
+
+        return rasterizations
+
+
+def get_image_size(path):
+    """ Read the size of the image from its header, None if the file is not an image (e.g. a video or an audio). """
+    from PIL import Image, UnidentifiedImageError
+
+    try:
+        with Image.open(path) as image:
+            return image.size
+    except (UnidentifiedImageError, OSError):
+        return None
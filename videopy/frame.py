@@ -1,15 +1,22 @@
-from moviepy.editor import CompositeVideoClip
 from abc import abstractmethod
 
+from videopy.clip.composite import compose_layers
 from videopy.clip.empty import EmptyClip
-from videopy.compilation import Compilation
+from videopy.compilation import Compilation, run_compiler
 from videopy.effect import AbstractFrameEffect
 from videopy.exception import DurationNotMatchedError, NoneValueError, InvalidTypeError
 from videopy.utils.logger import Logger
 from videopy.utils.time import Time
 
+HOOK_FRAME_RENDER_BEFORE = "videopy.scenario.frame.render.before"
+HOOK_FRAME_RENDER_AFTER = "videopy.scenario.frame.render.after"
+
 
 class AbstractFrame:
+    # Hints used by the render planner, see AbstractEffect
+    animated = True
+    audible = False
+
     def __init__(self, time, scenario):
         if not isinstance(time, Time):
             raise ValueError("Step duration is required")
@@ -51,6 +58,13 @@ class AbstractFrame:
         self.effects.append(effect)
 
     def do_render(self, relative_start_time):
+        self.scenario.hooks.run_hook(HOOK_FRAME_RENDER_BEFORE, self)
+        clip = self.__render(relative_start_time)
+        self.scenario.hooks.run_hook(HOOK_FRAME_RENDER_AFTER, self, clip)
+
+        return clip
+
+    def __render(self, relative_start_time):
         frame_clip = self.render(relative_start_time)
 
         self.clip = frame_clip
@@ -69,7 +83,7 @@ class AbstractFrame:
                 if not issubclass(type(compilation), Compilation):
                     raise InvalidTypeError(f"Effect of type [{effect.type}] did not return a compilation")
 
-                result = self.scenario.registry.compilers[compilation.mode].compile(compilation)
+                result = run_compiler(self.scenario, compilation, self, effect)
 
                 if result is None:
                     raise NoneValueError(f"Effect of type [{effect.type}] did not return a clip")
@@ -83,6 +97,8 @@ class AbstractFrame:
             else:
                 raise InvalidTypeError(f"Trying to use effect of type [{effect.type}] on frame")
 
+        layers = [frame_clip]
+
         for block in self.blocks:
             Logger.debug(f"Rendering <<block>> of type <<{block.get_type()}>>")
             compilation = block.do_render()
@@ -90,7 +106,7 @@ class AbstractFrame:
             if not issubclass(type(compilation), Compilation):
                 raise InvalidTypeError(f"Block of type [{block.get_type()}] did not return a compilation")
 
-            result = self.scenario.registry.compilers[compilation.mode].compile(compilation)
+            result = run_compiler(self.scenario, compilation, self, block)
 
             if result is None:
                 raise NoneValueError(f"Block of type [{block.get_type()}] did not return a clip")
@@ -100,9 +116,9 @@ class AbstractFrame:
                 raise DurationNotMatchedError(f"Block duration [{result.duration}] does not match "
                                               f"the clip duration [{block.time.duration}]")
 
-            frame_clip = CompositeVideoClip([frame_clip, result])
+            layers.append(result)
 
-        return frame_clip
+        return compose_layers(layers)
 
 
 class AbstractFrameFactory:
@@ -10,6 +10,12 @@ class Hooks:
             self._hooks[event] = []
         self._hooks[event].append(function)
 
+    def copy(self):
+        hooks = Hooks()
+        hooks._hooks = {event: list(functions) for event, functions in self._hooks.items()}
+
+        return hooks
+
     def run_hook(self, event, *args, **kwargs):
         if event in self._hooks:
             for function in self._hooks[event]:
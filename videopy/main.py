@@ -16,23 +16,11 @@ HOOK_FILE_LOADERS_REGISTER = "videopy.modules.file_loaders.register"
 HOOK_COMPILERS_REGISTER = "videopy.modules.compilers.register"
 
 
-def run_scenario(
-        input_name: str = None,
-        input_file: str = None,
-        input_content: dict = None,
-        scenario_data=None,
-        log_level: str = "info",
-):
-    Logger.set_level(log_level)
-
-    if input_file is None and input_name is None and input_content is None:
-        raise ValueError("You need to provide one of: input_file, input_name, input_content")
-
-    hooks = Hooks()
+def create_registry(hooks, plugins_dir="plugins"):
+    """ Load the plugins and register their modules, nothing is rendered (or imported for rendering) yet. """
     registry = Registry()
-    scenario_yml = None
 
-    Loader.load_plugins("plugins", hooks)
+    Loader.load_plugins(plugins_dir, hooks)
 
     frames = {}
     hooks.run_hook(HOOK_FRAMES_REGISTER, frames)
@@ -64,6 +52,12 @@ def run_scenario(
     for key, scenario in scenarios.items():
         registry.add_scenario(key, scenario)
 
+    return registry
+
+
+def load_scenario_yml(registry, input_name=None, input_file=None, input_content=None):
+    scenario_yml = None
+
     if input_name is not None:
         Logger.debug(f"Loading scenario by name: <<{input_name}>>")
 
@@ -87,6 +81,94 @@ def run_scenario(
     if scenario_yml is None:
         raise ValueError("Scenario not found")
 
+    return scenario_yml
+
+
+def warm_up():
+    """ Import the media libraries and find the fonts up front.
+
+    Used by the long-running processes before they start rendering, forked workers inherit everything loaded here.
+    """
+    from moviepy import editor  # noqa: F401
+
+    from videopy.utils.text import get_font_files
+
+    get_font_files()
+
+
+def run_scenario(
+        input_name: str = None,
+        input_file: str = None,
+        input_content: dict = None,
+        scenario_data=None,
+        log_level: str = "info",
+        workers: int = None,
+        cache_dir: str = None,
+        stream: bool = None,
+        producers: int = None,
+        time_range: tuple = None,
+        frame_indices: list = None,
+        preview: bool = None,
+        hooks: Hooks = None,
+        registry: Registry = None,
+        profiler=None,
+):
+    # Long running processes (the render server) set the level once for all jobs and pass None
+    if log_level is not None:
+        Logger.set_level(log_level)
+
+    if input_file is None and input_name is None and input_content is None:
+        raise ValueError("You need to provide one of: input_file, input_name, input_content")
+
+    # Long running processes (the render server) pass the hooks and the registry loaded once for all jobs
+    if hooks is None:
+        hooks = Hooks()
+
+    if registry is None:
+        registry = create_registry(hooks)
+
+    scenario_yml = load_scenario_yml(registry, input_name, input_file, input_content)
+
+    if workers is not None:
+        scenario_yml['workers'] = workers
+
+    if cache_dir is not None:
+        scenario_yml['cache_dir'] = cache_dir
+
+    if stream is not None:
+        scenario_yml['stream'] = stream
+
+    if producers is not None:
+        scenario_yml['producers'] = producers
+
+    if time_range is not None:
+        scenario_yml['time_range'] = list(time_range)
+
+    if frame_indices is not None:
+        scenario_yml['frame_indices'] = list(frame_indices)
+
+    if preview is not None:
+        scenario_yml['preview'] = preview
+
+    if profiler is not None:
+        # Worker processes (and the cached segments) would hide the render from the profiler
+        if scenario_yml.get('workers', 1) > 1 or scenario_yml.get('cache_dir') is not None:
+            Logger.info("Profiled scenario is rendered in a single process without the render cache")
+
+        scenario_yml['workers'] = 1
+        scenario_yml.pop('cache_dir', None)
+
+        hooks = hooks.copy()
+        profiler.register(hooks)
+
+    prepare_scenario_yml(registry, scenario_yml, hooks, scenario_data)
+    Renderer(scenario_yml, registry, hooks).render()
+
+    return scenario_yml
+
+
+def prepare_scenario_yml(registry, scenario_yml, hooks, scenario_data=None):
+    """ Run the script of the scenario and process the template, the scenario is ready to be built after that. """
     hooks.run_hook("videopy.scenario.before_render", registry, scenario_yml, scenario_data)
 
     if "script" in scenario_yml:
@@ -99,4 +181,37 @@ def run_scenario(
         script.do_run(hooks, scenario_data)
 
     Template(scenario_yml, hooks).process()
-    Renderer(scenario_yml, registry, hooks).render()
+
+
+def estimate_scenario(
+        input_name: str = None,
+        input_file: str = None,
+        input_content: dict = None,
+        scenario_data=None,
+        log_level: str = "info",
+        preview: bool = None,
+        hooks: Hooks = None,
+        registry: Registry = None,
+):
+    """ Build the scenario (templating, modules, validation) without rendering it and estimate the cost of the render. """
+    from videopy.estimate import Estimator
+
+    Logger.set_level(log_level)
+
+    if input_file is None and input_name is None and input_content is None:
+        raise ValueError("You need to provide one of: input_file, input_name, input_content")
+
+    if hooks is None:
+        hooks = Hooks()
+
+    if registry is None:
+        registry = create_registry(hooks)
+
+    scenario_yml = load_scenario_yml(registry, input_name, input_file, input_content)
+
+    if preview is not None:
+        scenario_yml['preview'] = preview
+
+    prepare_scenario_yml(registry, scenario_yml, hooks, scenario_data)
+
+    return Estimator(Renderer(scenario_yml, registry, hooks).build()).estimate()
@@ -0,0 +1,83 @@
+import json
+import os
+
+from videopy.module import LazyModuleDefinition, Validator
+from videopy.utils.logger import Logger
+
+HOOK_MANIFEST_BUILD = "videopy.modules.manifest.build"
+
+MANIFEST_FILE_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+VALIDATORS = {
+    "frames": Validator.validate_frame,
+    "blocks": Validator.validate_block,
+    "effects": Validator.validate_effect,
+}
+
+
+def build_manifest(modules):
+    """ Describe the module definitions, so they can be registered without importing the modules implementing them.
+
+    :param modules: Dict of kind (frames, blocks, effects) to the dict of type to the module definition.
+    :return: JSON serializable manifest.
+    """
+    manifest = {"version": MANIFEST_VERSION}
+
+    for kind in VALIDATORS:
+        manifest[kind] = {}
+
+        for module_type, definition in modules.get(kind, {}).items():
+            manifest[kind][module_type] = {
+                "module": type(definition).__module__,
+                "definition": type(definition).__name__,
+                "description": definition.get_description(),
+                "renders_on": definition.get_renders_on(),
+            }
+
+    return manifest
+
+
+def write_manifest(path, modules):
+    manifest = build_manifest(modules)
+
+    with open(path, "w") as f:
+        json.dump(manifest, f, indent=2)
+        f.write("\n")
+
+    Logger.info(f"Plugin manifest written to <<{path}>>")
+
+    return manifest
+
+
+def read_manifest(path):
+    if not os.path.isfile(path):
+        return None
+
+    with open(path, "r") as f:
+        manifest = json.load(f)
+
+    if manifest.get("version") != MANIFEST_VERSION:
+        return None
+
+    return manifest
+
+
+def load_definitions(path, kind, get_modules):
+    """ Return the module definitions of the given kind, read from the manifest if possible.
+
+    :param path: Path to the manifest of the plugin.
+    :param kind: One of frames, blocks, effects.
+    :param get_modules: Function importing all module definitions of the plugin, used when there is no manifest.
+    """
+    manifest = read_manifest(path)
+
+    if manifest is None or kind not in manifest:
+        Logger.warn(f"Plugin manifest <<{path}>> not found or outdated, importing all {kind}, "
+                    f"regenerate it with <<video.py manifest>>")
+
+        return get_modules()[kind]
+
+    return {module_type: LazyModuleDefinition(entry["module"], entry["definition"], entry["description"],
+                                              entry["renders_on"], VALIDATORS[kind])
+            for module_type, entry in manifest[kind].items()}
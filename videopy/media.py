@@ -0,0 +1,222 @@
+import os
+import threading
+import weakref
+from collections import OrderedDict
+
+# Pools living in this process, they are reset in the forked children (see MediaPool.reset_after_fork)
+_pools = weakref.WeakSet()
+
+
+class PooledReader:
+    """ Reader shared by all the clips opened from the same file.
+
+    Frames are read under a lock, as the clips sharing the reader may be read from many threads (e.g. the streaming
+    writer producers). Readers inherited by a forked process are reopened on the first read, so the child never reads
+    from (or terminates) the ffmpeg process of its parent.
+    """
+
+    def __init__(self, reader, open_reader):
+        self.reader = reader
+        self.open_reader = open_reader
+        self.lock = threading.Lock()
+        self.inherited = False
+
+    def get_frame(self, t):
+        with self.lock:
+            if self.inherited:
+                self.reader = self.open_reader()
+                self.inherited = False
+
+            return self.reader.get_frame(t)
+
+    def close(self):
+        with self.lock:
+            self.reader.close()
+
+    def close_proc(self):
+        with self.lock:
+            self.reader.close_proc()
+
+    def detach(self):
+        # Forget the process of the parent without terminating it
+        self.reader.proc = None
+        self.lock = threading.Lock()
+        self.inherited = True
+
+    def __getattr__(self, name):
+        return getattr(self.reader, name)
+
+
+class PooledMedia:
+
+    def __init__(self, clip):
+        self.clip = clip
+        self.references = 0
+
+
+class MediaPool:
+    """ Reference counted pool of the opened video and audio files.
+
+    Clips opened from the same file (with the same options) share a single reader, so the file is decoded by one ffmpeg
+    process no matter how many frames or effects use it. Clips reading the file from another offset get their own
+    reader, as they may be played at the same time (e.g. the audio of a frame and of its block), and alternating reads
+    from distant positions would make the shared reader seek on every read. Reader is closed as soon as the last clip
+    using it is released, unless the pool keeps the idle readers (`idle_limit`) warm for the next scenarios, e.g. in
+    the render server. Idle readers are closed in the least recently used order when there are more of them than the
+    limit.
+    """
+
+    def __init__(self, idle_limit=0):
+        self.media = {}
+        self.idle = OrderedDict()
+        self.idle_limit = idle_limit
+        self.opened = 0
+        self.lock = threading.Lock()
+
+        _pools.add(self)
+
+    def open_video(self, path, audio=True, size=None, mode=None, offset=0):
+        """ Open the video file, see videopy.clip.video.open_video (mode defaults to stretch).
+
+        :param offset: Time (in seconds) the clip starts reading the file from, e.g. the start of its subclip.
+
+        :return: Copy of the pooled clip, it must be released with `release` when it is not used anymore.
+        """
+        from moviepy.editor import AudioFileClip
+
+        from videopy.clip.video import open_video
+        from videopy.utils.image import RESIZE_STRETCH
+
+        size = (int(size[0]), int(size[1])) if size is not None else None
+        mode = mode or RESIZE_STRETCH
+
+        return self.__open(("video", os.path.abspath(path), get_stamp(path), audio, size, mode, float(offset)),
+                           lambda: open_video(path, audio=audio, size=size, mode=mode),
+                           lambda: open_video(path, audio=False, size=size, mode=mode).reader,
+                           lambda: AudioFileClip(path).reader)
+
+    def open_audio(self, path, offset=0):
+        """ Open the audio file.
+
+        :param offset: Time (in seconds) the clip starts reading the file from, e.g. the start of its subclip.
+
+        :return: Copy of the pooled clip, it must be released with `release` when it is not used anymore.
+        """
+        from moviepy.editor import AudioFileClip
+
+        return self.__open(("audio", os.path.abspath(path), get_stamp(path), float(offset)),
+                           lambda: AudioFileClip(path), lambda: AudioFileClip(path).reader)
+
+    def release(self, clip):
+        """ Release the clip opened by the pool, the reader is closed when it is not used by any other clip. """
+        with self.lock:
+            media = self.media.get(clip.media_key)
+
+            if media is None:
+                return
+
+            media.references -= 1
+
+            if media.references > 0:
+                return
+
+            del self.media[clip.media_key]
+            closed = [media]
+
+            if self.idle_limit > 0:
+                self.idle[clip.media_key] = media
+                closed = self.__evict_idle()
+
+        for closed_media in closed:
+            closed_media.clip.close()
+
+    def set_idle_limit(self, idle_limit):
+        with self.lock:
+            self.idle_limit = idle_limit
+            closed = self.__evict_idle()
+
+        for media in closed:
+            media.clip.close()
+
+    def close(self):
+        """ Close all the readers, no matter if they are still used. """
+        with self.lock:
+            media = list(self.media.values()) + list(self.idle.values())
+            self.media.clear()
+            self.idle.clear()
+
+        for pooled_media in media:
+            pooled_media.clip.close()
+
+    def get_live_count(self):
+        """ Number of the readers which are currently used by the clips. """
+        with self.lock:
+            return len(self.media)
+
+    def get_idle_count(self):
+        """ Number of the readers which are kept open while no clip uses them. """
+        with self.lock:
+            return len(self.idle)
+
+    def reset_after_fork(self):
+        self.lock = threading.Lock()
+
+        for media in list(self.media.values()) + list(self.idle.values()):
+            for reader in get_readers(media.clip):
+                reader.detach()
+
+    def __evict_idle(self):
+        evicted = []
+
+        while len(self.idle) > self.idle_limit:
+            evicted.append(self.idle.popitem(last=False)[1])
+
+        return evicted
+
+    def __open(self, key, open_clip, open_reader, open_audio_reader=None):
+        with self.lock:
+            media = self.media.get(key)
+
+            if media is None and key in self.idle:
+                media = self.media[key] = self.idle.pop(key)
+
+            if media is None:
+                media = PooledMedia(open_clip())
+                media.clip.reader = PooledReader(media.clip.reader, open_reader)
+
+                if getattr(media.clip, "audio", None) is not None:
+                    media.clip.audio.reader = PooledReader(media.clip.audio.reader, open_audio_reader)
+
+                self.media[key] = media
+                self.opened += 1
+
+            media.references += 1
+
+        # Operations on the clips (subclip, set_duration...) return copies, they all read through the same reader
+        clip = media.clip.copy()
+        clip.media_key = key
+
+        return clip
+
+
+def get_stamp(path):
+    # Changed file must not be read through the reader opened before the change (e.g. kept idle by the server)
+    stat = os.stat(path)
+
+    return stat.st_size, stat.st_mtime_ns
+
+
+def get_readers(clip):
+    return [c.reader for c in [clip, getattr(clip, "audio", None)]
+            if c is not None and isinstance(getattr(c, "reader", None), PooledReader)]
+
+
+def _reset_pools_after_fork():
+    for pool in list(_pools):
+        pool.reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pools_after_fork)
+
+media_pool = MediaPool()
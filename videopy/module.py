@@ -1,6 +1,8 @@
+import importlib
 from abc import abstractmethod
 
 from videopy.compilation import AbstractCompiler
+from videopy.utils.loader import Loader
 
 types = ['str', 'float', 'bool', 'int', 'select', 'color', 'file', 'image', 'video', 'audio', 'datetime', 'date',
          'time', 'tuple']
@@ -16,6 +18,11 @@ class Registry:
         self.file_loaders = {}
         self.compilers = {}
 
+        # Factories resolved by type, so the modules are imported and validated only once
+        self.frame_factories = {}
+        self.block_factories = {}
+        self.effect_factories = {}
+
     def add_scenario(self, scenario_type, module):
         Validator.validate_scenario(module)
 
@@ -46,6 +53,24 @@ class Registry:
 
         self.compilers[compiler_type] = module
 
+    def get_frame_factory(self, frame_type):
+        if frame_type not in self.frame_factories:
+            self.frame_factories[frame_type] = Loader.get_frame_factory(frame_type)
+
+        return self.frame_factories[frame_type]
+
+    def get_block_factory(self, block_type):
+        if block_type not in self.block_factories:
+            self.block_factories[block_type] = Loader.get_block_factory(block_type)
+
+        return self.block_factories[block_type]
+
+    def get_effect_factory(self, effect_type):
+        if effect_type not in self.effect_factories:
+            self.effect_factories[effect_type] = Loader.get_effect_factory(effect_type)
+
+        return self.effect_factories[effect_type]
+
 
 class Validator:
 
@@ -81,6 +106,10 @@ class Validator:
                 raise ValueError("Frame description is required")
             if 'configuration' in frame:
                 Validator.validate_configuration(frame['configuration'])
+        elif isinstance(frame, LazyModuleDefinition):
+            # The rest is validated once the definition is imported
+            if not frame.get_description():
+                raise ValueError("Frame description is required")
         else:
             if frame.get_description() is None or frame.get_description() == "":
                 raise ValueError("Frame description is required")
@@ -96,6 +125,10 @@ class Validator:
                 raise ValueError("Block description is required")
             if 'configuration' in block:
                 Validator.validate_configuration(block['configuration'])
+        elif isinstance(block, LazyModuleDefinition):
+            # The rest is validated once the definition is imported
+            if not block.get_description():
+                raise ValueError("Block description is required")
         else:
             if block.get_description() is None or block.get_description() == "":
                 raise ValueError("Block description is required")
@@ -111,6 +144,10 @@ class Validator:
                 raise ValueError("Effect description is required")
             if 'configuration' in effect:
                 Validator.validate_configuration(effect['configuration'])
+        elif isinstance(effect, LazyModuleDefinition):
+            # The rest is validated once the definition is imported
+            if not effect.get_description():
+                raise ValueError("Effect description is required")
         else:
             if effect.get_description() is None or effect.get_description() == "":
                 raise ValueError("Effect description is required")
@@ -151,3 +188,45 @@ class AbstractModuleDefinition:
     @abstractmethod
     def get_renders_on() -> dict:
         pass
+
+
+class LazyModuleDefinition(AbstractModuleDefinition):
+    """ Module definition read from the plugin manifest.
+
+    Description and renders on are known without importing anything, the module implementing the definition is imported
+    only when the configuration or the examples are needed.
+    """
+
+    def __init__(self, module, definition, description, renders_on=None, validator=None):
+        self.module = module
+        self.definition = definition
+        self.description = description
+        self.renders_on = renders_on
+        self.validator = validator
+        self.__loaded = None
+
+    def load(self):
+        if self.__loaded is None:
+            definition = getattr(importlib.import_module(self.module), self.definition)()
+
+            if self.validator is not None:
+                self.validator(definition)
+
+            self.__loaded = definition
+
+        return self.__loaded
+
+    def is_loaded(self):
+        return self.__loaded is not None
+
+    def get_description(self) -> str:
+        return self.description
+
+    def get_configuration(self) -> dict:
+        return self.load().get_configuration()
+
+    def get_examples(self) -> list:
+        return self.load().get_examples()
+
+    def get_renders_on(self) -> dict:
+        return self.renders_on
@@ -16,11 +16,20 @@ class AbstractParamHandler:
         self.handles = handles
 
     @abstractmethod
-    def handle(self, parent_context, container_context, param_context):
+    def handle(self, parent_context, container_context, param_context, index=None):
         """ Handle the param data.
 
         :param parent_context: The parent context of the param data.
         :param container_context: The parent context of the param data.
         :param param_context: The param data.
+        :param index: Index of the container context if the parent context is a list.
         """
         pass
+
+
+def find_index(items, item, index=None):
+    """ Find the position of the item in the list, by identity (equal items are different objects to handle). """
+    if index is not None and index < len(items) and items[index] is item:
+        return index
+
+    return next(position for position, value in enumerate(items) if value is item)
@@ -0,0 +1,224 @@
+import json
+import threading
+import time
+
+from videopy.block import AbstractBlock, HOOK_BLOCK_RENDER_AFTER, HOOK_BLOCK_RENDER_BEFORE
+from videopy.compilation import HOOK_COMPILE_AFTER, HOOK_COMPILE_BEFORE
+from videopy.frame import AbstractFrame, HOOK_FRAME_RENDER_AFTER, HOOK_FRAME_RENDER_BEFORE
+from videopy.scenario import HOOK_WRITE_AFTER, HOOK_WRITE_BEFORE
+
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+
+class ProfileRecord:
+    """ Totals of a single module instance, `self_*` times exclude the time spent in the nested modules. """
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        self.wall = 0
+        self.cpu = 0
+        self.self_wall = 0
+        self.self_cpu = 0
+        self.pixels = 0
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "wall": round(self.wall, 6),
+            "cpu": round(self.cpu, 6),
+            "self_wall": round(self.self_wall, 6),
+            "self_cpu": round(self.self_cpu, 6),
+            "pixels": self.pixels,
+        }
+
+
+class Profiler:
+    """ Measure the render of every frame, block, effect and the final write, wired through the scenario hooks.
+
+    Both the construction of the clips (`do_render`, `compile`) and their lazy per-frame cost (`make_frame` called by
+    moviepy while writing) are recorded, per module instance, e.g. `frame 2 (image) > block 0 (text)`. Every thread
+    keeps its own stack of the open modules, so the streaming producers are profiled too.
+
+    Only the current process is profiled, the scenario should be rendered with a single worker (and a single streaming
+    producer).
+    """
+
+    def __init__(self):
+        self.records = {}
+        self.names = {}
+        self.events = {}
+        self.start = time.perf_counter()
+        self.lock = threading.Lock()
+        self.local = threading.local()
+
+    def register(self, hooks):
+        hooks.register_hook(HOOK_FRAME_RENDER_BEFORE, lambda frame: self.enter(self.get_name(frame)))
+        hooks.register_hook(HOOK_FRAME_RENDER_AFTER, self.on_frame_rendered)
+        hooks.register_hook(HOOK_BLOCK_RENDER_BEFORE, lambda block: self.enter(f"{self.get_name(block)} [render]"))
+        hooks.register_hook(HOOK_BLOCK_RENDER_AFTER,
+                            lambda block, compilation: self.exit(f"{self.get_name(block)} [render]"))
+        hooks.register_hook(HOOK_COMPILE_BEFORE,
+                            lambda owner, module, compilation: self.enter(f"{self.get_name(module, owner)} [compile]"))
+        hooks.register_hook(HOOK_COMPILE_AFTER, self.on_compiled)
+        hooks.register_hook(HOOK_WRITE_BEFORE, lambda scenario, clip: self.enter("write"))
+        hooks.register_hook(HOOK_WRITE_AFTER, lambda scenario, clip: self.exit("write"))
+
+    def on_frame_rendered(self, frame, clip):
+        name = self.get_name(frame)
+
+        self.exit(name)
+        self.wrap_clip(clip, name)
+
+    def on_compiled(self, owner, module, compilation, result):
+        name = self.get_name(module, owner)
+
+        self.exit(f"{name} [compile]")
+        self.wrap_clip(result, name)
+
+    def get_name(self, module, owner=None):
+        """ Name of the module instance, the effects are named after the frame or the block they are rendered on. """
+        key = id(module)
+
+        if key in self.names:
+            return self.names[key]
+
+        if isinstance(module, AbstractFrame):
+            name = f"frame {get_index(module.scenario.frames, module)} ({module.get_type()})"
+        elif isinstance(module, AbstractBlock):
+            name = f"{self.get_name(module.frame)} > block {get_index(module.frame.blocks, module)} ({module.get_type()})"
+        else:
+            index = get_index(owner.effects, module) if owner is not None else "?"
+            prefix = f"{self.get_name(owner)} > " if owner is not None else ""
+            name = f"{prefix}effect {index} ({module.type})"
+
+        # Modules live as long as the scenario, the id is not reused while the profile is recorded
+        self.names[key] = name
+
+        return name
+
+    def get_stack(self):
+        stack = getattr(self.local, "stack", None)
+
+        if stack is None:
+            stack = self.local.stack = []
+
+            # Identifier of a finished thread may be reused, its events never overlap with the new one
+            with self.lock:
+                self.events.setdefault(threading.get_ident(), [])
+
+        return stack
+
+    def enter(self, name):
+        stack = self.get_stack()
+        # Entry holds the name, the start wall and cpu time and the wall and cpu time of the nested entries
+        stack.append([name, time.perf_counter(), time.thread_time(), 0, 0])
+
+        self.events[threading.get_ident()].append(("O", name, stack[-1][1] - self.start))
+
+    def exit(self, name, pixels=0):
+        stack = self.get_stack()
+        wall_end, cpu_end = time.perf_counter(), time.thread_time()
+        events = self.events[threading.get_ident()]
+
+        if not any(entry[0] == name for entry in stack):
+            return
+
+        # Entries left open by an error are closed together with their parent
+        while stack:
+            entry_name, wall_start, cpu_start, child_wall, child_cpu = stack.pop()
+            wall, cpu = wall_end - wall_start, cpu_end - cpu_start
+
+            events.append(("C", entry_name, wall_end - self.start))
+
+            with self.lock:
+                record = self.records.get(entry_name)
+
+                if record is None:
+                    record = self.records[entry_name] = ProfileRecord(entry_name)
+
+                record.calls += 1
+                record.wall += wall
+                record.cpu += cpu
+                record.self_wall += wall - child_wall
+                record.self_cpu += cpu - child_cpu
+                record.pixels += pixels if entry_name == name else 0
+
+            if stack:
+                stack[-1][3] += wall
+                stack[-1][4] += cpu
+
+            if entry_name == name:
+                break
+
+    def wrap_clip(self, clip, name):
+        """ Measure the frames made by the clip, moviepy makes them lazily while the video is written. """
+        make_frame = getattr(clip, "make_frame", None)
+
+        # Compilers may return the clip they were given, it is measured as the module it comes from
+        if make_frame is None or getattr(make_frame, "profiled", False):
+            return
+
+        def profiled_make_frame(t):
+            self.enter(name)
+            frame = None
+
+            try:
+                frame = make_frame(t)
+            finally:
+                shape = getattr(frame, "shape", ())
+                self.exit(name, shape[0] * shape[1] if len(shape) >= 2 else 0)
+
+            return frame
+
+        profiled_make_frame.profiled = True
+        clip.make_frame = profiled_make_frame
+
+    def get_top(self, count=None, key="self_wall"):
+        records = sorted(self.records.values(), key=lambda record: getattr(record, key), reverse=True)
+
+        return records[:count] if count is not None else records
+
+    def to_speedscope(self):
+        """ Profile in the speedscope format (https://www.speedscope.app), one evented profile per thread. """
+        frames, indices, profiles = [], {}, []
+
+        for thread_index, events in enumerate(self.events.values()):
+            if not events:
+                continue
+
+            speedscope_events = []
+
+            for event_type, name, at in events:
+                if name not in indices:
+                    indices[name] = len(frames)
+                    frames.append({"name": name})
+
+                speedscope_events.append({"type": event_type, "frame": indices[name], "at": at})
+
+            profiles.append({
+                "type": "evented",
+                "name": "main" if thread_index == 0 else f"thread {thread_index}",
+                "unit": "seconds",
+                "startValue": events[0][2],
+                "endValue": events[-1][2],
+                "events": speedscope_events,
+            })
+
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "name": "videopy",
+            "exporter": "videopy",
+            "shared": {"frames": frames},
+            "profiles": profiles,
+            "records": [record.to_dict() for record in self.get_top()],
+        }
+
+    def save(self, path):
+        with open(path, "w") as f:
+            json.dump(self.to_speedscope(), f)
+
+
+def get_index(modules, module):
+    return next((index for index, item in enumerate(modules) if item is module), "?")
@@ -14,6 +14,10 @@ class Renderer:
         self.hooks = hooks
 
     def render(self):
+        self.build().render()
+
+    def build(self):
+        """ Create the scenario with all its modules, nothing is rendered yet. """
         scenario = ScenarioFactory.from_yml(self.registry, self.scenario_yml, self.hooks)
 
         for frame_yml in self.scenario_yml['frames']:
@@ -33,12 +37,13 @@ class Renderer:
                 for effect_yml in block_yml.get('effects', []):
                     block.add_effect(self.__create_effect(effect_yml))
 
-            scenario.add_frame(frame)
-        scenario.render()
+            scenario.add_frame(frame, frame_yml)
+
+        return scenario
 
     def __create_frame(self, frame_yml, scenario):
         frame_type = frame_yml['type']
-        factory = Loader.get_frame_factory(frame_type)
+        factory = self.registry.get_frame_factory(frame_type)
 
         return factory().from_yml(frame_yml, scenario)
 
@@ -51,7 +56,7 @@ class Renderer:
 
         Loader.load_defaults(effect_yml['configuration'], module_configuration)
 
-        effect_factory = Loader.get_effect_factory(effect_type)
+        effect_factory = self.registry.get_effect_factory(effect_type)
 
         return effect_factory().from_yml(effect_yml)
 
@@ -63,7 +68,7 @@ class Renderer:
 
         Loader.load_defaults(block_yml['configuration'], module_configuration)
 
-        block_factory = Loader.get_block_factory(block_type)
+        block_factory = self.registry.get_block_factory(block_type)
 
         return block_factory().from_yml(block_yml, module, frame)
 
@@ -1,49 +1,228 @@
-from moviepy.editor import concatenate_videoclips, concatenate_audioclips
-
+from videopy.cache import RenderCache
+from videopy.media import media_pool
+from videopy.timeline import DEFAULT_PASSES, HOOK_PLANNER_PASSES, Planner, Timeline
 from videopy.utils.file import get_file_extension
 from videopy.utils.logger import Logger
 
+HOOK_WRITE_BEFORE = "videopy.scenario.write.before"
+HOOK_WRITE_AFTER = "videopy.scenario.write.after"
+
+# Used by `preview: true`, scenario may also set its own profile as a mapping with any of these keys
+PREVIEW_PROFILE = {
+    "scale": 0.5,
+    "fps": 12,
+    "preset": "ultrafast",
+}
+
 
 class Scenario:
-    def __init__(self, registry, scenario_yml, hooks, output_path="videopy.mp4", width=1920, height=1080, fps=24):
+    def __init__(self, registry, scenario_yml, hooks, output_path="videopy.mp4", width=1920, height=1080, fps=24,
+                 workers=1, cache_dir=None, stream=False, producers=1, scale=1, preset=None, time_range=None,
+                 frame_indices=None):
         self.frames = []
+        self.frames_yml = []
         self.audio = []
+        self.media = []
+        self.plan = None
         self.total_time = 0
 
         self.hooks = hooks
         self.output_path = output_path
         self.size = (width, height)
         self.fps = fps
+        self.workers = workers
+        self.cache_dir = cache_dir
+        self.stream = stream
+        self.producers = producers
+        self.scale = scale
+        self.preset = preset
+        self.time_range = time_range
+        self.frame_indices = frame_indices
         self.registry = registry
         self.scenario_yml = scenario_yml
 
-    def add_frame(self, frame):
+    def add_frame(self, frame, frame_yml=None):
         self.total_time += frame.time.start + frame.time.duration
 
         self.frames.append(frame)
+        self.frames_yml.append(frame_yml)
 
     def add_audio(self, audio):
         self.audio.append(audio)
 
+    def scaled(self, value):
+        """ Scale the value given in pixels of the scenario (e.g. a font size, a margin or a position) to the rendered
+        size, which differs from the size of the scenario in the preview. Anything else than numbers is kept as is.
+        """
+        if self.scale == 1:
+            return value
+
+        if isinstance(value, (list, tuple)):
+            return type(value)(self.scaled(item) for item in value)
+
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return round(value * self.scale)
+
+        return value
+
+    def get_plan(self):
+        """ Build the timeline of the scenario and optimize it into the render plan.
+
+        Plugins can add their own passes (functions modifying the plan) with the `videopy.scenario.planner.passes` hook.
+        """
+        passes = list(DEFAULT_PASSES)
+        self.hooks.run_hook(HOOK_PLANNER_PASSES, passes)
+
+        plan = Planner(passes).plan(Timeline.from_scenario(self))
+
+        Logger.debug(f"Planned <<{len(plan.layers)}>> layers, <<{len(plan.dropped)}>> dropped, "
+                     f"<<{len(plan.merged)}>> frames reused, <<{plan.get_static_duration():.2f}>> of "
+                     f"<<{plan.timeline.duration:.2f}>> seconds static")
+
+        return plan
+
+    def get_encoder_options(self):
+        # Encoder defaults are used unless the preset is set (e.g. by the preview)
+        return {"preset": self.preset} if self.preset is not None else {}
+
+    def get_selected_frames(self):
+        """ Find the frames to render, all of them unless the time range or the frame indices are set.
+
+        :return: List of tuples of the frame index and the start time of the frame in the scenario.
+        """
+        if self.frame_indices is not None:
+            if not self.frame_indices:
+                raise ValueError("There are no frames to render, the list of frame indices is empty")
+
+            for index in self.frame_indices:
+                if not 0 <= index < len(self.frames):
+                    raise ValueError(f"Frame index [{index}] is out of range, scenario has [{len(self.frames)}] frames")
+
+            indices = sorted(set(self.frame_indices))
+
+            # Time range is cut from the frames rendered one after another, gaps would shift it
+            if self.time_range is not None and indices != list(range(indices[0], indices[-1] + 1)):
+                raise ValueError(f"Time range can be combined only with contiguous frame indices, "
+                                 f"got {self.frame_indices}")
+
+        if self.time_range is not None:
+            range_start, range_end = self.time_range
+
+            if range_start < 0 or (range_end is not None and range_end <= range_start):
+                raise ValueError(f"Invalid time range [{range_start}, {range_end}]")
+
+        selected = []
+        start_time = 0
+
+        for index, frame in enumerate(self.frames):
+            end_time = start_time + frame.time.duration
+
+            if self.frame_indices is not None:
+                is_selected = index in self.frame_indices
+            elif self.time_range is not None:
+                is_selected = end_time > range_start and (range_end is None or start_time < range_end)
+            else:
+                is_selected = True
+
+            if is_selected:
+                selected.append((index, start_time))
+
+            start_time = end_time
+
+        if self.frames and not selected:
+            raise ValueError(f"There are no frames to render in the time range {list(self.time_range)}")
+
+        return selected
+
+    def open_video(self, path, audio=True, size=None, mode=None, offset=0):
+        """ Open the video file from the shared media pool, it is released when the scenario is rendered. """
+        clip = media_pool.open_video(path, audio, size, mode, offset)
+        self.media.append(clip)
+
+        return clip
+
+    def open_audio(self, path, offset=0):
+        """ Open the audio file from the shared media pool, it is released when the scenario is rendered. """
+        clip = media_pool.open_audio(path, offset)
+        self.media.append(clip)
+
+        return clip
+
+    def release_media(self):
+        for clip in self.media:
+            media_pool.release(clip)
+
+        self.media = []
+
+        Logger.debug(f"Media released, <<{media_pool.get_live_count()}>> readers are still open")
+
     def render(self):
+        try:
+            self.__render()
+        finally:
+            self.release_media()
+
+    def __render(self):
+        # Media libraries are slow to import, they are loaded on the first render instead of on the startup
+        from moviepy.editor import concatenate_videoclips, concatenate_audioclips
+
+        from videopy.clip.static import reuse_static_frames
+        from videopy.segment import SegmentRenderer
+        from videopy.writer import StreamingWriter
+
         Logger.debug(f"Rendering scenario with <<{len(self.frames)}>> frames "
                      f"with a total time of <<{self.total_time}>> seconds")
 
+        format = get_file_extension(self.output_path)
+        selected = self.get_selected_frames()
+        plan = self.get_plan()
+        plan.apply(self)
+        self.plan = plan
+
+        if (self.workers > 1 or self.cache_dir is not None) and self.frames:
+            if format == "gif":
+                Logger.warn("Segment rendering is not supported for <<gif>> output, rendering in a single process")
+            elif not SegmentRenderer.is_supported():
+                Logger.warn("Segment rendering is not supported on this platform, rendering in a single process")
+            elif self.time_range is not None:
+                # Segments are whole frames, they can not be cut at any time without re-encoding them
+                Logger.info("Time range is rendered in a single process")
+            else:
+                cache = RenderCache(self.cache_dir) if self.cache_dir is not None else None
+
+                return SegmentRenderer(self, self.workers, cache).render([index for index, _ in selected], plan)
+
         clips = []
-        start_time = 0
+        rendered = {}
+        static_spans = []
+        clip_start = 0
+
+        for index, start_time in selected:
+            frame = self.frames[index]
+
+            if plan.is_frame_dropped(index):
+                continue
+
+            # Spans of the frame moved to the time of the concatenated clip
+            static_spans += [(start - start_time + clip_start, end - start_time + clip_start)
+                             for start, end in plan.get_static_spans(index)]
+            clip_start += frame.time.duration
+
+            if plan.merged.get(index) in rendered:
+                clips.append(rendered[plan.merged[index]])
+                continue
 
-        for frame in self.frames:
             Logger.debug(f"Rendering frame of type <<{frame.get_type()}>>")
             clip = frame.do_render(start_time)
 
             clips.append(clip)
-            start_time += frame.time.duration
+            rendered[index] = clip
 
             if clip.duration != frame.time.duration:
                 raise ValueError(f"Frame duration [{frame.time.duration}] does not match "
                                  f"the clip duration [{clip.duration}]")
 
-        final_video = concatenate_videoclips(clips, method="compose")
+        final_video = reuse_static_frames(concatenate_videoclips(clips, method="compose"), static_spans)
 
         Logger.debug(f"Scenario rendered with a total time of <<{final_video.duration}>> seconds")
 
@@ -53,24 +232,75 @@ class Scenario:
             audio = concatenate_audioclips(self.audio)
             final_video = final_video.set_audio(audio)
 
-        format = get_file_extension(self.output_path)
+        if self.time_range is not None:
+            # Only the frames overlapping the range were rendered, the clip starts with the first of them
+            offset = selected[0][1]
+            range_start, range_end = self.time_range
+            range_end = final_video.duration if range_end is None else min(range_end - offset, final_video.duration)
+            final_video = final_video.subclip(max(range_start - offset, 0), range_end)
+
+        self.hooks.run_hook(HOOK_WRITE_BEFORE, self, final_video)
 
         if format == "gif":
             final_video.write_gif(self.output_path, fps=self.fps)
+        elif self.stream:
+            StreamingWriter(final_video, self.output_path, self.fps, producers=self.producers,
+                            **self.get_encoder_options()).write()
         else:
-            final_video.write_videofile(self.output_path, fps=self.fps)
+            final_video.write_videofile(self.output_path, fps=self.fps, **self.get_encoder_options())
+
+        self.hooks.run_hook(HOOK_WRITE_AFTER, self, final_video)
+
+
+def get_preview_profile(preview):
+    """ Find the preview profile of the scenario.
+
+    :param preview: Value of the `preview` key of the scenario, true for the default profile or a mapping overriding it.
+    :return: Profile or None if the preview is disabled.
+    """
+    if not preview:
+        return None
+
+    if preview is True:
+        return dict(PREVIEW_PROFILE)
+
+    if not isinstance(preview, dict):
+        raise ValueError(f"Preview must be true or a mapping, not [{preview}]")
+
+    return {**PREVIEW_PROFILE, **preview}
+
+
+def get_even(value):
+    # yuv420p used by most of the codecs requires even dimensions
+    return max(2, int(round(value / 2)) * 2)
 
 
 class ScenarioFactory:
 
     @staticmethod
     def from_yml(modules_yml, scenario_yml, hooks):
+        width, height, fps = scenario_yml['width'], scenario_yml['height'], scenario_yml['fps']
+        preview = get_preview_profile(scenario_yml.get('preview', False))
+        time_range = scenario_yml.get('time_range', None)
+
+        if preview is not None:
+            width, height = get_even(width * preview['scale']), get_even(height * preview['scale'])
+            fps = min(fps, preview['fps'])
+
         return Scenario(
             registry=modules_yml,
             scenario_yml=scenario_yml,
             hooks=hooks,
             output_path=scenario_yml['output_path'],
-            width=scenario_yml['width'],
-            height=scenario_yml['height'],
-            fps=scenario_yml['fps']
+            width=width,
+            height=height,
+            fps=fps,
+            workers=scenario_yml.get('workers', 1),
+            cache_dir=scenario_yml.get('cache_dir', None),
+            stream=scenario_yml.get('stream', False),
+            producers=scenario_yml.get('producers', 1),
+            scale=preview['scale'] if preview is not None else 1,
+            preset=preview['preset'] if preview is not None else scenario_yml.get('preset', None),
+            time_range=tuple(time_range) if time_range is not None else None,
+            frame_indices=scenario_yml.get('frame_indices', None),
         )
@@ -0,0 +1,210 @@
+import multiprocessing
+import os
+import shutil
+import subprocess
+import tempfile
+
+import numpy as np
+from moviepy.audio.AudioClip import AudioClip, CompositeAudioClip
+from moviepy.config import get_setting
+from moviepy.editor import CompositeVideoClip, concatenate_audioclips
+from moviepy.tools import find_extension
+
+from videopy.clip.static import reuse_static_frames
+from videopy.utils.file import get_file_extension
+from videopy.utils.logger import Logger
+from videopy.writer import AUDIO_FPS, StreamingWriter, get_audio_codec
+
+# Scenario of the worker process, set by the pool initializer (see `set_scenario`)
+_scenario = None
+
+
+class SegmentRenderer:
+
+    def __init__(self, scenario, workers=1, cache=None):
+        self.scenario = scenario
+        self.workers = workers
+        self.cache = cache
+
+    @staticmethod
+    def is_supported():
+        return "fork" in multiprocessing.get_all_start_methods()
+
+    def render(self, indices=None, plan=None):
+        """ Render each frame of the scenario (or only the frames with the given indices) into its own segment and join
+        them into the output file.
+
+        Segments are encoded by a pool of forked processes (each frame is rendered in a fresh process, so no state
+        leaks between frames) and then joined without re-encoding using the ffmpeg concat demuxer. Segments of frames
+        found in the render cache (or merged with the identical frame before them by the render plan) are reused
+        instead of being rendered again.
+        """
+        extension = get_file_extension(self.scenario.output_path)
+        directory = tempfile.mkdtemp(prefix="videopy_segments_")
+        segments = [None] * len(self.scenario.frames)
+        keys = [None] * len(self.scenario.frames)
+        selected = indices if indices is not None else range(len(self.scenario.frames))
+        merged = {}
+        jobs = []
+        start_time = 0
+
+        if plan is not None:
+            selected = [index for index in selected if not plan.is_frame_dropped(index)]
+            merged = {index: root for index, root in plan.merged.items() if index in selected and root in selected}
+
+        for index, frame in enumerate(self.scenario.frames):
+            if index not in selected or index in merged:
+                start_time += frame.time.duration
+                continue
+
+            frame_yml = self.scenario.frames_yml[index]
+
+            if self.cache is not None and frame_yml is not None:
+                keys[index] = self.cache.get_key(frame_yml, self.scenario)
+                segments[index] = self.cache.get(keys[index], extension)
+
+            if segments[index] is None:
+                jobs.append((index, start_time, os.path.join(directory, f"segment_{index:05d}.{extension}")))
+
+            start_time += frame.time.duration
+
+        Logger.info(f"Rendering <<{len(jobs)}>> segments using <<{self.workers}>> workers "
+                    f"(<<{len(selected) - len(jobs) - len(merged)}>> reused from cache, <<{len(merged)}>> merged)")
+
+        try:
+            if jobs:
+                # Workers get the scenario through the fork, the frames are never pickled. It is passed per pool, so the
+                # renders running at once in other threads (e.g. the render server) never swap it under the workers.
+                with multiprocessing.get_context("fork").Pool(processes=self.workers, maxtasksperchild=1,
+                                                              initializer=set_scenario,
+                                                              initargs=(self.scenario,)) as pool:
+                    results = pool.map(render_segment, jobs)
+
+                for (index, _, _), (path, has_audio) in zip(jobs, results):
+                    if keys[index] is not None:
+                        path = self.cache.put(keys[index], path, has_audio)
+
+                    segments[index] = (path, has_audio)
+
+            for index, root in merged.items():
+                segments[index] = segments[root]
+
+            selected = sorted(selected)
+            segments = [segments[index] for index in selected]
+
+            concatenate_segments([path for path, _ in segments], self.scenario.output_path,
+                                 audio=any(has_audio for _, has_audio in segments),
+                                 durations=[self.scenario.frames[index].time.duration for index in selected])
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+
+
+def set_scenario(scenario):
+    global _scenario
+
+    _scenario = scenario
+
+
+def render_segment(job):
+    """ Render a single frame of the shared scenario into a segment file.
+
+    Every segment gets an audio track (silent if the frame does not play anything), so all segments have the same
+    streams and can be joined losslessly.
+
+    :param job: Tuple of frame index, frame start time and segment path.
+    :return: Tuple of the segment path and information whether the frame plays any audio.
+    """
+    index, start_time, path = job
+    frame = _scenario.frames[index]
+    audio_index = len(_scenario.audio)
+
+    try:
+        Logger.debug(f"Rendering segment <<{index}>> of type <<{frame.get_type()}>>")
+        clip = frame.do_render(start_time)
+
+        if clip.duration != frame.time.duration:
+            raise ValueError(f"Frame duration [{frame.time.duration}] does not match "
+                             f"the clip duration [{clip.duration}]")
+
+        if clip.mask is not None:
+            # Writers ignore the mask (e.g. of the fade in), it is blended against black the same way the frames are
+            # concatenated in the single process render
+            clip = CompositeVideoClip([clip.set_position("center")], size=_scenario.size)
+
+        if _scenario.plan is not None:
+            clip = reuse_static_frames(clip, [(start - start_time, end - start_time)
+                                              for start, end in _scenario.plan.get_static_spans(index)])
+
+        # Audio of the frame clip (e.g. a video) is mixed with the audio the frame added to the scenario
+        audio = [clip.audio] if clip.audio is not None else []
+
+        if len(_scenario.audio) > audio_index:
+            audio.append(concatenate_audioclips(_scenario.audio[audio_index:]))
+
+        if audio:
+            clip = clip.set_audio(CompositeAudioClip(audio).set_duration(clip.duration))
+        else:
+            clip = clip.set_audio(silence(clip.duration))
+
+        audio_codec = get_audio_codec(get_file_extension(path))
+
+        if _scenario.stream:
+            # The segments are already produced in parallel, the worker (a daemonic process) can not fork producers
+            StreamingWriter(clip, path, _scenario.fps, producers=1, audio_codec=audio_codec,
+                            **_scenario.get_encoder_options()).write()
+        else:
+            clip.write_videofile(path, fps=_scenario.fps, audio_codec=audio_codec, audio_fps=AUDIO_FPS,
+                                 temp_audiofile=f"{path}.audio.{find_extension(audio_codec)}", logger=None,
+                                 **_scenario.get_encoder_options())
+
+        return path, len(audio) > 0
+    finally:
+        # The worker exits after the segment, its readers are closed right away instead of being left to the GC
+        _scenario.release_media()
+
+
+def concatenate_segments(paths, output_path, audio=True, durations=None):
+    """ Join the segments into the output file using the ffmpeg concat demuxer (streams are copied).
+
+    :param paths: Paths of the segments in the playback order.
+    :param output_path: Path of the joined file.
+    :param audio: Whether the audio streams of the segments should be kept.
+    :param durations: Durations of the segments (in seconds), the next segment starts exactly after it. Otherwise it
+        starts after the longest stream of the segment, encoders pad the audio, so the video would get gaps.
+    """
+    if not paths:
+        raise ValueError("There are no segments to concatenate")
+
+    list_path = f"{output_path}.list"
+
+    with open(list_path, "w") as f:
+        for index, path in enumerate(paths):
+            escaped_path = os.path.abspath(path).replace("'", "'\\''")
+            f.write(f"file '{escaped_path}'\n")
+
+            if durations is not None:
+                f.write(f"duration {durations[index]}\n")
+
+    command = [get_setting("FFMPEG_BINARY"), "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+               "-i", list_path, "-c", "copy"]
+
+    if not audio:
+        command.append("-an")
+
+    try:
+        result = subprocess.run(command + [output_path], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    finally:
+        os.remove(list_path)
+
+    if result.returncode != 0:
+        raise RuntimeError(f"Could not concatenate segments: {result.stderr.decode(errors='replace')}")
+
+
+def silence(duration, channels=2):
+    def make_frame(t):
+        if isinstance(t, np.ndarray):
+            return np.zeros((len(t), channels))
+
+        return np.zeros(channels)
+
+    return AudioClip(make_frame, duration=duration, fps=AUDIO_FPS)
@@ -0,0 +1,200 @@
+import json
+import os
+import socketserver
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import yaml
+
+from videopy.hooks import Hooks
+from videopy.main import create_registry, run_scenario, warm_up
+from videopy.media import media_pool
+from videopy.utils.logger import Logger
+
+JOB_INPUT_KEYS = ("scenario", "input_file", "input_name")
+
+
+class RenderService:
+    """ Render the scenarios with the plugins loaded only once.
+
+    Jobs share the registry and the caches kept by the process (rendered texts, fonts, loaded modules), at most
+    `concurrency` jobs are rendered at once, the rest waits for a free slot. Up to `idle_media` video and audio readers
+    are kept open after the jobs, so the next jobs using the same files do not start ffmpeg again.
+
+    Jobs are rendered by the threads of this process, so they never fork (a fork of a multithreaded process may
+    deadlock on a lock held by another thread): scenarios are rendered without the segment workers and with a single
+    streaming producer, whatever they ask for. The log level is set once for the whole service.
+    """
+
+    def __init__(self, plugins_dir="plugins", concurrency=1, log_level="info", idle_media=8):
+        media_pool.set_idle_limit(idle_media)
+        Logger.set_level(log_level)
+
+        self.hooks = Hooks()
+        self.registry = create_registry(self.hooks, plugins_dir)
+        self.concurrency = concurrency
+        self.log_level = log_level
+        self.slots = threading.BoundedSemaphore(concurrency)
+
+        self.lock = threading.Lock()
+        self.active = 0
+        self.waiting = 0
+        self.rendered = 0
+
+    def render(self, job):
+        """ Render the job.
+
+        :param job: Dict with one of: scenario (scenario dict or YAML/JSON string), input_file or input_name, and the
+                    optional data passed to the scenario.
+        :return: Dict with the output path and the render time in seconds.
+        """
+        arguments = get_job_arguments(job)
+
+        with self.lock:
+            self.waiting += 1
+
+        with self.slots:
+            with self.lock:
+                self.waiting -= 1
+                self.active += 1
+
+            start = time.perf_counter()
+
+            try:
+                # Hooks registered while running the job (e.g. by scripts) must not leak to the next jobs
+                scenario_yml = run_scenario(**arguments, log_level=None, workers=1, producers=1,
+                                            hooks=self.hooks.copy(), registry=self.registry)
+            finally:
+                with self.lock:
+                    self.active -= 1
+
+            with self.lock:
+                self.rendered += 1
+
+        return {"output_path": scenario_yml["output_path"], "elapsed": time.perf_counter() - start}
+
+    def get_status(self):
+        with self.lock:
+            return {
+                "status": "ok",
+                "concurrency": self.concurrency,
+                "active": self.active,
+                "waiting": self.waiting,
+                "rendered": self.rendered,
+                "media_readers": media_pool.get_live_count(),
+                "idle_media_readers": media_pool.get_idle_count(),
+            }
+
+
+def get_job_arguments(job):
+    if not isinstance(job, dict):
+        raise ValueError("Job must be a mapping")
+
+    if not any(key in job for key in JOB_INPUT_KEYS):
+        # The whole body is the scenario
+        job = {"scenario": job}
+
+    scenario = job.get("scenario")
+
+    if isinstance(scenario, str):
+        scenario = yaml.safe_load(scenario)
+
+    if scenario is not None and not isinstance(scenario, dict):
+        raise ValueError("Scenario must be a mapping")
+
+    return {
+        "input_content": scenario,
+        "input_file": job.get("input_file"),
+        "input_name": job.get("input_name"),
+        "scenario_data": job.get("data"),
+        "time_range": job.get("time_range"),
+        "frame_indices": job.get("frame_indices"),
+        "preview": job.get("preview"),
+    }
+
+
+class RenderRequestHandler(BaseHTTPRequestHandler):
+    """ POST /render renders the job sent in the body (YAML or JSON), GET /health reports the state of the service. """
+
+    def do_GET(self):
+        if self.path != "/health":
+            return self.send_json(404, {"error": f"Unknown path {self.path}"})
+
+        self.send_json(200, self.server.service.get_status())
+
+    def do_POST(self):
+        if self.path != "/render":
+            return self.send_json(404, {"error": f"Unknown path {self.path}"})
+
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+        try:
+            job = yaml.safe_load(body)
+            result = self.server.service.render(job)
+        except (ValueError, KeyError, yaml.YAMLError) as e:
+            Logger.error(f"Job rejected: {e}")
+
+            return self.send_json(400, {"error": str(e)})
+        except Exception as e:
+            Logger.error(f"Job failed: {e}")
+
+            return self.send_json(500, {"error": str(e)})
+
+        self.send_json(200, result)
+
+    def send_json(self, status, payload):
+        body = json.dumps(payload).encode()
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self):
+        # Unix socket clients have no address
+        return self.client_address[0] if isinstance(self.client_address, tuple) else "unix"
+
+    def log_message(self, format, *args):
+        Logger.debug(f"{self.address_string()} - {format % args}")
+
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def create_server(service, host="127.0.0.1", port=8000, socket_path=None):
+    if socket_path is not None:
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+
+        server = UnixHTTPServer(socket_path, RenderRequestHandler)
+    else:
+        server = ThreadingHTTPServer((host, port), RenderRequestHandler)
+
+    server.service = service
+
+    return server
+
+
+def serve(host="127.0.0.1", port=8000, socket_path=None, concurrency=1, plugins_dir="plugins", idle_media=8):
+    service = RenderService(plugins_dir, concurrency, idle_media=idle_media)
+
+    # The media libraries are imported on the startup instead of on the first job
+    warm_up()
+
+    server = create_server(service, host, port, socket_path)
+
+    Logger.info(f"Render server listening on <<{socket_path or f'http://{host}:{server.server_address[1]}'}>> "
+                f"with concurrency <<{concurrency}>>")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        Logger.info("Render server stopped")
+    finally:
+        server.server_close()
+
+        if socket_path is not None and os.path.exists(socket_path):
+            os.remove(socket_path)
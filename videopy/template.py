@@ -1,3 +1,4 @@
+import functools
 import re
 
 from videopy.param import AbstractParamHandler
@@ -10,6 +11,38 @@ HOOK_BLOCK_EFFECT_VARS_REGISTER = "videopy.template.block.effect.vars.register"
 HOOK_TEMPLATE_PARAM_PRE_HANDLER_REGISTER = "videopy.template.params.pre_handlers.register"
 HOOK_TEMPLATE_PARAM_POST_HANDLER_REGISTER = "videopy.template.params.post_handlers.register"
 
+PLACEHOLDER_PATTERN = re.compile(r'{(.*?)}')
+
+
+@functools.lru_cache(maxsize=65536)
+def compile_template(value):
+    """
+    Split the string into literal and placeholder segments, so it is parsed only once no matter how many times
+    (and with how many different vars) it is resolved.
+
+    :param value: The string value containing placeholders.
+    :return: Tuple of segments (literal strings and (expression, keys) tuples of placeholders) or None if the value
+             has no placeholders.
+    """
+    segments = []
+    position = 0
+
+    for match in PLACEHOLDER_PATTERN.finditer(value):
+        if match.start() > position:
+            segments.append(value[position:match.start()])
+
+        expr = match.group(1).strip()
+        segments.append((expr, tuple(expr.split('.'))))
+        position = match.end()
+
+    if not segments:
+        return None
+
+    if position < len(value):
+        segments.append(value[position:])
+
+    return tuple(segments)
+
 
 class Template:
 
@@ -55,60 +88,91 @@ class Template:
             return self.resolve_placeholders(obj, vars=vars)
         return obj
 
-    def traverse_keys(self, obj, handlers, path="", exclude=None, vars=None):
+    def traverse_keys(self, obj, handlers, exclude=None, vars=None):
         """
-        Recursively traverse all fields of a Python object and handle special keys like 'loop'.
+        Traverse all fields of a Python object and handle special keys like 'loop'.
+
+        The tree is walked with an explicit stack holding every node together with its container, so handlers get
+        the parent and current objects directly. Items of a list are handled before any of them is descended into,
+        as handlers may replace the item in the list ('loop' expands it into copies, 'when' removes it), and whatever
+        takes the place of the item is handled as well.
 
-        :param handlers:
         :param obj: The object to traverse.
-        :param path: The current path of traversal.
+        :param handlers: Dictionary of param handlers.
         :param exclude: List of keys to exclude from traversal.
         :param vars: Dictionary of variables to use for processing keys.
         """
-        if vars is None:
-            vars = {}
         if exclude is None:
             exclude = []
 
-        if isinstance(obj, dict):
-            items = list(obj.items())
-            for key, value in items:
-                if key in exclude:
-                    continue
+        handlers = list(handlers.values())
+        stack = [(obj, None, None)]
 
-                for handler_key, handler in handlers.items():
-                    if handler.name == key:
-                        parent_path = self.get_parent_path(path)
-                        parent_obj = None if path == "" else self.get_nested_obj(self.scenario_yml, parent_path)
-                        current_obj = self.scenario_yml if path == "" else self.get_nested_obj(self.scenario_yml, path)
+        while stack:
+            node, parent, index = stack.pop()
 
-                        handler.handle(parent_obj, current_obj, value)
-                else:
-                    self.traverse_keys(value, handlers, f"{path}.{key}" if path else key, exclude, vars)
-        elif isinstance(obj, list):
-            for index, value in enumerate(obj):
-                self.traverse_keys(value, handlers, f"{path}[{index}]", exclude, vars)
-        elif hasattr(obj, "__dict__"):
-            for key, value in obj.__dict__.items():
-                if key in exclude:
+            if isinstance(node, dict):
+                if index is None and not self.handle_keys(node, parent, None, handlers, exclude):
                     continue
-                self.traverse_keys(value, handlers, f"{path}.{key}" if path else key, exclude, vars)
 
-    def get_nested_obj(self, obj, path):
+                children = [value for key, value in node.items() if key not in exclude]
+            elif isinstance(node, list):
+                self.handle_items(node, handlers, exclude)
+
+                # Items are already handled, the index marks that
+                stack.extend((value, node, position) for position, value in reversed(list(enumerate(node))))
+                continue
+            elif hasattr(node, "__dict__"):
+                children = [value for key, value in node.__dict__.items() if key not in exclude]
+            else:
+                continue
+
+            stack.extend((value, node, None) for value in reversed(children))
+
+    def handle_items(self, items, handlers, exclude):
         """
-        Get the nested object based on the path.
+        Run the handlers of every item of the list.
 
-        :param obj: The root object.
-        :param path: The path to the nested object.
-        :return: The nested object.
+        :param items: The list to handle.
+        :param handlers: List of param handlers.
+        :param exclude: List of keys to exclude from traversal.
         """
-        keys = re.split(r'\.|\[|\]', path)
-        keys = [key for key in keys if key]  # Remove empty strings
-        for key in keys:
-            if key.isdigit():
-                key = int(key)
-            obj = obj[key]
-        return obj
+        index = 0
+
+        while index < len(items):
+            item = items[index]
+
+            if isinstance(item, dict) and not self.handle_keys(item, items, index, handlers, exclude):
+                # The item was replaced, handle whatever took its place
+                continue
+
+            index += 1
+
+    def handle_keys(self, obj, parent_obj, index, handlers, exclude):
+        """
+        Run the handlers of the keys of the object.
+
+        :param obj: The object to handle.
+        :param parent_obj: The container of the object.
+        :param index: Index of the object if the container is a list.
+        :param handlers: List of param handlers.
+        :param exclude: List of keys to exclude from traversal.
+        :return: False if the object was removed from its container by one of the handlers.
+        """
+        for key, value in list(obj.items()):
+            if key in exclude:
+                continue
+
+            for handler in handlers:
+                if handler.name != key:
+                    continue
+
+                handler.handle(parent_obj, obj, value, index=index)
+
+                if isinstance(parent_obj, list) and (index >= len(parent_obj) or parent_obj[index] is not obj):
+                    return False
+
+        return True
 
     def resolve_placeholders(self, value, vars):
         """
@@ -118,22 +182,32 @@ class Template:
         :param vars: Dictionary containing variable values.
         :return: The processed string value with placeholders replaced.
         """
+        if "{" not in value:
+            return value
+
+        segments = compile_template(value)
+
+        if segments is None:
+            return value
 
-        def eval_placeholder(match):
-            expr = match.group(1).strip()
+        parts = []
+        for segment in segments:
+            if isinstance(segment, str):
+                parts.append(segment)
+                continue
+
+            expr, keys = segment
             try:
-                result = self.resolve_variable(expr, vars)
+                result = self.resolve_keys(expr, keys, vars)
             except KeyError as e:
                 print(f"Missing key in vars for placeholder: {e}")
                 result = f"{expr}"
             except Exception as e:
                 print(f"Error evaluating expression '{expr}': {e}")
                 result = f"{expr}"
-            return str(result)
+            parts.append(str(result))
 
-        pattern = re.compile(r'{(.*?)}')
-        value = pattern.sub(eval_placeholder, value)
-        return value
+        return "".join(parts)
 
     def resolve_variable(self, expr, vars):
         """
@@ -143,7 +217,17 @@ class Template:
         :param vars: Dictionary containing variable values.
         :return: The resolved variable value.
         """
-        keys = expr.split('.')
+        return self.resolve_keys(expr, expr.split('.'), vars)
+
+    def resolve_keys(self, expr, keys, vars):
+        """
+        Resolve a nested variable from the vars dictionary using the already split expression.
+
+        :param expr: The expression containing the variable.
+        :param keys: Keys of the expression.
+        :param vars: Dictionary containing variable values.
+        :return: The resolved variable value.
+        """
         value = vars
         try:
             for key in keys:
@@ -154,21 +238,6 @@ class Template:
             return f"{{{{ {expr} }}}}"
         return value
 
-    def get_parent_path(self, path):
-        """
-        Get the parent path of a given path.
-
-        :param path: The path to get the parent path for.
-        :return: The parent path.
-        """
-        if '[' in path and ']' in path:
-            path = re.sub(r'\[\d+\]$', '', path)
-        elif '.' in path:
-            path = path.rsplit('.', 1)[0]
-        else:
-            path = ''
-        return path
-
     def inherit_vars(self):
         scenario_vars = self.scenario_yml.get("vars", {})
 
@@ -0,0 +1,283 @@
+import json
+
+HOOK_PLANNER_PASSES = "videopy.scenario.planner.passes"
+
+LAYER_FRAME = "frame"
+LAYER_BLOCK = "block"
+
+
+class TimelineEffect:
+    """ Effect of the layer with its absolute time on the timeline. """
+
+    def __init__(self, type, start, end, animated=True, audible=False, module=None):
+        self.type = type
+        self.module = module if module is not None else type
+        self.start = start
+        self.end = end
+        self.animated = animated
+        self.audible = audible
+
+    def __repr__(self):
+        return f"TimelineEffect(type={self.type}, start={self.start}, end={self.end})"
+
+
+class TimelineLayer:
+    """ Frame or block placed on the timeline, times are absolute (in seconds from the start of the scenario). """
+
+    def __init__(self, kind, type, start, end, frame_index, position=None, effects=None, animated=True, audible=False,
+                 definition=None, source=None):
+        self.kind = kind
+        self.type = type
+        # Module the layer was created by (e.g. plugins.core.frames.image), known only if the definition is
+        self.module = definition['type'] if isinstance(definition, dict) and 'type' in definition else type
+        self.start = start
+        self.end = end
+        self.frame_index = frame_index
+        self.position = position
+        self.effects = effects if effects is not None else []
+        self.animated = animated
+        self.audible = audible
+        self.definition = definition
+        self.source = source
+
+    def __repr__(self):
+        return f"TimelineLayer(kind={self.kind}, type={self.type}, start={self.start}, end={self.end})"
+
+    @property
+    def duration(self):
+        return self.end - self.start
+
+    def is_audible(self):
+        return self.audible or any(effect.audible for effect in self.effects)
+
+    def is_animated(self):
+        return self.animated or any(effect.animated for effect in self.effects)
+
+    def get_animated_spans(self):
+        """ Parts of the layer time in which its picture changes. """
+        if self.animated:
+            return [(self.start, self.end)]
+
+        return [(effect.start, effect.end) for effect in self.effects if effect.animated]
+
+    def get_change_points(self):
+        """ Times at which the picture of the layer may change at once (something appears or disappears). """
+        points = {self.start, self.end}
+
+        for effect in self.effects:
+            points.update([effect.start, effect.end])
+
+        return points
+
+
+class TimelineSpan:
+    """ Part of the frame between two change points, static if none of the layers animates in it. """
+
+    def __init__(self, start, end, static, frame_index):
+        self.start = start
+        self.end = end
+        self.static = static
+        self.frame_index = frame_index
+
+    def __repr__(self):
+        return f"TimelineSpan(start={self.start}, end={self.end}, static={self.static})"
+
+    @property
+    def duration(self):
+        return self.end - self.start
+
+
+class Timeline:
+    """ Flat list of all the layers of the scenario, built after the modules are created and before anything is rendered.
+
+    Frames follow each other, blocks are placed on top of their frame, effects are kept as a chain of each layer.
+    """
+
+    def __init__(self, layers, duration, size):
+        self.layers = layers
+        self.duration = duration
+        self.size = size
+
+    @staticmethod
+    def from_scenario(scenario):
+        layers = []
+        start_time = 0
+
+        for index, frame in enumerate(scenario.frames):
+            end_time = start_time + frame.time.duration
+            frame_yml = scenario.frames_yml[index]
+
+            layers.append(TimelineLayer(LAYER_FRAME, frame.get_type(), start_time, end_time, index,
+                                        effects=get_effects(frame.effects, start_time, end_time,
+                                                            get_definitions(frame_yml, 'effects', frame.effects)),
+                                        animated=frame.animated, audible=frame.audible,
+                                        definition=frame_yml, source=frame))
+
+            for block, block_yml in zip(frame.blocks, get_definitions(frame_yml, 'blocks', frame.blocks)):
+                block_start = start_time + block.time.start
+                block_end = block_start + block.time.duration
+
+                layers.append(TimelineLayer(LAYER_BLOCK, block.get_type(), block_start, block_end, index,
+                                            position=block.position,
+                                            effects=get_effects(block.effects, block_start, block_end,
+                                                                get_definitions(block_yml, 'effects', block.effects)),
+                                            animated=block.animated, audible=block.audible, definition=block_yml,
+                                            source=block))
+
+            start_time = end_time
+
+        return Timeline(layers, start_time, scenario.size)
+
+
+class RenderPlan:
+    """ Result of the planner, tells which layers are rendered and how.
+
+    - `layers` are the layers left to render, the `dropped` ones are not rendered at all.
+    - `merged` maps the index of a frame to the index of the identical frame just before it, its clip is reused.
+    - `spans` split every frame into the static and the animated parts.
+    """
+
+    def __init__(self, timeline):
+        self.timeline = timeline
+        self.layers = list(timeline.layers)
+        self.dropped = []
+        self.merged = {}
+        self.spans = []
+
+    def drop(self, layer):
+        self.layers.remove(layer)
+        self.dropped.append(layer)
+
+    def get_frame_layers(self):
+        return [layer for layer in self.layers if layer.kind == LAYER_FRAME]
+
+    def get_block_layers(self, frame_index):
+        return [layer for layer in self.layers if layer.kind == LAYER_BLOCK and layer.frame_index == frame_index]
+
+    def is_frame_dropped(self, frame_index):
+        return any(layer.kind == LAYER_FRAME and layer.frame_index == frame_index for layer in self.dropped)
+
+    def get_static_spans(self, frame_index):
+        """ Static spans of the frame as (start, end) tuples relative to the start of the scenario. """
+        return [(span.start, span.end) for span in self.spans if span.static and span.frame_index == frame_index]
+
+    def get_static_duration(self):
+        return sum(span.duration for span in self.spans if span.static)
+
+    def apply(self, scenario):
+        """ Remove the dropped blocks from the frames of the scenario. """
+        dropped = [layer.source for layer in self.dropped if layer.kind == LAYER_BLOCK]
+
+        for frame in scenario.frames:
+            frame.blocks = [block for block in frame.blocks if not any(block is source for source in dropped)]
+
+
+class Planner:
+    """ Run the passes optimizing the timeline into the render plan, each pass is a function modifying the plan. """
+
+    def __init__(self, passes=None):
+        self.passes = passes if passes is not None else list(DEFAULT_PASSES)
+
+    def plan(self, timeline):
+        plan = RenderPlan(timeline)
+
+        for render_pass in self.passes:
+            render_pass(plan)
+
+        return plan
+
+
+def get_definitions(definition, key, modules):
+    """ Find the definitions of the modules created from the given key of the definition (None if they are unknown). """
+    definitions = definition.get(key, []) if isinstance(definition, dict) else []
+
+    if len(definitions) != len(modules):
+        return [None] * len(modules)
+
+    return definitions
+
+
+def get_effects(effects, start, end, definitions):
+    timeline_effects = []
+
+    for effect, definition in zip(effects, definitions):
+        effect_start = min(start + effect.time.start, end)
+        # Effects without the duration last until the end of their layer
+        effect_end = min(effect_start + effect.time.duration, end) if effect.time.duration > 0 else end
+
+        timeline_effects.append(TimelineEffect(effect.type, effect_start, effect_end, effect.animated, effect.audible,
+                                               definition['type'] if isinstance(definition, dict) else None))
+
+    return timeline_effects
+
+
+def is_off_screen(position, size):
+    """ Check whether the layer starts beyond the right or the bottom edge, named positions are always on the screen. """
+    if not isinstance(position, (list, tuple)) or len(position) != 2:
+        return False
+
+    return any(isinstance(value, (int, float)) and value >= limit for value, limit in zip(position, size))
+
+
+def drop_invisible_layers(plan):
+    """ Drop the silent layers which are never seen, the zero-duration ones and the ones placed out of the screen.
+
+    Only the static blocks are dropped for their position, the animated ones (e.g. sliding in) may move into the view.
+    """
+    for layer in list(plan.layers):
+        if layer not in plan.layers or layer.is_audible():
+            continue
+
+        if layer.duration <= 0 or (layer.kind == LAYER_BLOCK and not layer.is_animated() and
+                                   is_off_screen(layer.position, plan.timeline.size)):
+            plan.drop(layer)
+
+            if layer.kind == LAYER_FRAME:
+                for block_layer in plan.get_block_layers(layer.frame_index):
+                    plan.drop(block_layer)
+
+
+def merge_identical_frames(plan):
+    """ Reuse the clip of the frame for the identical (same definition) frames right after it.
+
+    Frames playing any audio are never merged, the audio is added to the scenario while the frame is rendered.
+    """
+    previous = None
+
+    for layer in plan.get_frame_layers():
+        if previous is not None and layer.definition is not None and \
+                get_signature(layer) == get_signature(previous) and not is_frame_audible(plan, layer):
+            plan.merged[layer.frame_index] = plan.merged.get(previous.frame_index, previous.frame_index)
+
+        previous = layer
+
+
+def group_static_spans(plan):
+    """ Split every frame at the change points of its layers and mark the parts in which nothing animates. """
+    for frame_layer in plan.get_frame_layers():
+        layers = [frame_layer] + plan.get_block_layers(frame_layer.frame_index)
+        points = set()
+        animated_spans = []
+
+        for layer in layers:
+            points.update(point for point in layer.get_change_points()
+                          if frame_layer.start <= point <= frame_layer.end)
+            animated_spans.extend(layer.get_animated_spans())
+
+        points = sorted(points)
+
+        for start, end in zip(points, points[1:]):
+            static = not any(span_start < end and span_end > start for span_start, span_end in animated_spans)
+
+            plan.spans.append(TimelineSpan(start, end, static, frame_layer.frame_index))
+
+
+def get_signature(layer):
+    return json.dumps(layer.definition, sort_keys=True, default=str)
+
+
+def is_frame_audible(plan, frame_layer):
+    return frame_layer.is_audible() or any(layer.is_audible() for layer in plan.get_block_layers(frame_layer.frame_index))
+
+
+DEFAULT_PASSES = [drop_invisible_layers, merge_identical_frames, group_static_spans]
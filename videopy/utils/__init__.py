@@ -1,9 +1,8 @@
-from moviepy.editor import ImageClip
-from PIL import Image, ImageDraw
-import numpy as np
-
-
 def rounded_background(width, height, color, radius):
+    import numpy as np
+    from moviepy.editor import ImageClip
+    from PIL import Image, ImageDraw
+
     # Create an image with rounded corners
     image = Image.new("RGBA", (width, height), (0, 0, 0, 0))
     draw = ImageDraw.Draw(image)
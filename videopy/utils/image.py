@@ -0,0 +1,186 @@
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+from PIL import Image
+
+RESIZE_STRETCH = "stretch"
+RESIZE_CENTER_CROP = "center_crop"
+
+# Memory used by the decoded images kept in the cache, least recently used images are evicted first
+IMAGE_CACHE_BYTES = 256 * 1024 * 1024
+
+
+class DecodedImage:
+    """ Decoded (and resized) image shared by all frames, blocks and effects displaying the same file.
+
+    Arrays are read-only, as the same instance is returned for every request of the same image.
+    """
+
+    def __init__(self, rgb, mask=None):
+        self.rgb = rgb
+        self.mask = mask
+        self.size = (rgb.shape[1], rgb.shape[0])
+        self.nbytes = rgb.nbytes + (mask.nbytes if mask is not None else 0)
+
+    def to_clip(self, duration=None):
+        from moviepy.editor import ImageClip
+
+        clip = ImageClip(self.rgb, duration=duration)
+
+        if self.mask is not None:
+            clip = clip.set_mask(ImageClip(self.mask, ismask=True, duration=duration))
+
+        return clip
+
+
+class ImageCache:
+    """ LRU cache of the decoded images limited by the memory used by the arrays. """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.images = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            image = self.images.get(key)
+
+            if image is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.images.move_to_end(key)
+
+            return image
+
+    def put(self, key, image):
+        with self.lock:
+            if image.nbytes > self.max_bytes:
+                # Caching it would evict everything else
+                return image
+
+            if key in self.images:
+                self.bytes -= self.images.pop(key).nbytes
+
+            self.images[key] = image
+            self.bytes += image.nbytes
+
+            while self.bytes > self.max_bytes:
+                _, evicted = self.images.popitem(last=False)
+                self.bytes -= evicted.nbytes
+
+            return image
+
+    def clear(self):
+        with self.lock:
+            self.images.clear()
+            self.bytes = 0
+
+
+image_cache = ImageCache(IMAGE_CACHE_BYTES)
+
+
+def load_image(path, size=None, mode=RESIZE_STRETCH):
+    """ Decode the image file (resized to the given size), results are cached, so each image is decoded only once.
+
+    :param path: Path to the image file.
+    :param size: Target (width, height) or None to keep the original size.
+    :param mode: How to resize the image, stretch (to exactly the size) or center_crop (keep the aspect ratio, fill the
+                 size and crop what does not fit).
+    :return: DecodedImage with the RGB array and the mask if the image has transparency.
+    """
+    size = (int(size[0]), int(size[1])) if size is not None else None
+    key = (os.path.abspath(path), os.stat(path).st_mtime_ns, size, mode)
+    image = image_cache.get(key)
+
+    if image is not None:
+        return image
+
+    if size is None:
+        return image_cache.put(key, decode_image(path))
+
+    # Resized images are made from the cached original, so the file is decoded only once for all the sizes
+    original = load_image(path)
+
+    if original.size == size:
+        return original
+
+    return image_cache.put(key, resize_image(original, size, mode))
+
+
+def decode_image(path):
+    with Image.open(path) as image:
+        has_alpha = "A" in image.getbands() or "transparency" in image.info
+
+        return to_decoded_image(image.convert("RGBA" if has_alpha else "RGB"))
+
+
+def to_decoded_image(image):
+    array = np.asarray(image)
+    rgb = np.ascontiguousarray(array[:, :, :3])
+    rgb.flags.writeable = False
+    mask = None
+
+    if image.mode == "RGBA":
+        # Same as moviepy does for the images with transparency
+        mask = array[:, :, 3] / 255.0
+        mask.flags.writeable = False
+
+    return DecodedImage(rgb, mask)
+
+
+def resize_image(decoded, size, mode=RESIZE_STRETCH):
+    rgb = resize_array(decoded.rgb, size, mode)
+    rgb.flags.writeable = False
+    mask = None
+
+    if decoded.mask is not None:
+        mask = resize_array(decoded.mask, size, mode)
+        mask.flags.writeable = False
+
+    return DecodedImage(rgb, mask)
+
+
+def resize_array(array, size, mode=RESIZE_STRETCH):
+    """ Resize the RGB(A) image or the mask array with Pillow.
+
+    :param array: Image array (height x width x channels) or mask array (height x width, values from 0 to 1).
+    :param size: Target (width, height).
+    :param mode: stretch or center_crop, see load_image.
+    :return: The resized array of the same type.
+    """
+    height, width = array.shape[:2]
+    size = (int(size[0]), int(size[1]))
+
+    if (width, height) == size:
+        return array
+
+    is_mask = array.ndim == 2 and array.dtype != np.uint8
+    image = Image.fromarray(array.astype(np.float32) if is_mask else array.astype(np.uint8, copy=False))
+
+    if mode == RESIZE_STRETCH:
+        image = image.resize(size, Image.LANCZOS)
+    elif mode == RESIZE_CENTER_CROP:
+        scale = max(size[0] / width, size[1] / height)
+        scaled_size = (max(round(width * scale), size[0]), max(round(height * scale), size[1]))
+        left = (scaled_size[0] - size[0]) // 2
+        top = (scaled_size[1] - size[1]) // 2
+
+        # Only the part which is left after the crop is resampled
+        image = image.resize(size, Image.LANCZOS, box=(left / scale, top / scale, (left + size[0]) / scale,
+                                                       (top + size[1]) / scale))
+    else:
+        raise ValueError(f"Unknown resize mode [{mode}]")
+
+    resized = np.asarray(image)
+
+    if is_mask:
+        # Lanczos overshoots around the sharp edges
+        return np.clip(resized, 0, 1).astype(np.float64)
+
+    return np.array(resized)
@@ -0,0 +1,209 @@
+import functools
+import math
+import os
+import sys
+
+import numpy as np
+from PIL import Image, ImageColor, ImageDraw, ImageFont
+
+from videopy.utils.logger import Logger
+
+# Same default as Pillow uses for the multiline text
+LINE_SPACING = 4
+
+FONT_EXTENSIONS = (".ttf", ".otf", ".ttc")
+
+
+class RenderedText:
+    """ Rasterized text shared by all blocks and effects displaying the same text.
+
+    Arrays are read-only, as the same instance is returned for every request of the same text.
+    """
+
+    def __init__(self, rgba, font, content, lines, line_height):
+        self.rgba = rgba
+        self.font = font
+        self.content = content
+        self.size = (rgba.shape[1], rgba.shape[0])
+
+        self.rgb = rgba[:, :, :3]
+        self.mask = rgba[:, :, 3] / 255.0
+        self.mask.flags.writeable = False
+
+        # Position (x, y) of every line, used to find where each character was drawn
+        self.lines = lines
+        self.line_height = line_height
+        self.__offsets = None
+
+    def to_clip(self):
+        from moviepy.editor import ImageClip
+
+        return ImageClip(self.rgb).set_mask(ImageClip(self.mask, ismask=True))
+
+    def get_character_offsets(self):
+        """ Find where the text ends after each character.
+
+        :return: List of (line index, x position) tuples, the item at index n describes the text with the first n
+                 characters revealed.
+        """
+        if self.__offsets is None:
+            offsets = [(0, self.lines[0][0])]
+
+            for index, line in enumerate(self.content.split("\n")):
+                x = self.lines[index][0]
+
+                if index > 0:
+                    # The new line character reveals the beginning of the next line
+                    offsets.append((index, x))
+
+                for length in range(1, len(line) + 1):
+                    offsets.append((index, x + get_text_length(self.font, line[:length])))
+
+            self.__offsets = offsets
+
+        return self.__offsets
+
+    def get_reveal_mask(self, count):
+        """ Return the mask of the text with only the first characters visible.
+
+        :param count: Number of the visible characters.
+        """
+        if count >= len(self.content):
+            return self.mask
+
+        line, x = self.get_character_offsets()[max(count, 0)]
+        mask = np.zeros_like(self.mask)
+
+        for index in range(line + 1):
+            top = round(self.lines[index][1])
+            right = round(x) if index == line else mask.shape[1]
+
+            mask[top:top + self.line_height, :right] = self.mask[top:top + self.line_height, :right]
+
+        return mask
+
+
+def render_text(content, font, size, color="black"):
+    """ Rasterize the text with Pillow, results are cached, so the same text is rendered only once.
+
+    :param content: The text to render, lines are separated with new line characters.
+    :param font: Font name (as listed by ImageMagick or the name of the font file) or path to the font file.
+    :param size: Font size in pixels.
+    :param color: Color name, hex string or RGB(A) list.
+    :return: RenderedText with the RGBA array and the size of the text.
+    """
+    if isinstance(color, list):
+        color = tuple(color)
+
+    return _render_text(str(content), font, int(size), color)
+
+
+@functools.lru_cache(maxsize=256)
+def _render_text(content, font, size, color):
+    image_font = load_font(font, size)
+    fill = ImageColor.getrgb(color) if isinstance(color, str) else color
+
+    if len(fill) == 3:
+        fill = fill + (255,)
+
+    # Height of the lines is based on the font metrics (not on the glyphs), so texts with the same number of lines
+    # have the same height and the baseline does not jump between them
+    ascent, descent = get_font_metrics(image_font)
+    line_height = ascent + descent
+    lines = content.split("\n")
+    widths = [get_text_length(image_font, line) for line in lines]
+    width = max(math.ceil(max(widths)), 1)
+    height = max(len(lines) * line_height + (len(lines) - 1) * LINE_SPACING, 1)
+
+    # Lines are centered, the same way ImageMagick aligns them
+    positions = [((width - line_width) / 2, index * (line_height + LINE_SPACING))
+                 for index, line_width in enumerate(widths)]
+
+    image = Image.new("RGBA", (width, height), fill[:3] + (0,))
+    draw = ImageDraw.Draw(image)
+
+    for line, position in zip(lines, positions):
+        draw.text(position, line, font=image_font, fill=fill)
+
+    rgba = np.array(image)
+    rgba.flags.writeable = False
+
+    return RenderedText(rgba, image_font, content, positions, line_height)
+
+
+def get_text_length(image_font, text):
+    try:
+        return image_font.getlength(text)
+    except AttributeError:
+        # Pillow < 9.2 does not provide the advance length for bitmap fonts
+        return image_font.getsize(text)[0]
+
+
+def get_font_metrics(image_font):
+    try:
+        return image_font.getmetrics()
+    except AttributeError:
+        # Bitmap fonts do not provide metrics
+        if hasattr(image_font, "getbbox"):
+            return image_font.getbbox("Ag")[3], 0
+
+        return image_font.getsize("Ag")[1], 0
+
+
+@functools.lru_cache(maxsize=None)
+def load_font(font, size):
+    path = find_font(font)
+
+    if path is not None:
+        return ImageFont.truetype(path, size)
+
+    try:
+        return ImageFont.truetype(font, size)
+    except OSError:
+        Logger.warn(f"Font <<{font}>> not found, using the default font")
+
+    try:
+        return ImageFont.load_default(size)
+    except TypeError:
+        # Pillow < 10.1 provides only a fixed size bitmap font
+        return ImageFont.load_default()
+
+
+def find_font(font):
+    if os.path.isfile(font):
+        return font
+
+    return get_font_files().get(normalize_font_name(font))
+
+
+@functools.lru_cache(maxsize=None)
+def get_font_files():
+    fonts = {}
+
+    for directory in get_font_directories():
+        for root, _, files in os.walk(directory):
+            for file in sorted(files):
+                name, extension = os.path.splitext(file)
+
+                if extension.lower() in FONT_EXTENSIONS:
+                    fonts.setdefault(normalize_font_name(name), os.path.join(root, file))
+
+    return fonts
+
+
+def get_font_directories():
+    home = os.path.expanduser("~")
+    directories = ["fonts", os.path.join(home, ".fonts"), os.path.join(home, ".local", "share", "fonts")]
+
+    if sys.platform == "win32":
+        directories.append(os.path.join(os.environ.get("WINDIR", "C:\\Windows"), "Fonts"))
+    elif sys.platform == "darwin":
+        directories += [os.path.join(home, "Library", "Fonts"), "/Library/Fonts", "/System/Library/Fonts"]
+    else:
+        directories += ["/usr/local/share/fonts", "/usr/share/fonts"]
+
+    return [directory for directory in directories if os.path.isdir(directory)]
+
+
+def normalize_font_name(font):
+    return "".join(character for character in font.lower() if character.isalnum())
@@ -1,6 +1,3 @@
-from moviepy.editor import TextClip
-
-
 def transform_position(position, frame, block, margin=0):
     frame_width, frame_height = frame
     block_width, block_height = block
@@ -24,4 +21,6 @@ def transform_position(position, frame, block, margin=0):
 
 
 def load_fonts():
+    from moviepy.editor import TextClip
+
     return TextClip("fonts").list('font')
@@ -0,0 +1,276 @@
+import multiprocessing
+import os
+import subprocess
+import threading
+
+import numpy as np
+from moviepy.config import get_setting
+from moviepy.tools import extensions_dict, find_extension
+
+from videopy.utils.file import get_file_extension
+from videopy.utils.logger import Logger
+
+AUDIO_FPS = 44100
+
+
+class FrameBuffer:
+    """ Ring buffer passing the frames from the producers to the writer in the playback order.
+
+    Producers block when the frame they want to store is more than `size` frames ahead of the writer, so no more than
+    `size` frames are kept in memory at once.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.slots = [None] * size
+        self.next_index = 0
+        self.error = None
+        self.condition = threading.Condition()
+
+    def put(self, index, frame):
+        with self.condition:
+            self.condition.wait_for(lambda: self.error is not None or index < self.next_index + self.size)
+
+            if self.error is not None:
+                return False
+
+            self.slots[index % self.size] = (index, frame)
+            self.condition.notify_all()
+
+            return True
+
+    def get(self, index):
+        slot = index % self.size
+
+        with self.condition:
+            self.condition.wait_for(lambda: self.error is not None or self.slots[slot] is not None)
+
+            if self.error is not None:
+                raise self.error
+
+            _, frame = self.slots[slot]
+            self.slots[slot] = None
+            self.next_index = index + 1
+            self.condition.notify_all()
+
+            return frame
+
+    def fail(self, error):
+        with self.condition:
+            if self.error is None:
+                self.error = error
+
+            self.condition.notify_all()
+
+
+class StreamingWriter:
+    """ Write the clip by streaming raw frames into the ffmpeg process.
+
+    Frames are produced into a bounded FrameBuffer while the writer thread pipes them into ffmpeg, so producing the
+    frames overlaps with encoding them and the memory used does not grow with the length of the video.
+
+    A single producer is a thread reading the clip. More `producers` are forked processes, each one reading every n-th
+    frame from its own copy of the clip, so the media readers and the state of the effects (e.g. the typewrite mask)
+    are never shared. Their frames are handed to the buffer in the playback order. Without the fork start method (or
+    in a daemonic process, e.g. a segment worker) the frames are produced by a single thread.
+    """
+
+    def __init__(self, clip, output_path, fps, producers=1, buffer_size=32, audio_codec=None, audio_fps=AUDIO_FPS,
+                 preset="medium"):
+        self.clip = clip
+        self.output_path = output_path
+        self.fps = fps
+        self.producers = producers
+        self.buffer_size = buffer_size
+        self.audio_fps = audio_fps
+        self.preset = preset
+
+        extension = get_file_extension(output_path)
+
+        if extension not in extensions_dict or "codec" not in extensions_dict[extension]:
+            raise ValueError(f"Video codec for extension [{extension}] not found")
+
+        self.codec = extensions_dict[extension]["codec"][0]
+        self.audio_codec = audio_codec or get_audio_codec(extension)
+
+        if self.producers > 1 and not can_fork_producers():
+            Logger.warn(f"Streaming with <<{self.producers}>> producers is not supported here, using a single producer")
+            self.producers = 1
+
+    def write(self):
+        audio_path = None
+
+        if self.clip.audio is not None:
+            audio_path = f"{self.output_path}.audio.{find_extension(self.audio_codec)}"
+            self.clip.audio.write_audiofile(audio_path, fps=self.audio_fps, codec=self.audio_codec, logger=None)
+
+        Logger.debug(f"Streaming <<{self.output_path}>> using <<{self.producers}>> producers")
+
+        try:
+            self.__stream(audio_path)
+        finally:
+            if audio_path is not None and os.path.exists(audio_path):
+                os.remove(audio_path)
+
+    def get_command(self, audio_path=None):
+        width, height = self.clip.size
+        command = [get_setting("FFMPEG_BINARY"), "-y", "-loglevel", "error",
+                   "-f", "rawvideo", "-vcodec", "rawvideo", "-s", f"{width}x{height}", "-pix_fmt", "rgb24",
+                   "-r", f"{self.fps:.02f}", "-an", "-i", "-"]
+
+        if audio_path is not None:
+            command += ["-i", audio_path, "-acodec", "copy"]
+
+        command += ["-vcodec", self.codec, "-preset", self.preset]
+
+        # Same as moviepy, yuv420p is the most compatible format but requires even dimensions
+        if self.codec == "libx264" and width % 2 == 0 and height % 2 == 0:
+            command += ["-pix_fmt", "yuv420p"]
+
+        return command + [self.output_path]
+
+    def __stream(self, audio_path):
+        times = np.arange(0, self.clip.duration, 1.0 / self.fps)
+        frames = FrameBuffer(self.buffer_size)
+        producers = []
+
+        if self.producers == 1:
+            threads = [threading.Thread(target=self.__produce, args=(frames, times), daemon=True)]
+        else:
+            threads = []
+            context = multiprocessing.get_context("fork")
+
+            # Producers are forked before ffmpeg is started, so they never hold its input open
+            for offset in range(self.producers):
+                connection, child_connection = context.Pipe(duplex=False)
+                producer = context.Process(target=produce_frames, daemon=True,
+                                           args=(self.clip, times, offset, self.producers, child_connection))
+                producer.start()
+                child_connection.close()
+
+                producers.append(producer)
+                threads.append(threading.Thread(target=self.__receive, args=(frames, times, offset, connection),
+                                                daemon=True))
+
+        process = subprocess.Popen(self.get_command(audio_path), stdin=subprocess.PIPE, stdout=subprocess.DEVNULL,
+                                   stderr=subprocess.PIPE)
+
+        for thread in threads:
+            thread.start()
+
+        try:
+            last_frame, data = None, None
+
+            for index in range(len(times)):
+                frame = frames.get(index)
+
+                # Static spans produce the same buffer for many frames, it is converted only once
+                if frame is not last_frame:
+                    last_frame, data = frame, frame if isinstance(frame, bytes) else frame.tobytes()
+
+                try:
+                    process.stdin.write(data)
+                except OSError:
+                    # ffmpeg exited, the reason is reported below
+                    break
+
+            try:
+                process.stdin.close()
+            except OSError:
+                pass
+        except BaseException as e:
+            frames.fail(e)
+            process.kill()
+            process.wait()
+
+            raise
+        finally:
+            frames.fail(EOFError("Writer finished"))
+
+            # Producers left behind by a failure are stopped, so the threads waiting for their frames finish
+            for producer in producers:
+                if producer.is_alive():
+                    producer.terminate()
+
+                producer.join()
+
+            for thread in threads:
+                thread.join()
+
+        if process.wait() != 0:
+            raise IOError(f"Could not write the video [{self.output_path}]: "
+                          f"{process.stderr.read().decode(errors='replace')}")
+
+        process.stderr.close()
+
+    def __produce(self, frames, times):
+        try:
+            for index in range(len(times)):
+                if not frames.put(index, get_frame(self.clip, times[index])):
+                    return
+        except BaseException as e:
+            frames.fail(e)
+
+    def __receive(self, frames, times, offset, connection):
+        try:
+            data = None
+
+            for index in range(offset, len(times), self.producers):
+                message = connection.recv()
+
+                if isinstance(message, BaseException):
+                    raise message
+
+                # Nothing is sent for the frame which is the same as the previous one of the producer
+                if message is not None:
+                    data = message
+
+                if not frames.put(index, data):
+                    return
+        except EOFError:
+            frames.fail(IOError(f"Frame producer {offset} exited before producing all the frames"))
+        except BaseException as e:
+            frames.fail(e)
+        finally:
+            connection.close()
+
+
+def get_frame(clip, t):
+    frame = clip.get_frame(t)
+
+    return frame.astype(np.uint8) if frame.dtype != np.uint8 else frame
+
+
+def produce_frames(clip, times, offset, step, connection):
+    """ Send every `step`-th frame of the clip, starting with the `offset` one, to the writer (runs in a forked
+    producer process).
+    """
+    try:
+        last_frame = None
+
+        for index in range(offset, len(times), step):
+            frame = get_frame(clip, times[index])
+
+            if frame is last_frame:
+                connection.send(None)
+            else:
+                last_frame = frame
+                connection.send(frame.tobytes())
+    except Exception as e:
+        try:
+            connection.send(e)
+        except Exception:
+            # The error can not be pickled
+            connection.send(RuntimeError(f"{type(e).__name__}: {e}"))
+    finally:
+        connection.close()
+
+
+def can_fork_producers():
+    # Daemonic processes (e.g. the workers of the segment pool) are not allowed to start any children
+    return "fork" in multiprocessing.get_all_start_methods() and not multiprocessing.current_process().daemon
+
+
+def get_audio_codec(extension):
+    # Same defaults as moviepy uses when writing the video
+    return "libvorbis" if extension in ["ogv", "webm"] else "libmp3lame"